@@ -7,12 +7,14 @@ updating the INDEX.md file, and extracting learnings to LEARNINGS.md.
 """
 
 import re
-import shutil
 from datetime import datetime
 from pathlib import Path
 
-from chkcc.tree import Checkpoint, get_children, scan_checkpoints
-from chkcc.validate import extract_frontmatter
+from chkcc import atomic, cache, lock, pointer, prime
+from chkcc.document import Document, Section
+from chkcc.index_md import IndexFile
+from chkcc.lineage import Lineage
+from chkcc.tree import Checkpoint, scan_checkpoints
 
 
 def get_active_children(checkpoint_id: str, base_dir: Path) -> list[Checkpoint]:
@@ -26,136 +28,29 @@ def get_active_children(checkpoint_id: str, base_dir: Path) -> list[Checkpoint]:
         List of Checkpoint objects that are children and in active/ directory
     """
     # Scan only active checkpoints for better performance
-    checkpoints = scan_checkpoints(base_dir, status_filter="active")
-
-    # Get children using helper from tree.py
     # All returned checkpoints are already non-archived
-    return get_children(checkpoint_id, checkpoints)
-
-
-def has_completion_section(content: str) -> bool:
-    """Check if checkpoint content has a ## Completion section."""
-    for line in content.split("\n"):
-        if line.startswith("## Completion"):
-            return True
-    return False
-
-
-def remove_table_row(content: str, checkpoint_name: str) -> str:
-    """Remove a checkpoint row from the INDEX.md table.
-
-    Args:
-        content: The INDEX.md content
-        checkpoint_name: Name of checkpoint to remove (e.g., 'chk-foo')
-
-    Returns:
-        Updated content with the row removed
-    """
-    lines = content.split("\n")
-    result_lines = []
-
-    for line in lines:
-        # Check if this line is the table row for our checkpoint
-        if line.strip().startswith(f"| {checkpoint_name} |"):
-            continue  # Skip this row
-        result_lines.append(line)
-
-    return "\n".join(result_lines)
-
-
-def remove_summary_section(content: str, checkpoint_name: str) -> str:
-    """Remove a checkpoint summary section (## chk-xxx) from INDEX.md.
-
-    Args:
-        content: The INDEX.md content
-        checkpoint_name: Name of checkpoint to remove (e.g., 'chk-foo')
-
-    Returns:
-        Updated content with the section removed
-    """
-    lines = content.split("\n")
-    result_lines = []
-    in_target_section = False
-
-    for line in lines:
-        # Check if we're entering the target section
-        if line.startswith("## ") and line[3:].strip() == checkpoint_name:
-            in_target_section = True
-            continue
-
-        # Check if we're leaving the section (hit another ## header or end)
-        if in_target_section:
-            if line.startswith("## ") or line.startswith("# "):
-                in_target_section = False
-                result_lines.append(line)
-                continue
-            # Skip lines while in target section
-            continue
-
-        result_lines.append(line)
+    return Lineage(scan_checkpoints(base_dir, status_filter="active")).children_of(checkpoint_id)
 
-    return "\n".join(result_lines)
 
+def find_completion_section(document: Document) -> Section | None:
+    """Return the ## Completion section of a checkpoint, if any."""
+    for section in document.sections:
+        if section.title.startswith("Completion"):
+            return section
+    return None
 
-def count_table_rows(content: str) -> int:
-    """Count the number of data rows in the INDEX.md table.
-
-    Args:
-        content: The INDEX.md content
-
-    Returns:
-        Number of checkpoint rows (excluding header and separator)
-    """
-    count = 0
-    in_table = False
-
-    for line in content.split("\n"):
-        stripped = line.strip()
-        # Detect table start
-        if "| Checkpoint | Description | Last Updated |" in stripped:
-            in_table = True
-            continue
-        # Skip separator row
-        if in_table and stripped.startswith("|") and "---" in stripped:
-            continue
-        # Count data rows
-        if in_table and stripped.startswith("|") and stripped.endswith("|"):
-            count += 1
-        # End of table
-        elif in_table and stripped and not stripped.startswith("|"):
-            break
-
-    return count
-
-
-def add_empty_state_message(content: str) -> str:
-    """Add the empty state message after the table if no checkpoints remain.
-
-    Args:
-        content: The INDEX.md content
-
-    Returns:
-        Updated content with empty state message
-    """
-    lines = content.split("\n")
-    result_lines = []
-    table_separator_found = False
-
-    for i, line in enumerate(lines):
-        result_lines.append(line)
-        # Look for the table separator line (|---|---|---|)
-        if line.strip().startswith("|") and "---" in line.strip():
-            table_separator_found = True
-            # Add empty state message after the separator
-            result_lines.append("")
-            result_lines.append("*No active checkpoints.*")
 
-    return "\n".join(result_lines)
+def has_completion_section(document: Document) -> bool:
+    """Check if checkpoint document has a ## Completion section."""
+    return find_completion_section(document) is not None
 
 
 def update_index(index_path: Path, checkpoint_name: str) -> None:
     """Update INDEX.md to remove a checkpoint entry.
 
+    Removes the table row and summary section, and adds the empty state
+    message if no checkpoints remain.
+
     Args:
         index_path: Path to INDEX.md file
         checkpoint_name: Name of checkpoint to remove
@@ -163,53 +58,29 @@ def update_index(index_path: Path, checkpoint_name: str) -> None:
     Raises:
         FileNotFoundError: If INDEX.md doesn't exist
     """
-    if not index_path.exists():
-        raise FileNotFoundError(f"INDEX.md not found: {index_path}")
-
-    content = index_path.read_text()
-
-    # Remove the table row
-    content = remove_table_row(content, checkpoint_name)
-
-    # Remove the summary section
-    content = remove_summary_section(content, checkpoint_name)
+    with lock.locked(lock.lock_dir_for(index_path.parent)):
+        index = IndexFile.load(index_path)
+        if index.remove(checkpoint_name):
+            index.save(index_path)
 
-    # Check if table is now empty and add empty state message
-    if count_table_rows(content) == 0:
-        # Check if empty message already exists
-        if "*No active checkpoints.*" not in content:
-            content = add_empty_state_message(content)
 
-    # Clean up extra blank lines
-    content = re.sub(r"\n{3,}", "\n\n", content)
-
-    # Ensure file ends with single newline
-    content = content.rstrip() + "\n"
-
-    index_path.write_text(content)
-
-
-def extract_learnings(content: str) -> str | None:
+def extract_learnings(document: Document) -> str | None:
     """Extract learnings from the Completion section.
 
     Looks for the **Learnings**: field in ## Completion section.
 
     Args:
-        content: The checkpoint content
+        document: The parsed checkpoint body
 
     Returns:
         The learnings text, or None if not found or "None noted"
     """
-    lines = content.split("\n")
-    in_completion = False
-
-    for line in lines:
-        if line.startswith("## Completion"):
-            in_completion = True
-            continue
-        if in_completion and line.startswith("## "):
-            break  # Hit next section
-        if in_completion and "**Learnings**:" in line:
+    section = find_completion_section(document)
+    if section is None:
+        return None
+
+    for line in document.content_lines(section):
+        if "**Learnings**:" in line:
             # Extract text after **Learnings**:
             match = re.search(r"\*\*Learnings\*\*:\s*(.+)", line)
             if match:
@@ -231,19 +102,252 @@ def append_to_learnings(
         checkpoint_id: The checkpoint ID (e.g., 'chk-auth-system')
         learnings: The learnings text to append
     """
+    append_learnings_entries(checkpoints_dir, [(checkpoint_id, learnings)])
+
+
+def append_learnings_entries(
+    checkpoints_dir: Path, entries: list[tuple[str, str]]
+) -> None:
+    """Append several learnings entries to LEARNINGS.md in one write.
+
+    Args:
+        checkpoints_dir: Base checkpoints directory
+        entries: (checkpoint_id, learnings) pairs, in the order to append
+    """
+    if not entries:
+        return
+
     learnings_path = checkpoints_dir / "LEARNINGS.md"
     today = datetime.now().strftime("%Y-%m-%d")
 
-    # Format the entry
-    entry = f"\n## {today} — {checkpoint_id}\n- {learnings}\n"
+    # Format the entries
+    text = "".join(
+        f"\n## {today} — {checkpoint_id}\n- {learnings}\n"
+        for checkpoint_id, learnings in entries
+    )
+
+    with lock.locked(checkpoints_dir):
+        # Create file with header if it doesn't exist
+        if not learnings_path.exists():
+            text = "# Learnings\n" + text
+
+        # Append by rewriting atomically, so a crash never leaves half an entry
+        atomic.append_atomic(learnings_path, text)
+
 
-    # Create file with header if it doesn't exist
-    if not learnings_path.exists():
-        learnings_path.write_text("# Learnings\n" + entry)
-    else:
-        # Append to existing file
-        with learnings_path.open("a") as f:
-            f.write(entry)
+def select_completed(base_dir: Path) -> list[Path]:
+    """Select active checkpoints that have a ## Completion section.
+
+    Args:
+        base_dir: Base checkpoints directory (parent of active/ and archive/)
+
+    Returns:
+        Paths of the completed active checkpoints
+    """
+    return [
+        cp.path for cp in scan_checkpoints(base_dir, status_filter="active")
+        if has_completion_section(cache.read_parsed(cp.path).document)
+    ]
+
+
+def select_subtree(base_dir: Path, root_id: str) -> list[Path]:
+    """Select an active checkpoint and all of its active descendants.
+
+    Args:
+        base_dir: Base checkpoints directory (parent of active/ and archive/)
+        root_id: Checkpoint ID at the top of the subtree
+
+    Returns:
+        Paths of the checkpoints in the subtree, root first
+
+    Raises:
+        ValueError: If no active checkpoint has root_id
+    """
+    lineage = Lineage(scan_checkpoints(base_dir, status_filter="active"))
+    if root_id not in lineage:
+        raise ValueError(f"No active checkpoint with id '{root_id}'")
+
+    subtree = [lineage.get(root_id)] + lineage.descendants(root_id)
+    return [cp.path for cp in subtree]
+
+
+def leaves_first(ids: list[str], parents: dict[str, str | None]) -> list[str]:
+    """Order checkpoint ids so every checkpoint comes before its parent.
+
+    Args:
+        ids: Checkpoint ids to order
+        parents: Parent id of each checkpoint in ids
+
+    Returns:
+        ids sorted by decreasing depth within the set, otherwise stable
+    """
+    depths: dict[str, int] = {}
+    for start in ids:
+        # Walk up to the first ancestor with a known depth (or outside the set)
+        chain = []
+        on_chain = set()
+        node = start
+        while node in parents and node not in depths and node not in on_chain:
+            chain.append(node)
+            on_chain.add(node)
+            node = parents[node]
+        depth = depths.get(node, -1)
+        for node in reversed(chain):
+            depth += 1
+            depths[node] = depth
+    return sorted(ids, key=lambda node: -depths[node])
+
+
+def archive_batch(checkpoint_paths: list[Path], force: bool = False) -> list[Path]:
+    """Archive many completed checkpoints at once.
+
+    All checkpoints are validated before anything moves. Files are moved
+    leaves first, then INDEX.md and LEARNINGS.md are each written once.
+    If a move fails, files already moved are moved back.
+
+    Args:
+        checkpoint_paths: Checkpoint files, all in the same active/ directory
+        force: If True, skip validation for active children
+
+    Returns:
+        Paths of the archived checkpoint files, in the order they were moved
+
+    Raises:
+        FileNotFoundError: If a checkpoint file doesn't exist
+        FileExistsError: If archive/ already has a file of the same name
+        ValueError: If a checkpoint lacks ## Completion section
+        ValueError: If a checkpoint is not in an active/ directory, or the
+            checkpoints are in different active/ directories
+        ValueError: If a checkpoint has active children outside the batch
+            (unless force=True)
+    """
+    # Deduplicate, keeping the given order
+    paths = list(dict.fromkeys(checkpoint_paths))
+    if not paths:
+        return []
+
+    # Hold the lock from validation to the last write, so no other session
+    # changes the checkpoints in between
+    with lock.locked(lock.lock_dir_for(paths[0].parent)):
+        parsed = {}
+        for checkpoint_path in paths:
+            # Validate checkpoint exists
+            if not checkpoint_path.exists():
+                raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
+
+            # Validate checkpoint is in active/ directory
+            if checkpoint_path.parent.name != "active":
+                raise ValueError(
+                    f"Checkpoint must be in an 'active/' directory, "
+                    f"found: {checkpoint_path.parent.name}/"
+                )
+            if checkpoint_path.parent != paths[0].parent:
+                raise ValueError(
+                    f"Batch checkpoints must share one active/ directory: "
+                    f"{checkpoint_path.parent} and {paths[0].parent}"
+                )
+
+            # Read and validate checkpoint has Completion section
+            frontmatter, _, document = cache.read_parsed(checkpoint_path)
+            if not has_completion_section(document):
+                raise ValueError(
+                    f"Checkpoint lacks required '## Completion' section: {checkpoint_path.name}. "
+                    f"Add a Completion section before archiving."
+                )
+
+            # Checkpoint ID is needed for children check and learnings
+            checkpoint_id = frontmatter.get("checkpoint") if frontmatter else None
+            parsed[checkpoint_path] = (checkpoint_id, document)
+
+        # Determine paths (archive/ is sibling to active/)
+        active_dir = paths[0].parent
+        checkpoints_dir = active_dir.parent
+        archive_dir = checkpoints_dir / "archive"
+
+        # One scan serves the children check and the ordering
+        active = scan_checkpoints(checkpoints_dir, status_filter="active")
+        lineage = Lineage(active)
+        batch_ids = {checkpoint_id for checkpoint_id, _ in parsed.values() if checkpoint_id}
+
+        # Check for active children outside the batch (unless force=True)
+        if not force:
+            for checkpoint_id, _ in parsed.values():
+                if not checkpoint_id:
+                    continue
+                active_children = [
+                    cp for cp in lineage.children_of(checkpoint_id) if cp.id not in batch_ids
+                ]
+                if active_children:
+                    child_names = "\n".join(
+                        [f"  - {cp.id} ({cp.display_status})" for cp in active_children]
+                    )
+                    raise ValueError(
+                        f"Cannot archive '{checkpoint_id}': has active children\n"
+                        f"{child_names}\n"
+                        f"Archive children first, or use --force to override."
+                    )
+
+        # Leaves first, so an interrupted batch never archives a parent before its child
+        parents = {cp.id: cp.parent for cp in active if cp.id in batch_ids}
+        rank = {checkpoint_id: n for n, checkpoint_id in enumerate(leaves_first(list(parents), parents))}
+        ordered = sorted(paths, key=lambda path: rank.get(parsed[path][0], -1))
+
+        # Never overwrite an archived checkpoint: refuse the whole batch
+        existing = [
+            archive_dir / path.name for path in ordered if (archive_dir / path.name).exists()
+        ]
+        if existing:
+            names = "\n".join(f"  - {path}" for path in existing)
+            raise FileExistsError(f"Already archived, nothing was moved:\n{names}")
+
+        # Create archive directory if it doesn't exist
+        archive_dir.mkdir(parents=True, exist_ok=True)
+
+        # Move the files
+        import shutil
+
+        moved: list[tuple[Path, Path]] = []
+        try:
+            for checkpoint_path in ordered:
+                archive_path = archive_dir / checkpoint_path.name
+                shutil.move(str(checkpoint_path), str(archive_path))
+                cache.invalidate(checkpoint_path)
+                moved.append((checkpoint_path, archive_path))
+        except OSError:
+            for checkpoint_path, archive_path in reversed(moved):
+                shutil.move(str(archive_path), str(checkpoint_path))
+            raise
+        finally:
+            # Persist the renames in both directories
+            atomic.fsync_dir(active_dir)
+            atomic.fsync_dir(archive_dir)
+
+        # An archived checkpoint can't stay current
+        pointed = pointer.read_pointer(checkpoints_dir)
+        if pointed is not None and Path(pointed) in {path for path, _ in moved}:
+            pointer.clear_pointer(checkpoints_dir)
+            prime.refresh_snapshot(checkpoints_dir)
+
+        # Update INDEX.md once
+        index_path = active_dir / "INDEX.md"
+        if index_path.exists():
+            index = IndexFile.load(index_path)
+            # Checkpoint name is the filename (chk-foo.md -> chk-foo)
+            removed = [index.remove(checkpoint_path.stem) for checkpoint_path in ordered]
+            if any(removed):
+                index.save(index_path)
+
+        # Extract and append learnings to LEARNINGS.md once
+        entries = []
+        for checkpoint_path in ordered:
+            checkpoint_id, document = parsed[checkpoint_path]
+            if checkpoint_id:
+                learnings = extract_learnings(document)
+                if learnings:
+                    entries.append((checkpoint_id, learnings))
+        append_learnings_entries(checkpoints_dir, entries)
+
+        return [archive_path for _, archive_path in moved]
 
 
 def archive_checkpoint(checkpoint_path: Path, force: bool = False) -> Path:
@@ -261,73 +365,9 @@ def archive_checkpoint(checkpoint_path: Path, force: bool = False) -> Path:
 
     Raises:
         FileNotFoundError: If checkpoint file doesn't exist
+        FileExistsError: If archive/ already has a file of the same name
         ValueError: If checkpoint lacks ## Completion section
         ValueError: If checkpoint is not in an active/ directory
         ValueError: If checkpoint has active children (unless force=True)
     """
-    # Validate checkpoint exists
-    if not checkpoint_path.exists():
-        raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
-
-    # Validate checkpoint is in active/ directory
-    if checkpoint_path.parent.name != "active":
-        raise ValueError(
-            f"Checkpoint must be in an 'active/' directory, "
-            f"found: {checkpoint_path.parent.name}/"
-        )
-
-    # Read and validate checkpoint has Completion section
-    content = checkpoint_path.read_text()
-    if not has_completion_section(content):
-        raise ValueError(
-            f"Checkpoint lacks required '## Completion' section. "
-            f"Add a Completion section before archiving."
-        )
-
-    # Extract checkpoint ID from frontmatter (needed for children check and learnings)
-    frontmatter, _ = extract_frontmatter(content)
-    checkpoint_id = frontmatter.get("checkpoint") if frontmatter else None
-
-    # Check for active children (unless force=True)
-    if not force and checkpoint_id:
-        # Determine base_dir from checkpoint_path
-        # checkpoint_path is in active/, base_dir is parent of active/
-        base_dir = checkpoint_path.parent.parent
-
-        active_children = get_active_children(checkpoint_id, base_dir)
-        if active_children:
-            child_names = "\n".join(
-                [f"  - {cp.id} ({cp.display_status})" for cp in active_children]
-            )
-            raise ValueError(
-                f"Cannot archive '{checkpoint_id}': has active children\n"
-                f"{child_names}\n"
-                f"Archive children first, or use --force to override."
-            )
-
-    # Determine archive path (sibling to active/)
-    active_dir = checkpoint_path.parent
-    checkpoints_dir = active_dir.parent
-    archive_dir = checkpoints_dir / "archive"
-    archive_path = archive_dir / checkpoint_path.name
-
-    # Create archive directory if it doesn't exist
-    archive_dir.mkdir(parents=True, exist_ok=True)
-
-    # Move the file
-    shutil.move(str(checkpoint_path), str(archive_path))
-
-    # Update INDEX.md
-    index_path = active_dir / "INDEX.md"
-    if index_path.exists():
-        # Extract checkpoint name from filename (chk-foo.md -> chk-foo)
-        checkpoint_name = checkpoint_path.stem
-        update_index(index_path, checkpoint_name)
-
-    # Extract and append learnings to LEARNINGS.md
-    if checkpoint_id:
-        learnings = extract_learnings(content)
-        if learnings:
-            append_to_learnings(checkpoints_dir, checkpoint_id, learnings)
-
-    return archive_path
+    return archive_batch([checkpoint_path], force=force)[0]
@@ -0,0 +1,99 @@
+"""
+Artifact lookups for coihuin-compress.
+
+`chkcc who-touched <path>` answers "which checkpoints touched this file?"
+from the reverse index kept in `.chkcc-index` (see
+MetadataIndex.artifact_owners): the scan only stats files and re-parses the
+ones that changed, and the lookup itself is a dict access, or a pass over the
+distinct artifact paths for a glob.
+"""
+
+import fnmatch
+import os
+from pathlib import Path
+from typing import Collection
+
+from chkcc.index import MetadataIndex, normalize_artifact
+from chkcc.tree import Checkpoint, format_date, iter_checkpoints, require_directory
+
+GLOB_CHARS = "*?["
+
+
+def match_artifacts(paths: Collection[str], pattern: str) -> list[str]:
+    """Return the artifact paths matching a path, directory or glob.
+
+    Args:
+        paths: Known artifact paths
+        pattern: Exact path, directory ending in '/', or shell-style glob
+            (`*` also matches '/')
+
+    Returns:
+        Matching paths, sorted
+    """
+    if any(char in pattern for char in GLOB_CHARS):
+        return sorted(path for path in paths if fnmatch.fnmatchcase(path, pattern))
+    if pattern.endswith("/"):
+        return sorted(path for path in paths if path.startswith(pattern))
+    return [pattern] if pattern in paths else []
+
+
+def normalize_query(pattern: str, project_root: Path | None = None) -> str:
+    """Turn a command-line path into the form artifact trails use.
+
+    Absolute paths inside project_root become relative to it.
+    """
+    if project_root is not None and os.path.isabs(pattern):
+        try:
+            pattern = Path(pattern).relative_to(project_root).as_posix()
+        except ValueError:
+            pass
+    trailing = "/" if pattern.endswith(("/", "\\")) else ""
+    return normalize_artifact(pattern).rstrip("/") + trailing
+
+
+def who_touched(
+    base_dir: Path, pattern: str, status_filter: str = "all", project_root: Path | None = None
+) -> list[tuple[Checkpoint, list[str]]]:
+    """Find the checkpoints whose artifact tables list matching files.
+
+    Args:
+        base_dir: Checkpoints directory
+        pattern: File path, directory ending in '/', or glob
+        status_filter: 'active', 'archive' or 'all'
+        project_root: Directory absolute paths are made relative to
+
+    Returns:
+        (checkpoint, matching artifact paths) pairs, oldest first
+
+    Raises:
+        FileNotFoundError: If the checkpoints directory doesn't exist
+        NotADirectoryError: If the checkpoints path is not a directory
+    """
+    require_directory(base_dir)
+
+    # The scan refreshes changed entries, which keeps the reverse index current
+    checkpoints = list(iter_checkpoints(base_dir, status_filter))
+    index = MetadataIndex.load(base_dir)
+    owners = index.artifact_owners()
+    by_key = {index.key(checkpoint.path): checkpoint for checkpoint in checkpoints}
+
+    matches: dict[str, list[str]] = {}
+    for path in match_artifacts(owners, normalize_query(pattern, project_root)):
+        for key in owners[path]:
+            if key in by_key:
+                matches.setdefault(key, []).append(path)
+
+    results = [(by_key[key], paths) for key, paths in matches.items()]
+    results.sort(key=lambda item: (item[0].created.timestamp() if item[0].created else 0, item[0].id))
+    return results
+
+
+def print_results(results: list[tuple[Checkpoint, list[str]]], pattern: str) -> None:
+    """Print each checkpoint with the matching artifacts below it."""
+    if not results:
+        print(f"No checkpoints list {pattern}")
+        return
+    for checkpoint, paths in results:
+        print(f"{checkpoint.id} [{checkpoint.display_status}] ({format_date(checkpoint.created)})")
+        for path in paths:
+            print(f"  {path}")
@@ -0,0 +1,192 @@
+"""
+Crash-safe file writes for coihuin-compress.
+
+Every file chkcc modifies is written through `write_atomic`: the new content
+goes to a temporary file in the same directory, is flushed and fsynced, and
+then renamed over the target, after which the directory itself is fsynced so
+the rename survives a power loss. Readers therefore see either the old file or
+the new one, never a truncated mix.
+
+Appending to a large file doesn't need a full rewrite: `append_in_place`
+adds bytes in one write and truncates them away again if it fails, and
+`patch_in_place` overwrites a same-length region (a frontmatter line) after
+checking it still holds the expected bytes.
+
+Like pointer.py this module only depends on `os`, so the SessionStart fast
+path can use it.
+"""
+
+import os
+
+# Temporary files match the `.chkcc-*` pattern that `chkcc init` gitignores
+TMP_PREFIX = ".chkcc-tmp."
+CHUNK_SIZE = 1 << 16
+
+
+def fsync_dir(path: str | os.PathLike) -> None:
+    """Flush a directory entry to disk (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(
+    path: str | os.PathLike,
+    data: str | bytes,
+    *,
+    encoding: str = "utf-8",
+    durable: bool = True,
+) -> None:
+    """Replace path with data atomically.
+
+    An existing file keeps its permission bits; a new file gets the default
+    mode for the process umask.
+
+    Args:
+        path: File to write
+        data: New content (str is encoded with encoding)
+        encoding: Text encoding for str data
+        durable: If True, fsync the file and its directory. Caches that can
+            be rebuilt pass False and only get atomicity.
+
+    Raises:
+        OSError: If the file can't be written; the original is left untouched
+    """
+    if isinstance(data, str):
+        data = data.encode(encoding)
+    write_atomic_chunks(path, (data,), durable=durable)
+
+
+def write_atomic_chunks(path: str | os.PathLike, chunks, *, durable: bool = True) -> None:
+    """Replace path atomically with the concatenation of chunks.
+
+    Chunks are written as they are produced, so content streamed from another
+    file (even path itself, which is only replaced at the end) never has to
+    be held in memory.
+
+    Args:
+        path: File to write
+        chunks: Iterable of bytes objects
+        durable: If True, fsync the file and its directory
+
+    Raises:
+        OSError: If the file can't be written; the original is left untouched
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or "."
+
+    tmp_path = os.path.join(
+        directory, f"{TMP_PREFIX}{os.path.basename(path)}.{os.getpid()}.{os.urandom(4).hex()}"
+    )
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            for chunk in chunks:
+                _write_all(fd, chunk)
+            try:
+                os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if durable:
+        fsync_dir(directory)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view[:CHUNK_SIZE])
+        view = view[written:]
+
+
+def append_in_place(path: str | os.PathLike, data: bytes) -> None:
+    """Append bytes to an existing file without rewriting it.
+
+    The data goes out in a single write (for the small entries chkcc appends),
+    so an interrupted process can't leave part of it behind; on any error the
+    file is truncated back to its original size.
+
+    Raises:
+        OSError: If the file can't be opened or written
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+    try:
+        size = os.fstat(fd).st_size
+        try:
+            _write_all(fd, data)
+            os.fsync(fd)
+        except BaseException:
+            try:
+                os.ftruncate(fd, size)
+            except OSError:
+                pass
+            raise
+    finally:
+        os.close(fd)
+
+
+def patch_in_place(path: str | os.PathLike, offset: int, old: bytes, new: bytes) -> None:
+    """Overwrite bytes at offset, which must currently hold old.
+
+    Args:
+        path: File to patch
+        offset: Byte offset of the region
+        old: Expected current content of the region
+        new: Replacement, same length as old
+
+    Raises:
+        ValueError: If the lengths differ or the region no longer holds old
+        OSError: If the file can't be written
+    """
+    if len(old) != len(new):
+        raise ValueError("In-place patch must keep the length")
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.lseek(fd, offset, os.SEEK_SET)
+        if os.read(fd, len(old)) != old:
+            raise ValueError(f"File changed while patching: {os.fspath(path)}")
+        os.lseek(fd, offset, os.SEEK_SET)
+        if os.write(fd, new) != len(new):
+            raise OSError(f"Short write patching {os.fspath(path)}")
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def append_atomic(path: str | os.PathLike, data: str, *, encoding: str = "utf-8") -> None:
+    """Append text to a file by atomically rewriting it.
+
+    Unlike an in-place append, a crash can't leave a partial entry behind.
+
+    Args:
+        path: File to append to (created if missing)
+        data: Text to append
+        encoding: Text encoding
+
+    Raises:
+        OSError: If the file can't be written; the original is left untouched
+    """
+    try:
+        with open(path, encoding=encoding) as f:
+            existing = f.read()
+    except FileNotFoundError:
+        existing = ""
+    write_atomic(path, existing + data, encoding=encoding)
@@ -0,0 +1,108 @@
+"""
+Benchmark: flat frontmatter parser vs PyYAML.
+
+Generates a corpus of checkpoint files and times header parsing with
+`parse_flat_frontmatter` against `yaml.safe_load`, both on pre-read header
+text and end to end through `read_frontmatter_text`.
+
+Usage (from the repository root, or anywhere with chkcc installed):
+    python -m chkcc.benchmarks.bench_frontmatter [--count N]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from chkcc.validate import parse_flat_frontmatter, read_frontmatter_text
+
+BODY = """
+## Problem
+Benchmark checkpoint {n}.
+
+## Essential Information
+
+### Decisions
+- **Decision**: Rationale
+
+### Current State
+State.
+
+### Next Actions
+- Next
+"""
+
+
+def make_header(n: int, rng: random.Random) -> str:
+    """Build a realistic checkpoint header."""
+    lines = [
+        f"checkpoint: chk-bench-{n}",
+        f"created: 2026-01-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z",
+        f"status: {'current' if n == 0 else 'active'}",
+        f"anchor: phase-{rng.randint(1, 9)} review",
+    ]
+    if n:
+        lines.append(f"parent: chk-bench-{rng.randrange(n)}")
+    if rng.random() < 0.5:
+        lines.append(f"last_delta: 2026-02-{rng.randint(1, 28):02d}T12:30:00Z")
+    return "\n".join(lines) + "\n"
+
+
+def write_corpus(directory: Path, count: int) -> list[Path]:
+    """Write `count` checkpoint files and return their paths."""
+    rng = random.Random(42)
+    paths = []
+    for n in range(count):
+        path = directory / f"chk-bench-{n}.md"
+        path.write_text(f"---\n{make_header(n, rng)}---\n{BODY.format(n=n)}", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def timed(label: str, func, count: int) -> float:
+    """Run func once and print elapsed time."""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms  ({elapsed / count * 1e6:6.1f} us/file)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10_000, help="Checkpoints to generate")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(Path(tmp), args.count)
+
+        headers = []
+        for path in paths:
+            with path.open(encoding="utf-8") as f:
+                headers.append(read_frontmatter_text(f))
+
+        # Both parsers must agree on the whole corpus
+        for text in headers:
+            assert parse_flat_frontmatter(text) == yaml.safe_load(text)
+
+        print(f"Parsing {args.count} checkpoint headers")
+        yaml_parse = timed("yaml.safe_load", lambda: [yaml.safe_load(t) for t in headers], args.count)
+        flat_parse = timed("parse_flat_frontmatter", lambda: [parse_flat_frontmatter(t) for t in headers], args.count)
+
+        def read_with(parse):
+            for path in paths:
+                with path.open(encoding="utf-8") as f:
+                    parse(read_frontmatter_text(f))
+
+        print(f"Reading + parsing {args.count} checkpoint files")
+        yaml_read = timed("yaml.safe_load", lambda: read_with(yaml.safe_load), args.count)
+        flat_read = timed("parse_flat_frontmatter", lambda: read_with(parse_flat_frontmatter), args.count)
+
+        print(f"Speedup: {yaml_parse / flat_parse:.1f}x parse only, {yaml_read / flat_read:.1f}x end to end")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: cold start of `chkcc prime`.
+
+Times `chkcc prime` in fresh interpreters against a bare `python -c pass`
+and reports the extra start-up cost, best of N runs each. Exits with status
+1 if it exceeds the budget, so it can gate a release on a quiet machine.
+
+Usage (from the repository root, or anywhere with chkcc installed):
+    python -m chkcc.benchmarks.bench_prime [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import chkcc
+from chkcc import pointer
+
+# Extra wall-clock time `chkcc prime` may add on top of a bare interpreter start
+PRIME_COLD_START_BUDGET_MS = 10
+
+CHECKPOINT = """---
+checkpoint: chk-bench
+created: 2026-01-03T10:00:00Z
+status: current
+---
+
+## Problem
+Benchmark checkpoint.
+"""
+
+
+def best_run_ms(argv: list[str], env: dict[str, str], runs: int) -> float:
+    """Best-of-N wall time for a subprocess, in milliseconds."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, env=env, check=True, stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7, help="Runs per command (best is kept)")
+    parser.add_argument("--budget-ms", type=float, default=PRIME_COLD_START_BUDGET_MS, help="Allowed overhead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        (base_dir / "active").mkdir()
+        checkpoint = base_dir / "active" / "chk-bench.md"
+        checkpoint.write_text(CHECKPOINT, encoding="utf-8")
+        pointer.write_pointer(base_dir, checkpoint)
+
+        # Installed packages ship bytecode, so measure with .pyc caching enabled
+        env = {**os.environ, "PYTHONPATH": str(Path(chkcc.__file__).parent.parent)}
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+        baseline = best_run_ms([sys.executable, "-c", "pass"], env, args.runs)
+        primed = best_run_ms(
+            [sys.executable, "-c", "from chkcc.cli import main; main()", "prime", "--dir", str(base_dir)],
+            env,
+            args.runs,
+        )
+
+    overhead = primed - baseline
+    print(f"  {'python -c pass':<28} {baseline:9.1f} ms")
+    print(f"  {'chkcc prime':<28} {primed:9.1f} ms")
+    print(f"Overhead: {overhead:.1f} ms (budget {args.budget_ms:g} ms)")
+    if overhead >= args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
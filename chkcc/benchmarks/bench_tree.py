@@ -0,0 +1,88 @@
+"""
+Benchmark: tree rendering on very large and very deep lineages.
+
+Builds in-memory checkpoint trees (no files) and times build_tree plus
+rendering into a discarding stream for a wide 100k-node tree and a
+10k-deep linear chain. Deep chains used to exceed the recursion limit.
+
+Usage (from the repository root, or anywhere with chkcc installed):
+    python -m chkcc.benchmarks.bench_tree [--nodes N] [--depth N]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from chkcc.tree import Checkpoint, build_tree, write_tree
+
+START = datetime(2026, 1, 1)
+
+
+class CountingSink:
+    """Text stream that only counts what is written."""
+
+    def __init__(self) -> None:
+        self.lines = 0
+        self.chars = 0
+
+    def write(self, text: str) -> int:
+        self.lines += 1
+        self.chars += len(text)
+        return len(text)
+
+
+def make_checkpoint(n: int, parent: int | None) -> Checkpoint:
+    """Build a checkpoint named chk-<n> with an optional parent."""
+    return Checkpoint(
+        id=f"chk-{n}",
+        created=START + timedelta(minutes=n),
+        parent=f"chk-{parent}" if parent is not None else None,
+        path=Path(f"active/chk-{n}.md"),
+        is_archived=n % 3 == 0,
+    )
+
+
+def wide_tree(count: int) -> list[Checkpoint]:
+    """Random tree: each checkpoint picks an earlier parent, a few are roots."""
+    rng = random.Random(42)
+    return [
+        make_checkpoint(n, rng.randrange(n) if n and rng.random() < 0.99 else None)
+        for n in range(count)
+    ]
+
+
+def chain(depth: int) -> list[Checkpoint]:
+    """Single linear lineage of the given depth."""
+    return [make_checkpoint(n, n - 1 if n else None) for n in range(depth)]
+
+
+def run(label: str, checkpoints: list[Checkpoint]) -> None:
+    """Time building and rendering one tree."""
+    start = time.perf_counter()
+    tree = build_tree(checkpoints)
+    built = time.perf_counter()
+    sink = CountingSink()
+    write_tree(tree, sink)
+    done = time.perf_counter()
+    print(
+        f"  {label:<22} build {(built - start) * 1000:8.1f} ms   "
+        f"render {(done - built) * 1000:8.1f} ms   "
+        f"{sink.lines} lines, {sink.chars / 1e6:.1f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=100_000, help="Checkpoints in the wide tree")
+    parser.add_argument("--depth", type=int, default=10_000, help="Length of the linear chain")
+    args = parser.parse_args()
+
+    print("Rendering checkpoint trees")
+    run(f"wide ({args.nodes} nodes)", wide_tree(args.nodes))
+    run(f"chain ({args.depth} deep)", chain(args.depth))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Token-budgeted rendering of checkpoints for `chkcc prime --budget N`.
+
+A checkpoint is cut into blocks: the frontmatter, each `## ` section, each
+`### ` subsection of sections that have them, each Play-By-Play entry and each
+delta. Blocks are ranked, the highest-ranked ones that fit the budget are
+kept, and the kept blocks are emitted in their original order:
+
+1. Frontmatter, Problem, Decisions, Current State, Next Actions
+2. Session Intent, User Rules, Technical Context, Completion
+3. Everything else (Artifact Trail, Breadcrumbs, unknown sections)
+4. Deltas, newest first, then Play-By-Play entries, newest first
+
+A subsection or entry brings its headings along; headings are never kept
+on their own. A trailing HTML comment
+says how much was left out.
+"""
+
+from dataclasses import dataclass
+
+from chkcc.document import is_list_item, parse_document
+from chkcc.tokens import estimate_tokens
+
+TIER_TITLES = (
+    ("problem", "decisions", "current state", "next actions"),
+    ("session intent", "user rules", "technical context", "completion"),
+)
+HISTORY_TIER = 3
+OMITTED_NOTE = "<!-- chkcc prime: omitted {blocks} blocks (~{tokens} tokens) to fit a {budget}-token budget -->"
+
+
+@dataclass
+class Block:
+    """A run of lines that is kept or dropped as a whole."""
+
+    start: int
+    lines: list[str]
+    tier: int
+    parent: "Block | None" = None
+    # Headings are only kept to introduce a kept subsection or entry
+    structural: bool = False
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of the block's lines."""
+        return estimate_tokens("".join(line + "\n" for line in self.lines))
+
+
+def title_tier(title: str) -> int:
+    """Return the rank tier of a section or subsection title."""
+    title = title.lower()
+    for tier, names in enumerate(TIER_TITLES):
+        if any(name in title for name in names):
+            return tier
+    return 2
+
+
+def split_entries(lines: list[str], start: int, parent: Block) -> list[Block]:
+    """Split Play-By-Play content into one block per list item (with continuation lines)."""
+    blocks: list[Block] = []
+    for offset, line in enumerate(lines):
+        if is_list_item(line) or not blocks:
+            blocks.append(Block(start + offset, [line], HISTORY_TIER, parent))
+        else:
+            blocks[-1].lines.append(line)
+    return blocks
+
+
+def split_blocks(lines: list[str]) -> list[Block]:
+    """Cut a checkpoint (frontmatter included) into ranked blocks in document order."""
+    body_start = 0
+    if lines and lines[0].strip() == "---":
+        for number in range(1, len(lines)):
+            if lines[number].strip() == "---":
+                body_start = number + 1
+                break
+
+    document = parse_document("\n".join(lines[body_start:]))
+    sections = document.sections
+    first = sections[0].start if sections else len(document.lines)
+    blocks = [Block(0, lines[:body_start + first], 0)]
+
+    for section in sections:
+        start = body_start + section.start
+        if section.title.lower().startswith("delta"):
+            blocks.append(Block(start, document.lines[section.start:section.end], HISTORY_TIER))
+            continue
+        if not section.subsections:
+            blocks.append(Block(start, document.lines[section.start:section.end], title_tier(section.title)))
+            continue
+
+        heading_end = section.subsections[0].start
+        heading = Block(start, document.lines[section.start:heading_end], 2, structural=True)
+        blocks.append(heading)
+        for subsection in section.subsections:
+            sub_start = body_start + subsection.start
+            sub_lines = document.lines[subsection.start:subsection.end]
+            if "play-by-play" not in subsection.title.lower():
+                blocks.append(Block(sub_start, sub_lines, title_tier(subsection.title), heading))
+                continue
+            # Heading and guidance up to the first entry, then one block per entry
+            entry_start = next(
+                (n for n, line in enumerate(sub_lines) if n and is_list_item(line)), len(sub_lines)
+            )
+            play_heading = Block(sub_start, sub_lines[:entry_start], HISTORY_TIER, heading, structural=True)
+            blocks.append(play_heading)
+            blocks.extend(split_entries(sub_lines[entry_start:], sub_start + entry_start, play_heading))
+
+    return blocks
+
+
+def rank(blocks: list[Block]) -> list[Block]:
+    """Order blocks by value: tier, then newest first for history, else document order."""
+    candidates = [b for b in blocks if not b.structural]
+    deltas = [b for b in candidates if b.tier == HISTORY_TIER and b.parent is None]
+    entries = [b for b in candidates if b.tier == HISTORY_TIER and b.parent is not None]
+    ranked = sorted((b for b in candidates if b.tier < HISTORY_TIER), key=lambda b: (b.tier, b.start))
+    return ranked + deltas[::-1] + entries[::-1]
+
+
+def render_budgeted(content: str, budget: int) -> str:
+    """Return the highest-value parts of a checkpoint that fit in budget tokens.
+
+    Args:
+        content: Full checkpoint text
+        budget: Maximum estimated tokens of the output
+
+    Returns:
+        content unchanged if it fits, otherwise the selected blocks in
+        document order followed by a note on what was omitted
+    """
+    if estimate_tokens(content) <= budget:
+        return content
+
+    lines = content.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    blocks = split_blocks(lines)
+
+    # Leave room for the note
+    remaining = budget - estimate_tokens(
+        OMITTED_NOTE.format(blocks=len(blocks), tokens=estimate_tokens(content), budget=budget) + "\n"
+    )
+    selected: set[int] = set()
+    for block in rank(blocks):
+        chain = []
+        node = block
+        while node is not None and id(node) not in selected:
+            chain.append(node)
+            node = node.parent
+        cost = sum(node.tokens for node in chain)
+        if cost <= remaining:
+            selected.update(id(node) for node in chain)
+            remaining -= cost
+
+    kept = [block for block in blocks if id(block) in selected]
+    omitted = [block for block in blocks if id(block) not in selected]
+    output = "".join(line + "\n" for block in kept for line in block.lines)
+    note = OMITTED_NOTE.format(
+        blocks=len(omitted), tokens=sum(block.tokens for block in omitted), budget=budget
+    )
+    if output and not output.endswith("\n\n"):
+        output += "\n"
+    return output + note + "\n"
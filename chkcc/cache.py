@@ -0,0 +1,130 @@
+"""
+Per-process content and parse cache for coihuin-compress.
+
+Every module that reads a checkpoint goes through `read_text` / `read_parsed`,
+so within one CLI invocation each file is read and parsed at most once. Entries
+are keyed by absolute path and validated against the file's stat signature
+(mtime, size, inode), so a file rewritten during the command is re-read.
+Writers call `invalidate` after replacing a file.
+
+Unlike the on-disk metadata index (see index.py), nothing here outlives the
+process.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from chkcc.document import Document, parse_document
+from chkcc.validate import extract_frontmatter
+
+
+class ParsedCheckpoint(NamedTuple):
+    """A checkpoint file split into frontmatter and a parsed body."""
+
+    frontmatter: dict | None
+    body: str
+    document: Document
+
+
+Signature = tuple[int, int, int]
+
+_lock = threading.Lock()
+_text: dict[str, tuple[Signature, str]] = {}
+_parsed: dict[str, tuple[Signature, ParsedCheckpoint]] = {}
+
+
+def _key(path: Path) -> str:
+    return os.path.abspath(path)
+
+
+def stat_signature(path: Path) -> Signature:
+    """Return (mtime_ns, size, inode) for a file.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def peek_text(path: Path) -> str | None:
+    """Return cached content for path if it is still current, without reading."""
+    key = _key(path)
+    cached = _text.get(key)
+    if cached is None:
+        return None
+    try:
+        signature = stat_signature(path)
+    except OSError:
+        return None
+    return cached[1] if cached[0] == signature else None
+
+
+def _read(path: Path) -> tuple[Signature, str]:
+    key = _key(path)
+    signature = stat_signature(path)
+    cached = _text.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached
+
+    entry = (signature, Path(path).read_text(encoding="utf-8"))
+    with _lock:
+        _text[key] = entry
+    return entry
+
+
+def read_text(path: Path) -> str:
+    """Read a file as UTF-8, reusing the content if it is unchanged.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File content
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    return _read(path)[1]
+
+
+def read_parsed(path: Path) -> ParsedCheckpoint:
+    """Read and parse a checkpoint file, reusing an unchanged parse.
+
+    Args:
+        path: Checkpoint file to read
+
+    Returns:
+        ParsedCheckpoint with frontmatter (None if missing), body and document
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    key = _key(path)
+    signature, content = _read(path)
+    cached = _parsed.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    frontmatter, body = extract_frontmatter(content)
+    parsed = ParsedCheckpoint(frontmatter, body, parse_document(body))
+    with _lock:
+        _parsed[key] = (signature, parsed)
+    return parsed
+
+
+def invalidate(path: Path) -> None:
+    """Forget cached content for a file that was written or moved."""
+    key = _key(path)
+    with _lock:
+        _text.pop(key, None)
+        _parsed.pop(key, None)
+
+
+def clear() -> None:
+    """Forget everything cached in this process."""
+    with _lock:
+        _text.clear()
+        _parsed.clear()
@@ -5,23 +5,115 @@ Provides command-line interface for managing checkpoint lifecycle:
 - tree: visualize checkpoint lineage
 - validate: check checkpoint format
 - scaffold: create new checkpoints or deltas
+- compact: fold deltas into the checkpoint body
+- search: full-text search over checkpoints and learnings
+- who-touched: find checkpoints that list a file in their Artifact Trail
+- lineage: ancestors, descendants or root path of a checkpoint
 - archive: move completed checkpoints to archive
 """
 
-import argparse
+from __future__ import annotations
+
 import sys
-from pathlib import Path
 
-from chkcc import archive, current, doctor, init, scaffold, status, tree, update, validate
+# Subcommand modules, argparse and pathlib are imported on dispatch only:
+# `chkcc prime` runs on every session start and must not pay for them.
+# Annotations name argparse and Path; type checkers treat TYPE_CHECKING as
+# true, while a plain constant spares the prime fast path importing typing.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from pathlib import Path
+
+
+def resolve_path(value: str) -> Path:
+    """Expand ~ and resolve a path given on the command line."""
+    from pathlib import Path
+
+    return Path(value).expanduser().resolve()
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for options that must be a positive integer."""
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got '{value}'")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """Argparse type for options that must be an integer >= 0."""
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer, got '{value}'")
+    return number
+
+
+def non_negative_float(value: str) -> float:
+    """Argparse type for options that must be a number of seconds >= 0."""
+    import argparse
+
+    try:
+        number = float(value)
+    except ValueError:
+        number = -1.0
+    if not number >= 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative number, got '{value}'")
+    return number
+
+
+def add_format_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --format option shared by commands with machine-readable output."""
+    parser.add_argument(
+        "--format",
+        choices=("text", "json", "ndjson"),
+        default="text",
+        help="Output format: text (default), json, or ndjson (one record per line, streamed)",
+    )
 
 
 def cmd_tree(args: argparse.Namespace) -> int:
     """Handle 'tree' subcommand."""
+    from chkcc import tree
+
+    root = getattr(args, "root", None)
+    max_depth = getattr(args, "depth", None)
+    collapse = getattr(args, "collapse", None)
     try:
-        base_dir = Path(args.dir).expanduser().resolve()
-        lines = tree.show_tree(base_dir, args.status)
-        for line in lines:
-            print(line)
+        base_dir = resolve_path(args.dir)
+        if args.format != "text":
+            from chkcc.output import checkpoint_record, write_records
+
+            tree.require_directory(base_dir)
+            if args.format == "ndjson" and root is None and max_depth is None:
+                # Stream in scan order; records carry parent ids
+                checkpoints = tree.iter_checkpoints(base_dir, args.status, jobs=args.jobs)
+                records = (checkpoint_record(cp) for cp in checkpoints)
+            else:
+                selected = tree.select_tree(base_dir, args.status, args.jobs, root, max_depth)
+                records = ()
+                if selected is not None:
+                    children, roots, _ = selected
+                    records = (
+                        checkpoint_record(cp, depth=depth)
+                        for cp, depth in tree.walk_tree(children, roots, max_depth)
+                    )
+            write_records(records, args.format)
+            return 0
+
+        tree.print_tree(
+            base_dir, args.status, jobs=args.jobs, root=root, max_depth=max_depth, collapse=collapse
+        )
         return 0
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -29,13 +121,45 @@ def cmd_tree(args: argparse.Namespace) -> int:
     except NotADirectoryError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_lineage(args: argparse.Namespace) -> int:
+    """Handle 'lineage' subcommand."""
+    from chkcc import lineage
+
+    try:
+        base_dir = resolve_path(args.dir)
+        checkpoint_id = args.checkpoint.removesuffix(".md")
+        graph = lineage.load_lineage(base_dir, jobs=args.jobs)
+        results = lineage.query(graph, checkpoint_id, args.mode)
+        if args.format != "text":
+            from chkcc.output import checkpoint_record, write_records
+
+            write_records((checkpoint_record(cp, depth=depth) for cp, depth in results), args.format)
+        else:
+            lineage.print_query(results, args.mode)
+        return 0
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except NotADirectoryError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Handle 'status' subcommand."""
+    from chkcc import status
+
     try:
-        base_dir = Path(args.dir).expanduser().resolve()
-        status.cmd_status(base_dir, args.all)
+        base_dir = resolve_path(args.dir)
+        status.cmd_status(base_dir, args.all, jobs=args.jobs, output_format=args.format)
         return 0
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -50,20 +174,47 @@ def cmd_status(args: argparse.Namespace) -> int:
 
 def cmd_validate(args: argparse.Namespace) -> int:
     """Handle 'validate' subcommand."""
+    from chkcc import validate
+
     try:
-        file_path = Path(args.file).expanduser().resolve()
-        result = validate.validate_file(file_path)
+        if args.format == "text" and len(args.files) == 1 and resolve_path(args.files[0]).is_file():
+            file_path = resolve_path(args.files[0])
+            result = validate.validate_file(file_path)
 
-        # Determine file type for display
-        if file_path.name == "INDEX.md":
-            file_type = "INDEX"
-        else:
-            file_type = "checkpoint"
+            # Determine file type for display
+            if file_path.name == "INDEX.md":
+                file_type = "INDEX"
+            else:
+                file_type = "checkpoint"
+
+            validate.print_result(result, file_type, str(file_path))
+
+            # Exit with status 0 if valid, 1 if invalid
+            return 0 if result.valid else 1
+
+        if args.format != "text":
+            from chkcc.output import report_record, write_records
+
+            failed = False
+
+            def records():
+                nonlocal failed
+                for report in validate.iter_reports(args.files, jobs=args.jobs):
+                    if report.result is None or not report.result.valid:
+                        failed = True
+                    yield report_record(report)
+
+            write_records(records(), args.format)
+            return 1 if failed else 0
 
-        validate.print_result(result, file_type, str(file_path))
+        reports = validate.validate_paths(args.files, jobs=args.jobs)
+        if not reports:
+            print("No checkpoint or INDEX files found")
+            return 0
 
-        # Exit with status 0 if valid, 1 if invalid
-        return 0 if result.valid else 1
+        validate.print_summary(reports)
+        ok = all(report.result is not None and report.result.valid for report in reports)
+        return 0 if ok else 1
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -74,8 +225,10 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
 def cmd_scaffold_checkpoint(args: argparse.Namespace) -> int:
     """Handle 'scaffold checkpoint' subcommand."""
+    from chkcc import scaffold
+
     try:
-        output_dir = Path(args.dir).expanduser().resolve()
+        output_dir = resolve_path(args.dir)
         created_path = scaffold.scaffold_checkpoint(
             args.name,
             parent=args.parent,
@@ -94,12 +247,17 @@ def cmd_scaffold_checkpoint(args: argparse.Namespace) -> int:
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    except TimeoutError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
 
 def cmd_scaffold_delta(args: argparse.Namespace) -> int:
     """Handle 'scaffold delta' subcommand."""
+    from chkcc import scaffold
+
     try:
-        checkpoint_path = Path(args.file).expanduser().resolve()
+        checkpoint_path = resolve_path(args.file)
         scaffold.scaffold_delta(checkpoint_path)
         print(f"Added delta to: {checkpoint_path}")
         return 0
@@ -109,14 +267,19 @@ def cmd_scaffold_delta(args: argparse.Namespace) -> int:
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    except TimeoutError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
 
-def cmd_archive(args: argparse.Namespace) -> int:
-    """Handle 'archive' subcommand."""
+def cmd_compact(args: argparse.Namespace) -> int:
+    """Handle 'compact' subcommand."""
+    from chkcc import compact
+
     try:
-        checkpoint_path = Path(args.file).expanduser().resolve()
-        archived_path = archive.archive_checkpoint(checkpoint_path, force=args.force)
-        print(f"Archived checkpoint: {archived_path}")
+        checkpoint_path = resolve_path(args.file)
+        report = compact.compact_checkpoint(checkpoint_path, dry_run=args.dry_run)
+        compact.print_report(report, dry_run=args.dry_run)
         return 0
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -124,6 +287,112 @@ def cmd_archive(args: argparse.Namespace) -> int:
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    except TimeoutError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    """Handle 'search' subcommand."""
+    import sqlite3
+
+    from chkcc import search
+
+    try:
+        base_dir = resolve_path(args.dir)
+        query = " ".join(args.query)
+        results = search.search(
+            base_dir, query, limit=args.limit, field=args.field, kind=args.status
+        )
+        if args.format != "text":
+            from chkcc.output import write_records
+
+            write_records((search.search_record(result) for result in results), args.format)
+        else:
+            search.print_results(results, base_dir, query)
+        return 0
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except sqlite3.Error as e:
+        print(f"Error: Unable to use search index: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_who_touched(args: argparse.Namespace) -> int:
+    """Handle 'who-touched' subcommand."""
+    from pathlib import Path
+
+    from chkcc import artifacts
+
+    try:
+        base_dir = resolve_path(args.dir)
+        results = artifacts.who_touched(
+            base_dir, args.path, status_filter=args.status, project_root=Path.cwd()
+        )
+        if args.format != "text":
+            from chkcc.output import checkpoint_record, write_records
+
+            write_records(
+                (checkpoint_record(checkpoint, artifacts=paths) for checkpoint, paths in results),
+                args.format,
+            )
+        else:
+            artifacts.print_results(results, args.path)
+        return 0
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except NotADirectoryError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_archive(args: argparse.Namespace) -> int:
+    """Handle 'archive' subcommand."""
+    from chkcc import archive
+
+    try:
+        if not args.batch:
+            if len(args.files) != 1 or args.completed or args.root:
+                print(
+                    "Error: archive takes exactly one file; use --batch for several "
+                    "files, --completed or --root",
+                    file=sys.stderr,
+                )
+                return 1
+            checkpoint_path = resolve_path(args.files[0])
+            archived_path = archive.archive_checkpoint(checkpoint_path, force=args.force)
+            print(f"Archived checkpoint: {archived_path}")
+            return 0
+
+        base_dir = resolve_path(args.dir)
+        paths = [resolve_path(file) for file in args.files]
+        if args.completed:
+            paths += archive.select_completed(base_dir)
+        if args.root:
+            paths += archive.select_subtree(base_dir, args.root)
+        if not paths:
+            print("No checkpoints selected")
+            return 0
+
+        archived_paths = archive.archive_batch(paths, force=args.force)
+        for archived_path in archived_paths:
+            print(f"Archived checkpoint: {archived_path}")
+        print(f"Archived {len(archived_paths)} checkpoints")
+        return 0
+    except (FileNotFoundError, FileExistsError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except TimeoutError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
     except (PermissionError, OSError) as e:
         print(f"Error: Unable to archive checkpoint: {e}", file=sys.stderr)
         return 1
@@ -131,8 +400,12 @@ def cmd_archive(args: argparse.Namespace) -> int:
 
 def cmd_current(args: argparse.Namespace) -> int:
     """Handle 'current' subcommand."""
+    from pathlib import Path
+
+    from chkcc import current
+
     try:
-        base_dir = Path(args.dir).expanduser().resolve()
+        base_dir = resolve_path(args.dir)
 
         # Resolve checkpoint path if provided
         checkpoint_path = None
@@ -153,7 +426,9 @@ def cmd_current(args: argparse.Namespace) -> int:
             else:
                 checkpoint_path = checkpoint_input.expanduser().resolve()
 
-        current.cmd_current(base_dir, checkpoint_path, args.clear)
+        current.cmd_current(
+            base_dir, checkpoint_path, args.clear, output_format=args.format, repair=args.repair
+        )
         return 0
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -161,6 +436,9 @@ def cmd_current(args: argparse.Namespace) -> int:
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    except TimeoutError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
     except (PermissionError, OSError) as e:
         print(f"Error: Unable to update checkpoint: {e}", file=sys.stderr)
         return 1
@@ -168,46 +446,64 @@ def cmd_current(args: argparse.Namespace) -> int:
 
 def cmd_prime(args: argparse.Namespace) -> int:
     """Handle 'prime' subcommand."""
-    base_dir = Path(args.dir).expanduser().resolve()
-
-    checkpoint = current.get_current(base_dir)
-    if checkpoint is None:
-        return 0  # Silent exit, no error
+    from chkcc import prime
 
-    content = checkpoint.path.read_text(encoding='utf-8')
-    print(content, end='')  # Avoid extra newline if content already ends with one
-    return 0
+    return prime.prime(str(resolve_path(args.dir)), budget=getattr(args, "budget", None))
 
 
 def cmd_init(args: argparse.Namespace) -> int:
     """Handle 'init' subcommand."""
-    base_dir = Path(args.dir).expanduser().resolve()
-    project_root = Path(args.project).expanduser().resolve()
+    from chkcc import init
+
+    base_dir = resolve_path(args.dir)
+    project_root = resolve_path(args.project)
     init.cmd_init(base_dir, project_root)
     return 0
 
 
 def cmd_doctor(args: argparse.Namespace) -> int:
     """Handle 'doctor' subcommand."""
-    base_dir = Path(args.dir).expanduser().resolve()
-    project_root = Path(args.project).expanduser().resolve()
+    from chkcc import doctor
+
+    base_dir = resolve_path(args.dir)
+    project_root = resolve_path(args.project)
     return doctor.cmd_doctor(base_dir, project_root, fix=args.fix)
 
 
 def cmd_update(args: argparse.Namespace) -> int:
     """Handle 'update' subcommand."""
-    skill_dir = Path(args.project).expanduser().resolve() / ".claude" / "skills" / "coihuin-compress"
+    from chkcc import update
+
+    skill_dir = resolve_path(args.project) / ".claude" / "skills" / "coihuin-compress"
     return update.cmd_update(skill_dir, force=args.force, dry_run=args.dry_run)
 
 
 def main() -> None:
     """Main entry point for the CLI."""
     try:
+        # Fast path for the SessionStart hook: skip argparse and other subcommands
+        if sys.argv[1:2] == ["prime"]:
+            from chkcc import prime
+
+            exit_code = prime.main(sys.argv[2:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+        import argparse
+
         parser = argparse.ArgumentParser(
             prog="chkcc",
             description="Checkpoint compression CLI for managing work sessions",
         )
 
+        parser.add_argument(
+            "--lock-timeout",
+            type=non_negative_float,
+            metavar="SECONDS",
+            help="Seconds to wait for another chkcc process to release the "
+                 "checkpoints lock (default: $CHKCC_LOCK_TIMEOUT or 30)",
+        )
+
         subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
         # tree command
@@ -227,8 +523,81 @@ def main() -> None:
             default="all",
             help="Filter by status (default: all)",
         )
+        tree_parser.add_argument(
+            "-j", "--jobs",
+            type=positive_int,
+            default=1,
+            help="Worker threads for scanning checkpoints (default: 1)",
+        )
+        tree_parser.add_argument(
+            "--root",
+            metavar="ID",
+            help="Show only this checkpoint and its descendants",
+        )
+        tree_parser.add_argument(
+            "--depth",
+            type=non_negative_int,
+            metavar="N",
+            help="Show at most N levels below each root; deeper branches are counted",
+        )
+        tree_parser.add_argument(
+            "--collapse",
+            type=positive_int,
+            nargs="?",
+            const=3,
+            metavar="N",
+            help="Fold linear chains of N or more checkpoints into one line (default N: 3; "
+                 "text output only)",
+        )
+        add_format_argument(tree_parser)
         tree_parser.set_defaults(func=cmd_tree)
 
+        # lineage command
+        lineage_parser = subparsers.add_parser(
+            "lineage",
+            help="Show ancestors, descendants or the root path of a checkpoint",
+        )
+        lineage_parser.add_argument(
+            "checkpoint",
+            help="Checkpoint id",
+        )
+        mode_group = lineage_parser.add_mutually_exclusive_group()
+        mode_group.add_argument(
+            "--ancestors",
+            dest="mode",
+            action="store_const",
+            const="ancestors",
+            help="List ancestors, parent first",
+        )
+        mode_group.add_argument(
+            "--descendants",
+            dest="mode",
+            action="store_const",
+            const="descendants",
+            help="List all descendants, depth-first",
+        )
+        mode_group.add_argument(
+            "--path",
+            dest="mode",
+            action="store_const",
+            const="path",
+            help="List the checkpoints from the root down to this one (default)",
+        )
+        lineage_parser.set_defaults(mode="path")
+        lineage_parser.add_argument(
+            "--dir",
+            default="./checkpoints",
+            help="Checkpoints directory (default: ./checkpoints)",
+        )
+        lineage_parser.add_argument(
+            "-j", "--jobs",
+            type=positive_int,
+            default=1,
+            help="Worker threads for scanning checkpoints (default: 1)",
+        )
+        add_format_argument(lineage_parser)
+        lineage_parser.set_defaults(func=cmd_lineage)
+
         # status command
         status_parser = subparsers.add_parser(
             "status",
@@ -245,6 +614,13 @@ def main() -> None:
             action="store_true",
             help="Include archived checkpoints",
         )
+        status_parser.add_argument(
+            "-j", "--jobs",
+            type=positive_int,
+            default=1,
+            help="Worker threads for scanning checkpoints (default: 1)",
+        )
+        add_format_argument(status_parser)
         status_parser.set_defaults(func=cmd_status)
 
         # validate command
@@ -253,9 +629,18 @@ def main() -> None:
             help="Validate checkpoint or INDEX file format",
         )
         validate_parser.add_argument(
-            "file",
-            help="Path to checkpoint or INDEX file",
+            "files",
+            nargs="+",
+            metavar="path",
+            help="Checkpoint or INDEX files, directories, or glob patterns",
+        )
+        validate_parser.add_argument(
+            "-j", "--jobs",
+            type=positive_int,
+            default=1,
+            help="Worker processes for validating many files (default: 1)",
         )
+        add_format_argument(validate_parser)
         validate_parser.set_defaults(func=cmd_validate)
 
         # scaffold command
@@ -310,14 +695,111 @@ def main() -> None:
         )
         scaffold_delta_parser.set_defaults(func=cmd_scaffold_delta)
 
+        # compact command
+        compact_parser = subparsers.add_parser(
+            "compact",
+            help="Fold delta sections into Essential Information",
+        )
+        compact_parser.add_argument(
+            "file",
+            help="Path to checkpoint file",
+        )
+        compact_parser.add_argument(
+            "-n", "--dry-run",
+            action="store_true",
+            help="Report the size change without writing",
+        )
+        compact_parser.set_defaults(func=cmd_compact)
+
+        # search command
+        search_parser = subparsers.add_parser(
+            "search",
+            help="Search checkpoints and learnings",
+        )
+        search_parser.add_argument(
+            "query",
+            nargs="+",
+            help='Words to find (all must match); "quoted phrase", prefix*, decisions:word',
+        )
+        search_parser.add_argument(
+            "--field",
+            choices=["problem", "decisions", "artifacts", "learnings", "body"],
+            help="Only search this part of each checkpoint",
+        )
+        search_parser.add_argument(
+            "-s", "--status",
+            choices=["active", "archive", "learnings", "all"],
+            default="all",
+            help="Only search active or archived checkpoints, or LEARNINGS.md (default: all)",
+        )
+        search_parser.add_argument(
+            "-n", "--limit",
+            type=positive_int,
+            default=10,
+            help="Maximum number of results (default: 10)",
+        )
+        search_parser.add_argument(
+            "--dir",
+            default="./checkpoints",
+            help="Checkpoints directory (default: ./checkpoints)",
+        )
+        add_format_argument(search_parser)
+        search_parser.set_defaults(func=cmd_search)
+
+        # who-touched command
+        who_touched_parser = subparsers.add_parser(
+            "who-touched",
+            help="Find checkpoints whose Artifact Trail lists a file",
+        )
+        who_touched_parser.add_argument(
+            "path",
+            help="File path, directory ending in '/', or glob such as 'src/auth/*.py'",
+        )
+        who_touched_parser.add_argument(
+            "-s", "--status",
+            choices=["active", "archive", "all"],
+            default="all",
+            help="Filter by status (default: all)",
+        )
+        who_touched_parser.add_argument(
+            "--dir",
+            default="./checkpoints",
+            help="Checkpoints directory (default: ./checkpoints)",
+        )
+        add_format_argument(who_touched_parser)
+        who_touched_parser.set_defaults(func=cmd_who_touched)
+
         # archive command
         archive_parser = subparsers.add_parser(
             "archive",
             help="Archive completed checkpoint",
         )
         archive_parser.add_argument(
-            "file",
-            help="Path to checkpoint file",
+            "files",
+            nargs="*",
+            metavar="file",
+            help="Path to checkpoint file (several with --batch)",
+        )
+        archive_parser.add_argument(
+            "--batch",
+            action="store_true",
+            help="Archive many checkpoints at once, leaves first, writing INDEX.md "
+                 "and LEARNINGS.md once",
+        )
+        archive_parser.add_argument(
+            "--completed",
+            action="store_true",
+            help="With --batch: select every active checkpoint with a ## Completion section",
+        )
+        archive_parser.add_argument(
+            "--root",
+            metavar="ID",
+            help="With --batch: select this checkpoint and all its active descendants",
+        )
+        archive_parser.add_argument(
+            "--dir",
+            default="./checkpoints",
+            help="Checkpoints directory for --completed/--root (default: ./checkpoints)",
         )
         archive_parser.add_argument(
             "-f", "--force",
@@ -342,11 +824,17 @@ def main() -> None:
             action="store_true",
             help="Clear current checkpoint marker",
         )
+        current_parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Reconcile the .chkcc-current pointer with checkpoint frontmatter",
+        )
         current_parser.add_argument(
             "--dir",
             default="./checkpoints",
             help="Checkpoints directory (default: ./checkpoints)",
         )
+        add_format_argument(current_parser)
         current_parser.set_defaults(func=cmd_current)
 
         # prime command
@@ -359,6 +847,12 @@ def main() -> None:
             default="./checkpoints",
             help="Checkpoints directory (default: ./checkpoints)",
         )
+        prime_parser.add_argument(
+            "--budget",
+            type=positive_int,
+            metavar="N",
+            help="Emit only the most important sections that fit in about N tokens",
+        )
         prime_parser.set_defaults(func=cmd_prime)
 
         # init command
@@ -435,6 +929,18 @@ def main() -> None:
             scaffold_parser.print_help()
             sys.exit(1)
 
+        # Folded chains only exist in the text rendering
+        if args.command == "tree" and args.collapse is not None and args.format != "text":
+            tree_parser.error("--collapse only applies to --format text")
+
+        # Commands that write read the lock timeout from the environment
+        if args.lock_timeout is not None:
+            import os
+
+            from chkcc import lock
+
+            os.environ[lock.TIMEOUT_ENV] = str(args.lock_timeout)
+
         # Execute the command function
         exit_code = args.func(args)
         sys.exit(exit_code)
@@ -442,6 +948,14 @@ def main() -> None:
     except KeyboardInterrupt:
         print("\nOperation cancelled.", file=sys.stderr)
         sys.exit(130)
+    except BrokenPipeError:
+        # The reader stopped early (e.g. `chkcc status --format ndjson | head -1`).
+        # Point stdout at devnull so the flush at interpreter exit can't fail too.
+        import os
+
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(0)
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         sys.exit(1)
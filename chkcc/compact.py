@@ -0,0 +1,531 @@
+"""
+Delta compaction for coihuin-compress.
+
+Every `scaffold delta` appends a `## Delta:` section, so long-running
+checkpoints grow without bound. `chkcc compact` folds the deltas back into
+the canonical Essential Information subsections and removes them:
+
+- What Changed entries and Status Transitions rows become Play-By-Play entries
+- Artifacts rows are merged into the Artifact Trail table, one row per file
+- Decisions listed in a delta are added to Decisions
+
+Compaction only adds to the body: new entries go after the existing ones, and
+the only existing line it changes is the Artifact Trail row of a file a delta
+lists again. Entries already present (ignoring case and whitespace) are not
+repeated, so compacting is idempotent. Delta content that can't be folded
+without loss (other subsections, fenced code, tables outside Artifacts and
+Status Transitions) stays in its delta and is reported. Template guidance
+comments are dropped.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from chkcc.document import HTML_COMMENT, Document, is_list_item, parse_document, table_rows
+
+DELTA_TITLE = re.compile(r"^Delta:\s*(.*)$")
+FENCE = re.compile(r"^(```|~~~)")
+ARTIFACT_TRAIL_HEADER = ["| File | Status | Key Change |", "|------|--------|------------|"]
+
+# Essential Information subsections compaction writes to, matched as substrings
+DECISIONS = "Decisions"
+PLAY_BY_PLAY = "Play-By-Play"
+ARTIFACT_TRAIL = "Artifact Trail"
+
+
+@dataclass
+class Entry:
+    """A list item with its indented lines (nested bullets, wrapped text), or a paragraph."""
+
+    text: str
+    continuation: list[str] = field(default_factory=list)
+
+    def key(self) -> str:
+        """Key used to detect duplicate entries."""
+        return normalize(" ".join([self.text, *self.continuation]))
+
+    def to_lines(self) -> list[str]:
+        """Render the entry as a bullet, continuation lines unchanged."""
+        return [f"- {self.text}", *self.continuation]
+
+
+@dataclass
+class FoldedDeltas:
+    """Entries collected from a checkpoint's delta sections."""
+
+    # Deltas that had something folded out of them
+    count: int = 0
+    decisions: list[Entry] = field(default_factory=list)
+    play_by_play: list[Entry] = field(default_factory=list)
+    # File key -> (file, status, key change), in first-seen order
+    artifacts: dict[str, tuple[str, str, str]] = field(default_factory=dict)
+    # Delta heading line -> lines that stay in that delta (heading included)
+    kept: dict[int, list[str]] = field(default_factory=dict)
+    # "Subsection (Delta: ...)" for every part left in a delta
+    kept_titles: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CompactReport:
+    """Sizes of a checkpoint before and after compaction."""
+
+    path: Path
+    deltas: int
+    bytes_before: int
+    bytes_after: int
+    lines_before: int
+    lines_after: int
+    tokens_before: int
+    tokens_after: int
+    # Delta parts that couldn't be folded and were left in place
+    kept: list[str] = field(default_factory=list)
+
+
+def normalize(text: str) -> str:
+    """Key used to detect duplicate entries."""
+    return " ".join(text.split()).lower()
+
+
+def strip_list_marker(line: str) -> str:
+    """Return a list item's text without its bullet or number."""
+    return re.sub(r"^\s*(?:[-*]|\d+\.)\s+", "", line).strip()
+
+
+def split_entries(lines: list[str], strict: bool = True) -> list[Entry] | None:
+    """Split content into entries: one per top-level list item or paragraph.
+
+    Indented lines under a list item stay with it verbatim; the lines of a
+    paragraph are joined into one entry.
+
+    Args:
+        lines: Subsection content
+        strict: If True, return None for content with tables or fenced code,
+            which a list entry can't hold; otherwise skip over those lines
+
+    Returns:
+        Entries in order, or None (strict only)
+    """
+    result: list[Entry] = []
+    paragraph: list[str] = []
+    item: Entry | None = None
+    blank = False
+
+    def flush() -> None:
+        if paragraph:
+            result.append(Entry(" ".join(paragraph)))
+            paragraph.clear()
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("|") or FENCE.match(stripped):
+            if strict:
+                return None
+            flush()
+            item = None
+        elif not stripped:
+            flush()
+            blank = item is not None
+            continue
+        elif item is not None and line[:1].isspace():
+            if blank:
+                item.continuation.append("")
+            item.continuation.append(line.rstrip())
+        elif is_list_item(stripped):
+            flush()
+            item = Entry(strip_list_marker(stripped))
+            result.append(item)
+        else:
+            item = None
+            paragraph.append(stripped)
+        blank = False
+
+    flush()
+    return result
+
+
+def table_entries(lines: list[str]) -> list[list[str]] | None:
+    """Return the rows of a table-only subsection, padded to three cells.
+
+    Returns None if the content holds anything besides the table, or rows
+    wider than three cells, which can't be folded without loss.
+    """
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not (stripped.startswith("|") and stripped.endswith("|")):
+            return None
+    rows = table_rows(lines)
+    if any(len(cells) > 3 for cells in rows):
+        return None
+    return [cells + [""] * (3 - len(cells)) for cells in rows]
+
+
+def artifact_key(path: str) -> str:
+    """Key used to merge artifact rows for the same file."""
+    return path.strip().strip("`").strip()
+
+
+def merge_artifact(artifacts: dict[str, tuple[str, str, str]], path: str, status: str, change: str) -> None:
+    """Merge a row into artifacts (key -> (path, status, change)).
+
+    A later row replaces the description and status, except that a file
+    created earlier stays 'created'.
+    """
+    key = artifact_key(path)
+    if not key:
+        return
+    previous = artifacts.get(key)
+    if previous is not None:
+        if previous[1].lower() == "created" and status.lower() != "deleted":
+            status = previous[1]
+        path = previous[0]
+        change = change or previous[2]
+    artifacts[key] = (path, status, change)
+
+
+def fold_deltas(document: Document, deltas: list) -> FoldedDeltas:
+    """Collect Play-By-Play, Decisions and Artifact Trail entries from deltas.
+
+    Parts that can't be folded are recorded in `kept` instead. A delta with
+    nothing foldable is kept whole and not counted.
+    """
+    folded = FoldedDeltas()
+    # Play-By-Play entries; a transition is a mutable [item, before, after]
+    timeline: list = []
+    transitions: dict[str, list[str]] = {}
+
+    for delta in deltas:
+        date = DELTA_TITLE.match(delta.title).group(1).strip()[:10]
+        prefix = f"{date} → " if date else ""
+        kept: list[list[str]] = []
+        kept_titles: list[str] = []
+        changed = False
+
+        # Text between the delta heading and its first subsection
+        first = delta.subsections[0].start if delta.subsections else delta.end
+        intro = document.lines[delta.start + 1:first]
+        found = split_entries(clean(intro))
+        if found is None:
+            kept.append(intro)
+            kept_titles.append(f"text ({delta.title})")
+        elif found:
+            timeline.extend(Entry(prefix + entry.text, entry.continuation) for entry in found)
+            changed = True
+
+        for subsection in delta.subsections:
+            title = subsection.title.lower()
+            lines = clean(document.content_lines(subsection))
+            folds = False
+            if "artifact" in title:
+                rows = table_entries(lines)
+                if rows is not None:
+                    for cells in rows:
+                        merge_artifact(folded.artifacts, cells[0], cells[1], cells[2])
+                    folds = True
+            elif "status transition" in title:
+                rows = table_entries(lines)
+                if rows is not None:
+                    for item, before, after in rows:
+                        if not item:
+                            continue
+                        if item in transitions:
+                            # Chain transitions of the same item: first before, last after
+                            transitions[item][2] = after
+                        else:
+                            transitions[item] = [item, before, after]
+                            timeline.append(transitions[item])
+                    folds = True
+            elif "decision" in title or "what changed" in title:
+                found = split_entries(lines)
+                if found is not None:
+                    if "decision" in title:
+                        folded.decisions.extend(found)
+                    else:
+                        timeline.extend(Entry(prefix + entry.text, entry.continuation) for entry in found)
+                    folds = True
+
+            if folds:
+                changed = True
+            else:
+                kept.append(document.lines[subsection.start:subsection.end])
+                kept_titles.append(f"{subsection.title} ({delta.title})")
+
+        if changed or not kept:
+            folded.count += 1
+            lines = [document.lines[delta.start]]
+            for chunk in kept:
+                chunk = list(chunk)
+                trim_blank(chunk)
+                trim_separators(chunk)
+                lines += ["", *chunk]
+        else:
+            lines = list(document.lines[delta.start:delta.end])
+            trim_separators(lines)
+        if kept:
+            folded.kept[delta.start] = lines
+            folded.kept_titles += kept_titles
+
+    folded.play_by_play = [
+        Entry(" → ".join(part for part in entry if part)) if isinstance(entry, list) else entry
+        for entry in timeline
+    ]
+    return folded
+
+
+def clean(lines: list[str]) -> list[str]:
+    """Drop template guidance comments and horizontal rules."""
+    text = HTML_COMMENT.sub("", "\n".join(lines))
+    return [line for line in text.split("\n") if line.strip() != "---"]
+
+
+def remove_deltas(document: Document, kept: dict[int, list[str]]) -> list[str]:
+    """Return the body lines with delta sections replaced by their kept parts.
+
+    Args:
+        document: Parsed body
+        kept: Delta heading line -> lines to keep; other deltas are removed
+            along with their separators
+    """
+    sections = document.sections
+    lines = list(document.lines[:sections[0].start] if sections else document.lines)
+    after_delta = False
+
+    for section in sections:
+        if DELTA_TITLE.match(section.title):
+            trim_separators(lines)
+            if section.start in kept:
+                lines += ["", "---", "", *kept[section.start]]
+            after_delta = True
+            continue
+        if after_delta and lines:
+            # Keep the separator that stood before this section
+            previous = section.start - 1
+            while previous > 0 and not document.lines[previous].strip():
+                previous -= 1
+            lines += ["", "---", ""] if document.lines[previous].strip() == "---" else [""]
+        after_delta = False
+        lines.extend(document.lines[section.start:section.end])
+
+    trim_separators(lines)
+    lines.append("")
+    return lines
+
+
+def trim_separators(lines: list[str]) -> None:
+    """Remove trailing blank and `---` lines in place."""
+    while lines and lines[-1].strip() in ("", "---"):
+        lines.pop()
+
+
+def trim_blank(lines: list[str]) -> None:
+    """Remove leading and trailing blank lines in place."""
+    while lines and not lines[-1].strip():
+        lines.pop()
+    while lines and not lines[0].strip():
+        lines.pop(0)
+
+
+def content_end(lines: list[str], start: int, end: int) -> int:
+    """Return the index after the last non-blank line in lines[start:end], or start."""
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    return end
+
+
+def new_entries(existing: list[str], additions: list[Entry]) -> list[str]:
+    """Return the lines of additions not already in the existing content."""
+    seen = {entry.key() for entry in split_entries(existing, strict=False)}
+    result = []
+    for entry in additions:
+        key = entry.key()
+        if key not in seen:
+            seen.add(key)
+            result += entry.to_lines()
+    return result
+
+
+def format_row(cells: list[str]) -> str:
+    """Render table cells as a markdown row."""
+    return "| " + " | ".join(cells) + " |"
+
+
+def merge_trail(lines: list[str], start: int, end: int, artifacts: dict[str, tuple[str, str, str]]) -> list[tuple]:
+    """Plan edits merging artifact rows into the Artifact Trail in lines[start:end].
+
+    A file already in the table has its row updated in place (only if the
+    merge changes it); new files are appended after the last table row.
+    Everything else in the subsection is left alone.
+
+    Returns:
+        (start, end, replacement) edits on lines
+    """
+    # Line numbers of the first table: header, separator, then rows
+    table: list[int] = []
+    for number in range(start, end):
+        if lines[number].strip().startswith("|"):
+            table.append(number)
+        elif table:
+            break
+    rows: dict[str, tuple[int, list[str]]] = {}
+    for number in table[2:]:
+        cells = [cell.strip() for cell in lines[number].strip().strip("|").split("|")]
+        rows.setdefault(artifact_key(cells[0]), (number, cells + [""] * (3 - len(cells))))
+
+    edits = []
+    appended = []
+    for key, (path, status, change) in artifacts.items():
+        if key in rows:
+            number, cells = rows[key]
+            merged = {key: (cells[0], cells[1], cells[2])}
+            merge_artifact(merged, path, status, change)
+            updated = [*merged[key], *cells[3:]]
+            if updated != cells:
+                edits.append((number, number + 1, [format_row(updated)]))
+        else:
+            appended.append(format_row([path, status, change]))
+
+    if appended:
+        if not table:
+            at = content_end(lines, start, end)
+            lead = [""] if at > start else []
+            edits.append((at, at, [*lead, *ARTIFACT_TRAIL_HEADER, *appended]))
+        else:
+            edits.append((table[-1] + 1, table[-1] + 1, appended))
+    return edits
+
+
+def compact_body(body: str) -> tuple[str, FoldedDeltas]:
+    """Fold delta sections of a checkpoint body into Essential Information.
+
+    Args:
+        body: Markdown body (without frontmatter)
+
+    Returns:
+        (new body, folded deltas); the body is unchanged if no delta had
+        anything to fold
+
+    Raises:
+        ValueError: If there are deltas but no ## Essential Information section
+    """
+    document = parse_document(body)
+    deltas = [section for section in document.sections if DELTA_TITLE.match(section.title)]
+    folded = fold_deltas(document, deltas)
+    if not folded.count:
+        return body, folded
+
+    document = parse_document("\n".join(remove_deltas(document, folded.kept)))
+    essential = document.find_section("Essential Information")
+    if essential is None:
+        raise ValueError("Checkpoint has no '## Essential Information' section to fold deltas into")
+
+    lines = list(document.lines)
+    edits = []
+    missing = []
+    for name, additions in ((DECISIONS, folded.decisions), (PLAY_BY_PLAY, folded.play_by_play)):
+        subsection = document.find_subsection("Essential Information", name)
+        existing = document.content_lines(subsection) if subsection is not None else []
+        added = new_entries(existing, additions)
+        if not added:
+            continue
+        if subsection is None:
+            missing += [f"### {name}", "", *added, ""]
+            continue
+        at = content_end(lines, subsection.start + 1, subsection.end)
+        if at == subsection.start + 1:
+            added = ["", *added]
+        if at < len(lines) and lines[at].startswith("#"):
+            added = [*added, ""]
+        edits.append((at, at, added))
+
+    if folded.artifacts:
+        subsection = document.find_subsection("Essential Information", ARTIFACT_TRAIL)
+        if subsection is None:
+            rows = [format_row(list(row)) for row in folded.artifacts.values()]
+            missing += [f"### {ARTIFACT_TRAIL}", "", *ARTIFACT_TRAIL_HEADER, *rows, ""]
+        else:
+            edits += merge_trail(lines, subsection.start + 1, subsection.end, folded.artifacts)
+
+    if missing:
+        end = content_end(lines, essential.start + 1, essential.end)
+        edits.append((end, end, ["", *missing]))
+
+    # Apply bottom-up so earlier spans stay valid
+    for start, end, replacement in sorted(edits, key=lambda edit: edit[:2], reverse=True):
+        lines[start:end] = replacement
+
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return "\n".join(lines) + "\n", folded
+
+
+def compact_checkpoint(checkpoint_path: Path, dry_run: bool = False) -> CompactReport:
+    """Fold a checkpoint's deltas into its Essential Information subsections.
+
+    Args:
+        checkpoint_path: Path to the checkpoint file
+        dry_run: If True, only compute the report
+
+    Returns:
+        Sizes before and after compaction
+
+    Raises:
+        FileNotFoundError: If checkpoint file doesn't exist
+        ValueError: If the file has no frontmatter, or deltas but no
+            ## Essential Information section
+    """
+    from chkcc import atomic, cache, lock, prime
+    from chkcc.tokens import estimate_tokens
+
+    if not checkpoint_path.exists():
+        raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
+
+    with lock.locked(lock.lock_dir_for(checkpoint_path.parent)):
+        content = cache.read_text(checkpoint_path)
+        end = content.find("\n---\n", 3) if content.startswith("---\n") else -1
+        if end == -1:
+            raise ValueError(f"Invalid frontmatter format in: {checkpoint_path}")
+
+        body, folded = compact_body(content[end + 5:])
+        new_content = content[:end + 5] + body if folded.count else content
+
+        if folded.count and not dry_run:
+            atomic.write_atomic(checkpoint_path, new_content)
+            cache.invalidate(checkpoint_path)
+            prime.refresh_snapshot(lock.lock_dir_for(checkpoint_path.parent), changed=checkpoint_path)
+
+    return CompactReport(
+        path=checkpoint_path,
+        deltas=folded.count,
+        bytes_before=len(content.encode("utf-8")),
+        bytes_after=len(new_content.encode("utf-8")),
+        lines_before=content.count("\n"),
+        lines_after=new_content.count("\n"),
+        tokens_before=estimate_tokens(content),
+        tokens_after=estimate_tokens(new_content),
+        kept=folded.kept_titles,
+    )
+
+
+def print_report(report: CompactReport, dry_run: bool = False) -> None:
+    """Print a before/after size report and the delta parts left in place."""
+    if report.deltas == 0:
+        print(f"No deltas to compact in {report.path.stem}")
+        print_kept(report.kept)
+        return
+
+    verb = "Would fold" if dry_run else "Folded"
+    change = report.bytes_after - report.bytes_before
+    percent = round(change * 100 / report.bytes_before) if report.bytes_before else 0
+    print(f"{verb} {report.deltas} deltas in {report.path.stem}")
+    print(f"  Size:   {report.bytes_before:,} -> {report.bytes_after:,} bytes ({percent:+d}%)")
+    print(f"  Lines:  {report.lines_before:,} -> {report.lines_after:,}")
+    print(f"  Tokens: ~{report.tokens_before:,} -> ~{report.tokens_after:,}")
+    print_kept(report.kept)
+
+
+def print_kept(kept: list[str]) -> None:
+    """List delta parts that couldn't be folded."""
+    if kept:
+        print("  Left in deltas (can't be folded without loss):")
+        for title in kept:
+            print(f"    {title}")
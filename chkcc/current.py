@@ -3,36 +3,69 @@ Current checkpoint management for coihuin-compress.
 
 Provides functionality to mark a single checkpoint as the "current" focus.
 Only ONE checkpoint can be current at a time. Status is stored in frontmatter
-as `status: current` or `status: active`.
+as `status: current` or `status: active`; the `.chkcc-current` pointer file
+(see chkcc.pointer) mirrors it so the current checkpoint can be found without
+a scan.
 """
 
-import os
-import re
-import stat
-import tempfile
 from pathlib import Path
 
-from chkcc.tree import Checkpoint, scan_checkpoints
+from chkcc import atomic, cache, lock, pointer, prime
+from chkcc.tree import Checkpoint, load_checkpoint, scan_checkpoints
 
 
 def get_current(base_dir: Path) -> Checkpoint | None:
     """Find the checkpoint with status: current.
 
+    Trusts the pointer file when it records that nothing is current (and no
+    file in active/ changed since) or its target still has status: current;
+    otherwise scans active/ and repairs the pointer.
+
     Args:
         base_dir: Base checkpoints directory (parent of active/)
 
     Returns:
         The current Checkpoint, or None if no checkpoint is current.
     """
+    known, pointed = pointer.read_state(base_dir)
+    if known:
+        if pointed is None:
+            return None
+        checkpoint = load_checkpoint(base_dir, Path(pointed))
+        if checkpoint is not None and not checkpoint.is_archived and checkpoint.status == "current":
+            return checkpoint
+
     checkpoints = scan_checkpoints(base_dir, status_filter="active")
 
     for cp in checkpoints:
         if cp.status == "current":
+            pointer.write_pointer(base_dir, cp.path)
             return cp
 
+    pointer.clear_pointer(base_dir)
     return None
 
 
+def find_current_path(base_dir: Path) -> Path | None:
+    """Return the path of the current checkpoint without loading it.
+
+    Costs one pointer read and one frontmatter header read when the pointer
+    is consistent; falls back to get_current otherwise.
+
+    Args:
+        base_dir: Base checkpoints directory (parent of active/)
+    """
+    known, pointed = pointer.read_state(base_dir)
+    if known:
+        if pointed is None:
+            return None
+        if Path(pointed).parent.name == "active" and pointer.read_header_status(pointed) == "current":
+            return Path(pointed)
+
+    checkpoint = get_current(base_dir)
+    return checkpoint.path if checkpoint else None
+
+
 def update_frontmatter_status(checkpoint_path: Path, new_status: str) -> None:
     """Update the status field in a checkpoint's frontmatter.
 
@@ -40,8 +73,9 @@ def update_frontmatter_status(checkpoint_path: Path, new_status: str) -> None:
         checkpoint_path: Path to the checkpoint file
         new_status: New status value ('current' or 'active')
 
-    This function reads the file, updates/adds the status field in the
-    YAML frontmatter, and writes it back atomically.
+    Only the frontmatter lines are edited; the body is copied through as is,
+    and the file is written back atomically. Nothing is written if the status
+    is already new_status.
 
     If status field exists, update it.
     If status field doesn't exist and new_status is 'current', add it.
@@ -51,58 +85,39 @@ def update_frontmatter_status(checkpoint_path: Path, new_status: str) -> None:
     if new_status not in ("current", "active"):
         raise ValueError(f"Invalid status '{new_status}', must be 'current' or 'active'")
 
-    content = checkpoint_path.read_text(encoding='utf-8')
+    with lock.locked(lock.lock_dir_for(checkpoint_path.parent)):
+        content = cache.read_text(checkpoint_path)
 
-    # Match frontmatter: starts with ---, ends with ---
-    # Use re.DOTALL so . matches newlines
-    frontmatter_pattern = r"^---\n(.*?)---\n"
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
+        # Frontmatter runs from the opening "---" line to the next "---" line
+        end = content.find("\n---\n", 3) if content.startswith("---\n") else -1
+        if end == -1:
+            raise ValueError(f"Invalid frontmatter format in: {checkpoint_path}")
 
-    if not match:
-        raise ValueError(f"Invalid frontmatter format in: {checkpoint_path}")
+        header_lines = content[4:end].split("\n") if end > 3 else []
+        changed = False
+        status_found = False
 
-    frontmatter_text = match.group(1)
-    # Extract body - everything after the closing ---\n
-    # This preserves any blank lines between frontmatter and content
-    body = content[match.end():]
+        for number, line in enumerate(header_lines):
+            if line.startswith("status:"):
+                status_found = True
+                if line != f"status: {new_status}":
+                    header_lines[number] = f"status: {new_status}"
+                    changed = True
 
-    # Update or add status field
-    frontmatter_lines = frontmatter_text.rstrip("\n").split("\n")
-    new_frontmatter_lines = []
-    status_found = False
+        # Only add status field if setting to current (non-default)
+        if not status_found and new_status == "current":
+            header_lines.append(f"status: {new_status}")
+            changed = True
 
-    for line in frontmatter_lines:
-        if line.startswith("status:"):
-            new_frontmatter_lines.append(f"status: {new_status}")
-            status_found = True
-        else:
-            new_frontmatter_lines.append(line)
+        if not changed:
+            return
 
-    # Only add status field if setting to current (non-default)
-    if not status_found and new_status == "current":
-        new_frontmatter_lines.append(f"status: {new_status}")
+        # Body (everything after the closing fence) is kept byte for byte
+        new_content = "---\n" + "".join(f"{line}\n" for line in header_lines) + content[end + 1:]
 
-    new_frontmatter = "\n".join(new_frontmatter_lines)
-    new_content = f"---\n{new_frontmatter}\n---\n{body}"
-
-    # Atomic write - write to temp file then rename
-    tmp_fd, tmp_path = tempfile.mkstemp(
-        dir=checkpoint_path.parent,
-        suffix=".tmp",
-        prefix=checkpoint_path.stem,
-    )
-    try:
-        with os.fdopen(tmp_fd, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        # Preserve original file permissions
-        original_mode = os.stat(checkpoint_path).st_mode
-        os.chmod(tmp_path, stat.S_IMODE(original_mode))
-        # Atomic rename (on POSIX systems)
-        os.replace(tmp_path, checkpoint_path)
-    except Exception:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
-        raise
+        # Atomic write, preserving the original file permissions
+        atomic.write_atomic(checkpoint_path, new_content)
+        cache.invalidate(checkpoint_path)
 
 
 def clear_current(base_dir: Path) -> Checkpoint | None:
@@ -114,18 +129,26 @@ def clear_current(base_dir: Path) -> Checkpoint | None:
     Returns:
         The checkpoint that was cleared, or None if no current existed.
     """
-    current = get_current(base_dir)
+    with lock.locked(base_dir):
+        current_path = find_current_path(base_dir)
 
-    if current is None:
-        return None
+        if current_path is None:
+            return None
 
-    update_frontmatter_status(current.path, "active")
-    return current
+        cleared = load_checkpoint(base_dir, current_path)
+        update_frontmatter_status(current_path, "active")
+        pointer.clear_pointer(base_dir)
+        prime.refresh_snapshot(base_dir)
+        return cleared
 
 
 def set_current(checkpoint_path: Path, base_dir: Path) -> None:
     """Set a checkpoint as current, clearing any existing current first.
 
+    The previous current checkpoint comes from the pointer file, so a switch
+    touches the pointer and the two checkpoints' frontmatter only, however
+    many checkpoints exist.
+
     Args:
         checkpoint_path: Path to checkpoint to make current
         base_dir: Base checkpoints directory
@@ -153,15 +176,68 @@ def set_current(checkpoint_path: Path, base_dir: Path) -> None:
             f"Got: {checkpoint_path}, expected under: {active_dir}"
         )
 
-    # Clear any existing current checkpoint
-    clear_current(base_dir)
+    with lock.locked(base_dir):
+        # Clear any existing current checkpoint
+        previous = find_current_path(base_dir)
+        if previous is not None and previous != checkpoint_path:
+            update_frontmatter_status(previous, "active")
 
-    # Set the new checkpoint as current
-    update_frontmatter_status(checkpoint_path, "current")
+        # Set the new checkpoint as current
+        update_frontmatter_status(checkpoint_path, "current")
+        pointer.write_pointer(base_dir, checkpoint_path)
+        prime.refresh_snapshot(base_dir)
+
+
+def repair_current(base_dir: Path) -> list[str]:
+    """Reconcile the pointer file with checkpoint frontmatter.
+
+    Scans active/. If several checkpoints are marked current, the pointed-to
+    one (or else the most recently modified) stays current and the others are
+    set to active. The pointer is then rewritten to match.
+
+    Args:
+        base_dir: Base checkpoints directory
+
+    Returns:
+        Descriptions of the changes made (empty if already consistent)
+    """
+    with lock.locked(base_dir):
+        known, pointed = pointer.read_state(base_dir)
+        currents = [
+            cp for cp in scan_checkpoints(base_dir, status_filter="active") if cp.status == "current"
+        ]
+
+        keep = None
+        if currents:
+            pointed_path = Path(pointed) if pointed else None
+            keep = next((cp for cp in currents if cp.path == pointed_path), None)
+            if keep is None:
+                keep = max(currents, key=lambda cp: cp.path.stat().st_mtime_ns)
+
+        changes = []
+        for cp in currents:
+            if cp is not keep:
+                update_frontmatter_status(cp.path, "active")
+                changes.append(f"Set active: {cp.id}")
+
+        if keep is None:
+            if not known or pointed is not None:
+                pointer.clear_pointer(base_dir)
+                changes.append("Pointer: no current checkpoint")
+        elif pointed is None or Path(pointed) != keep.path:
+            pointer.write_pointer(base_dir, keep.path)
+            changes.append(f"Pointer: {keep.id}")
+
+        prime.refresh_snapshot(base_dir)
+        return changes
 
 
 def cmd_current(
-    base_dir: Path, checkpoint_path: Path | None = None, clear: bool = False
+    base_dir: Path,
+    checkpoint_path: Path | None = None,
+    clear: bool = False,
+    output_format: str = "text",
+    repair: bool = False,
 ) -> None:
     """Main current command logic.
 
@@ -169,12 +245,24 @@ def cmd_current(
         base_dir: Base checkpoints directory
         checkpoint_path: Path to checkpoint to set as current (optional)
         clear: If True, clear current without setting new one
+        output_format: 'text', 'json' or 'ndjson'; applies to showing the
+            current checkpoint (null when there is none)
+        repair: If True, reconcile the pointer file with frontmatter
 
     Behavior:
     - No args: Show current checkpoint or "No current checkpoint"
     - checkpoint_path: Set that checkpoint as current
     - clear=True: Clear current, show confirmation
+    - repair=True: Fix pointer/frontmatter mismatches, list the changes
     """
+    if repair:
+        changes = repair_current(base_dir)
+        for change in changes:
+            print(change)
+        if not changes:
+            print("Current checkpoint state is consistent")
+        return
+
     if clear:
         # Clear current checkpoint
         cleared = clear_current(base_dir)
@@ -192,6 +280,12 @@ def cmd_current(
 
     # Show current checkpoint
     current = get_current(base_dir)
+    if output_format != "text":
+        from chkcc.output import checkpoint_record, write_record
+
+        write_record(checkpoint_record(current) if current else None, output_format)
+        return
+
     if current:
         print(f"Current: {current.id}")
         print(f"  Path: {current.path}")
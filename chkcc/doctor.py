@@ -84,8 +84,36 @@ def check_skill_files(project_root: Path) -> list[tuple[bool, str]]:
     return results
 
 
+def check_lineage(base_dir: Path) -> list[tuple[bool, str]]:
+    """Check checkpoint parent links: duplicate ids, cycles and unknown parents.
+
+    Duplicate ids and cycles fail the check. Unknown parents (often a
+    deleted archive) are reported as passing warnings, as validate does.
+
+    Returns:
+        One check per problem, or a single passed check. Empty if there is
+        no checkpoints directory to check.
+    """
+    if not base_dir.is_dir():
+        return []
+
+    from chkcc.lineage import Lineage
+    from chkcc.tree import scan_checkpoints
+
+    problems = Lineage(scan_checkpoints(base_dir)).problems
+    checks = [(False, f"✗ {message}") for message in problems.errors()]
+    checks += [(True, f"⚠ {message}") for message in problems.warnings()]
+    if not checks:
+        return [(True, "✓ No duplicate ids, parent cycles or unknown parents")]
+    return checks
+
+
 def cmd_doctor(base_dir: Path, project_root: Path, fix: bool = False) -> int:
-    """Main doctor command logic. Returns 0 if healthy, 1 if issues found."""
+    """Main doctor command logic. Returns 0 if healthy, 1 if issues found.
+
+    With fix=True, returns 0 once everything is repaired, or 1 if issues
+    remain that need manual edits (lineage errors).
+    """
     print("Checking coihuin-compress setup...")
     print()
 
@@ -101,11 +129,16 @@ def cmd_doctor(base_dir: Path, project_root: Path, fix: bool = False) -> int:
     # Hook checks
     checks.append(check_hook(project_root))
 
-    all_passed = True
     for passed, msg in checks:
         print(f"  {msg}")
-        if not passed:
-            all_passed = False
+
+    # Lineage checks
+    lineage_checks = check_lineage(base_dir)
+    if lineage_checks:
+        print()
+        print("Lineage:")
+        for passed, msg in lineage_checks:
+            print(f"  {msg}")
 
     # Skill file checks
     skill_checks = check_skill_files(project_root)
@@ -114,45 +147,57 @@ def cmd_doctor(base_dir: Path, project_root: Path, fix: bool = False) -> int:
         print("Skill files:")
         for passed, msg in skill_checks:
             print(f"  {msg}")
-            if not passed:
-                all_passed = False
+
+    # --fix repairs the setup checks; lineage errors need manual edits
+    fixable = any(not passed for passed, _ in checks + skill_checks)
+    lineage_failed = any(not passed for passed, _ in lineage_checks)
 
     print()
-    if all_passed:
+    if not fixable and not lineage_failed:
         print("All checks passed.")
         return 0
 
-    if not fix:
+    if fixable and not fix:
         print("Issues found. Run 'chkcc doctor --fix' to repair.")
-        return 1
-
-    # Fix mode: repair issues
-    print("Fixing issues...")
-    print()
-
-    # Fix directories and INDEX files
-    created_dirs = init.create_directory_structure(base_dir)
-    for d in created_dirs:
-        print(f"  Created: {d}")
 
-    created_files = init.create_index_files(base_dir)
-    for f in created_files:
-        print(f"  Created: {f}")
-
-    # Fix hooks
-    hook_results = init.install_hooks(project_root)
-    for installed, msg in hook_results:
-        if installed:
-            print(f"  Installed: {msg}")
+    if fixable and fix:
+        # Fix mode: repair issues
+        print("Fixing issues...")
+        print()
 
-    # Fix skill files
-    created_skills = init.install_skill_files(project_root)
-    for f in created_skills:
-        print(f"  Installed: {f}")
+        # Fix directories and INDEX files
+        created_dirs = init.create_directory_structure(base_dir)
+        for d in created_dirs:
+            print(f"  Created: {d}")
+
+        created_files = init.create_index_files(base_dir)
+        for f in created_files:
+            print(f"  Created: {f}")
+
+        # Fix hooks
+        hook_results = init.install_hooks(project_root)
+        for installed, msg in hook_results:
+            if installed:
+                print(f"  Installed: {msg}")
+
+        # Fix skill files
+        created_skills = init.install_skill_files(project_root)
+        for f in created_skills:
+            print(f"  Installed: {f}")
+
+        if any(not passed for passed, _ in skill_checks):
+            print()
+            print("Run 'chkcc update' to sync skill files.")
+
+    if lineage_failed:
+        if fixable:
+            print()
+        print("Lineage errors need manual edits: fix the 'checkpoint' or 'parent' "
+              "frontmatter fields listed above.")
+        return 1
 
-    if any(not passed for passed, _ in skill_checks):
-        print()
-        print("Run 'chkcc update' to sync skill files.")
+    if not fix:
+        return 1
 
     print()
     print("Fixed. Run 'chkcc doctor' to verify.")
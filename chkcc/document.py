@@ -0,0 +1,149 @@
+"""
+Checkpoint document model for coihuin-compress.
+
+Parses a markdown body once into its `## ` sections and `### ` subsections,
+recording line spans and list-item counts, so validation, status summaries and
+archiving can query the structure without re-splitting the text per lookup.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+LIST_ITEM = re.compile(r"^(?:[-*] |\d+\.\s)")
+TABLE_SEPARATOR = re.compile(r":?-+:?")
+# Template guidance comments, which may span lines
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+def is_list_item(line: str) -> bool:
+    """Check if a line is a list item (- or * bullets, or numbered)."""
+    return bool(LIST_ITEM.match(line.strip()))
+
+
+def table_rows(lines: list[str]) -> list[list[str]]:
+    """Return the cells of markdown table rows, skipping header and separator rows."""
+    rows = []
+    seen_header = False
+    for line in lines:
+        stripped = line.strip()
+        if not (stripped.startswith("|") and stripped.endswith("|")):
+            continue
+        cells = [cell.strip() for cell in stripped[1:-1].split("|")]
+        if all(TABLE_SEPARATOR.fullmatch(cell) for cell in cells if cell):
+            continue
+        if not seen_header:
+            seen_header = True
+            continue
+        rows.append(cells)
+    return rows
+
+
+@dataclass
+class Subsection:
+    """A `### ` subsection: heading at line `start`, content up to line `end`."""
+
+    title: str
+    start: int
+    end: int = 0
+    list_items: int = 0
+
+
+@dataclass
+class Section:
+    """A `## ` section: heading at line `start`, content up to line `end`."""
+
+    title: str
+    start: int
+    end: int = 0
+    subsections: list[Subsection] = field(default_factory=list)
+
+
+@dataclass
+class Document:
+    """Section tree over the lines of a markdown body."""
+
+    lines: list[str]
+    sections: list[Section]
+
+    def find_section(self, name: str) -> Section | None:
+        """Return the first section whose title contains name (case-insensitive)."""
+        name = name.lower()
+        for section in self.sections:
+            if name in section.title.lower():
+                return section
+        return None
+
+    def find_subsection(self, section_name: str, subsection_name: str) -> Subsection | None:
+        """Return the first matching subsection within the first matching section.
+
+        Both names match case-insensitively as substrings, so "Decisions"
+        matches "Decisiones del Usuario".
+        """
+        section = self.find_section(section_name)
+        if section is None:
+            return None
+
+        subsection_name = subsection_name.lower()
+        for subsection in section.subsections:
+            if subsection_name in subsection.title.lower():
+                return subsection
+        return None
+
+    def content_lines(self, node: Section | Subsection) -> list[str]:
+        """Return the lines between a heading and the end of its span."""
+        return self.lines[node.start + 1:node.end]
+
+    def text(self, node: Section | Subsection | None) -> str:
+        """Return the stripped content of a section or subsection ('' if None)."""
+        if node is None:
+            return ""
+        return "\n".join(self.content_lines(node)).strip()
+
+    def outline(self) -> dict[str, list[str]]:
+        """Map each section title to its subsection titles."""
+        return {
+            section.title: [subsection.title for subsection in section.subsections]
+            for section in self.sections
+        }
+
+
+def parse_document(body: str) -> Document:
+    """Parse a markdown body into a Document in a single pass.
+
+    `## ` lines open sections and `### ` lines open subsections of the
+    current section; `### ` lines before the first section are plain content.
+
+    Args:
+        body: Markdown text (without frontmatter)
+
+    Returns:
+        Document with line spans and subsection list-item counts
+    """
+    lines = body.split("\n")
+    sections: list[Section] = []
+    section: Section | None = None
+    subsection: Subsection | None = None
+
+    for number, line in enumerate(lines):
+        if line.startswith("## "):
+            if subsection is not None:
+                subsection.end = number
+                subsection = None
+            if section is not None:
+                section.end = number
+            section = Section(title=line[3:].strip(), start=number)
+            sections.append(section)
+        elif line.startswith("### ") and section is not None:
+            if subsection is not None:
+                subsection.end = number
+            subsection = Subsection(title=line[4:].strip(), start=number)
+            section.subsections.append(subsection)
+        elif subsection is not None and is_list_item(line):
+            subsection.list_items += 1
+
+    if subsection is not None:
+        subsection.end = len(lines)
+    if section is not None:
+        section.end = len(lines)
+
+    return Document(lines=lines, sections=sections)
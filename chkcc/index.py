@@ -0,0 +1,274 @@
+"""
+Persistent checkpoint metadata index for coihuin-compress.
+
+Caches the frontmatter fields and status summaries of every checkpoint in a
+`.chkcc-index` file at the root of the checkpoints directory. Entries are keyed
+by the file path relative to that directory and validated against the file's
+mtime and size, so a scan only re-reads and re-parses checkpoints that changed
+since the previous run.
+
+Each entry also lists the files named in the checkpoint's Artifact Trail and
+delta Artifacts tables, so the index doubles as a reverse index from artifact
+paths to checkpoints (see MetadataIndex.artifact_owners and `chkcc who-touched`).
+
+The index is a cache: it is safe to delete at any time and is rebuilt on the
+next scan.
+"""
+
+import io
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from chkcc import atomic, cache
+from chkcc.document import Document, parse_document, table_rows
+from chkcc.validate import parse_frontmatter, parse_iso_datetime, read_frontmatter_text
+
+INDEX_FILENAME = ".chkcc-index"
+INDEX_VERSION = 3
+CODE_SPAN = re.compile(r"`([^`]+)`")
+
+# Files modified this recently are not persisted. Filesystem timestamps are
+# coarse, so a second write within the same tick could keep both mtime and
+# size unchanged and the stale entry would be trusted until the next edit.
+RACY_WINDOW_NS = 2_000_000_000
+
+# Indexes loaded in this process, keyed by absolute base_dir and reused while
+# the index file's stat signature is unchanged (see MetadataIndex.load)
+_loaded: dict[str, tuple[cache.Signature | None, "MetadataIndex"]] = {}
+
+
+def _file_signature(path: Path) -> cache.Signature | None:
+    try:
+        return cache.stat_signature(path)
+    except OSError:
+        return None
+
+
+def _scalar(value: object) -> object:
+    """Coerce a frontmatter value into something JSON can store verbatim."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def normalize_artifact(path: str) -> str:
+    """Normalize an artifact path for lookups ("./src//a.py" -> "src/a.py")."""
+    path = path.strip().replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    return re.sub(r"/{2,}", "/", path)
+
+
+def extract_artifacts(document: Document) -> list[str]:
+    """Return the file paths listed in Artifact Trail and delta Artifacts tables, in order.
+
+    The first cell of each row names the file; if it holds several `code`
+    spans, each is a path.
+    """
+    artifacts: dict[str, None] = {}
+    for section in document.sections:
+        for subsection in section.subsections:
+            if "artifact" not in subsection.title.lower():
+                continue
+            for cells in table_rows(document.content_lines(subsection)):
+                spans = CODE_SPAN.findall(cells[0]) or [cells[0]]
+                for span in spans:
+                    path = normalize_artifact(span)
+                    if path:
+                        artifacts[path] = None
+    return list(artifacts)
+
+
+def read_metadata(file_path: Path) -> dict | None:
+    """Read a checkpoint file and extract the metadata stored in the index.
+
+    Args:
+        file_path: Path to the checkpoint markdown file
+
+    Returns:
+        Dict with id, created, parent, status, problem, next_action and
+        artifacts keys, or None if the file has no frontmatter or no
+        checkpoint field.
+    """
+    # Imported here: status imports tree, which imports this module
+    from chkcc.status import extract_next_action, extract_problem_summary
+
+    # Reuse content another module already read in this process
+    content = cache.peek_text(file_path)
+    with (io.StringIO(content) if content is not None else file_path.open(encoding="utf-8")) as f:
+        text = read_frontmatter_text(f)
+        frontmatter = parse_frontmatter(text) if text is not None else None
+
+        if not isinstance(frontmatter, dict) or "checkpoint" not in frontmatter:
+            return None
+
+        # The whole body: delta Artifacts tables come after Next Actions
+        document = parse_document(f.read())
+
+    created = parse_iso_datetime(frontmatter.get("created"))
+
+    return {
+        "id": _scalar(frontmatter["checkpoint"]),
+        "created": created.isoformat() if created else None,
+        "parent": _scalar(frontmatter.get("parent")),
+        "status": _scalar(frontmatter.get("status", "active")),
+        "problem": extract_problem_summary(document),
+        "next_action": extract_next_action(document),
+        "artifacts": extract_artifacts(document),
+    }
+
+
+class MetadataIndex:
+    """On-disk cache of checkpoint metadata keyed by path, mtime and size."""
+
+    def __init__(self, base_dir: Path, entries: dict[str, dict] | None = None) -> None:
+        self.base_dir = base_dir
+        self.path = base_dir / INDEX_FILENAME
+        self.entries: dict[str, dict] = entries if entries is not None else {}
+        self.dirty = False
+        self._lock = threading.Lock()  # get() may be called from scan worker threads
+        # Artifact path -> keys of the checkpoints listing it (built on first use)
+        self._owners: dict[str, set[str]] | None = None
+
+    @classmethod
+    def load(cls, base_dir: Path) -> "MetadataIndex":
+        """Load the index for a checkpoints directory.
+
+        A missing, unreadable or outdated index file yields an empty index.
+        Within one process the same instance is returned until the index
+        file changes on disk, so repeated scans parse the JSON only once.
+        """
+        key = os.path.abspath(base_dir)
+        signature = _file_signature(base_dir / INDEX_FILENAME)
+        loaded = _loaded.get(key)
+        if loaded is not None and loaded[0] == signature:
+            return loaded[1]
+
+        index = cls._read(base_dir)
+        _loaded[key] = (signature, index)
+        return index
+
+    @classmethod
+    def _read(cls, base_dir: Path) -> "MetadataIndex":
+        try:
+            data = json.loads((base_dir / INDEX_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(base_dir)
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls(base_dir)
+
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return cls(base_dir)
+
+        return cls(base_dir, entries)
+
+    def key(self, file_path: Path) -> str:
+        """Return the index key for a file (path relative to base_dir)."""
+        return file_path.relative_to(self.base_dir).as_posix()
+
+    def get(self, file_path: Path) -> dict | None:
+        """Return metadata for a checkpoint file, re-reading it only if changed.
+
+        Args:
+            file_path: Path to a checkpoint file under base_dir
+
+        Returns:
+            Metadata dict (see read_metadata), or None if not a checkpoint
+        """
+        key = self.key(file_path)
+        stat_result = file_path.stat()
+
+        entry = self.entries.get(key)
+        if (
+            entry is not None
+            and entry.get("mtime_ns") == stat_result.st_mtime_ns
+            and entry.get("size") == stat_result.st_size
+        ):
+            return entry.get("meta")
+
+        meta = read_metadata(file_path)
+        with self._lock:
+            if self._owners is not None:
+                self._unlink_artifacts(key, entry)
+            self.entries[key] = {
+                "mtime_ns": stat_result.st_mtime_ns,
+                "size": stat_result.st_size,
+                "meta": meta,
+            }
+            if self._owners is not None:
+                self._link_artifacts(key, self.entries[key])
+            self.dirty = True
+        return meta
+
+    def prune(self, subdir: str, seen: set[str]) -> None:
+        """Drop entries under subdir/ whose files were not seen in a scan.
+
+        Args:
+            subdir: Scanned subdirectory name ('active' or 'archive')
+            seen: Keys of the files found during the scan
+        """
+        prefix = f"{subdir}/"
+        stale = [k for k in self.entries if k.startswith(prefix) and k not in seen]
+        for key in stale:
+            if self._owners is not None:
+                self._unlink_artifacts(key, self.entries[key])
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+
+    def artifact_owners(self) -> dict[str, set[str]]:
+        """Map each artifact path to the keys of the checkpoints that list it.
+
+        Built once from the cached entries, then kept in step by get() and
+        prune(), so lookups after a scan cost a dict access.
+        """
+        with self._lock:
+            if self._owners is None:
+                self._owners = {}
+                for key, entry in self.entries.items():
+                    self._link_artifacts(key, entry)
+            return self._owners
+
+    def _link_artifacts(self, key: str, entry: dict) -> None:
+        for path in (entry.get("meta") or {}).get("artifacts", ()):
+            self._owners.setdefault(path, set()).add(key)
+
+    def _unlink_artifacts(self, key: str, entry: dict | None) -> None:
+        if entry is None:
+            return
+        for path in (entry.get("meta") or {}).get("artifacts", ()):
+            owners = self._owners.get(path)
+            if owners is not None:
+                owners.discard(key)
+                if not owners:
+                    del self._owners[path]
+
+    def save(self) -> None:
+        """Write the index back to disk if anything changed.
+
+        Failures are ignored: the index is only a cache and a read-only
+        checkpoints directory must not break read commands.
+        """
+        if not self.dirty:
+            return
+
+        now = time.time_ns()
+        entries = {
+            key: entry for key, entry in self.entries.items()
+            if now - entry.get("mtime_ns", now) > RACY_WINDOW_NS
+        }
+        payload = json.dumps({"version": INDEX_VERSION, "entries": entries})
+
+        try:
+            # A lost index is rebuilt on the next scan, so skip the fsyncs
+            atomic.write_atomic(self.path, payload, durable=False)
+        except OSError:
+            return
+        self.dirty = False
+        _loaded[os.path.abspath(self.base_dir)] = (_file_signature(self.path), self)
@@ -0,0 +1,250 @@
+"""
+INDEX.md model for coihuin-compress.
+
+Parses an INDEX.md file once into its quick reference table rows and
+`## chk-...` summary sections, supports removing entries by checkpoint name
+without rescanning the text, and serializes back.
+Lines that are not touched are written out verbatim, so a parse/serialize
+round trip reproduces the file exactly.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+TABLE_HEADER = "| Checkpoint | Description | Last Updated |"
+# Archived entries record an Outcome where active ones have a Status
+SUMMARY_FIELDS = ("Problem", "Scope", "Status", "Outcome")
+# "*No active checkpoints.*" (the template) or plain "No active checkpoints."
+EMPTY_STATE = re.compile(r"^\*?No \w+ checkpoints")
+TITLE = re.compile(r"^# (\w+) Checkpoints\s*$")
+
+
+@dataclass
+class IndexRow:
+    """A quick reference table row and its verbatim line."""
+
+    checkpoint: str
+    description: str
+    last_updated: str
+    line: str
+
+
+@dataclass
+class IndexSection:
+    """A `## ` section: leading blank/`---` separator lines, heading, content."""
+
+    title: str
+    lead: list[str] = field(default_factory=list)
+    content: list[str] = field(default_factory=list)
+
+    def lines(self) -> list[str]:
+        """Return the lines of this section including its lead."""
+        return [*self.lead, f"## {self.title}", *self.content]
+
+    def fields(self) -> dict[str, str]:
+        """Return the **Problem**/**Scope**/**Status**/**Outcome** fields present in this section."""
+        fields = {}
+        for line in self.content:
+            for name in SUMMARY_FIELDS:
+                marker = f"**{name}**:"
+                if line.startswith(marker):
+                    fields[name] = line[len(marker):].strip()
+        return fields
+
+
+def is_summary_title(title: str) -> bool:
+    """Check if a `## ` heading names a checkpoint summary section."""
+    return title.startswith("chk-") or title.lower().startswith("checkpoint")
+
+
+def is_separator(line: str) -> bool:
+    """Check if a line only separates sections (blank or a `---` rule)."""
+    stripped = line.strip()
+    return not stripped or stripped == "---"
+
+
+class IndexFile:
+    """Parsed INDEX.md: table rows and summary sections keyed by checkpoint name.
+
+    The file is held as verbatim line groups: `head` (up to the table
+    separator), `rows`, `middle` (text between the table and the first
+    section), `sections` and `tail` (trailing separator lines). Sections own
+    the blank and `---` lines that precede their heading, so removing one
+    takes its separator with it.
+    """
+
+    def __init__(self, content: str) -> None:
+        lines = content.split("\n")
+
+        self.head: list[str] = []
+        self.rows: dict[str, IndexRow] = {}
+        self.duplicate_rows: list[str] = []
+        self.middle: list[str] = []
+        self.sections: dict[object, IndexSection] = {}
+        self.tail: list[str] = []
+        self.has_table = False
+
+        position = 0
+        for position, line in enumerate(lines):
+            if TABLE_HEADER in line.strip():
+                self.has_table = True
+                break
+        else:
+            position = len(lines)
+
+        if self.has_table:
+            # Header line, then the separator row if present
+            end = position + 1
+            if end < len(lines) and lines[end].strip().startswith("|") and "---" in lines[end]:
+                end += 1
+            self.head = lines[:end]
+            position = end
+            while position < len(lines):
+                stripped = lines[position].strip()
+                if not (stripped.startswith("|") and stripped.endswith("|")):
+                    break
+                self._parse_row(lines[position])
+                position += 1
+            rest = lines[position:]
+        else:
+            rest = lines
+
+        self._parse_sections(rest)
+
+    def _parse_row(self, line: str) -> None:
+        parts = [p.strip() for p in line.strip().split("|")]
+        if len(parts) < 5 or not parts[1] or parts[1] == "Checkpoint":
+            # Not a data row: keep it verbatim under a key no name can match
+            self.rows[object()] = IndexRow("", "", "", line)
+            return
+        row = IndexRow(parts[1], parts[2], parts[3], line)
+        if row.checkpoint in self.rows:
+            self.duplicate_rows.append(row.checkpoint)
+            self.rows[object()] = row
+        else:
+            self.rows[row.checkpoint] = row
+
+    def _parse_sections(self, lines: list[str]) -> None:
+        # Split at headings; trailing separator lines move to the next section
+        pending: list[str] = []
+        section: IndexSection | None = None
+
+        for line in lines:
+            if line.startswith("## ") or line.startswith("# "):
+                lead = self._take_separators(section.content if section else pending)
+                if line.startswith("## "):
+                    section = IndexSection(title=line[3:].strip(), lead=lead)
+                else:
+                    # Top-level headings are kept as opaque sections
+                    section = IndexSection(title="", lead=lead, content=[line])
+                key = section.title if section.title and is_summary_title(section.title) else object()
+                if key in self.sections:
+                    key = object()
+                self.sections[key] = section
+            elif section is None:
+                pending.append(line)
+            else:
+                section.content.append(line)
+
+        if section is None:
+            self.tail = self._take_separators(pending)
+            self.middle = pending
+        else:
+            self.middle = pending
+            self.tail = self._take_separators(section.content)
+
+    @staticmethod
+    def _take_separators(lines: list[str]) -> list[str]:
+        """Remove and return the trailing separator lines of a list."""
+        start = len(lines)
+        while start > 0 and is_separator(lines[start - 1]):
+            start -= 1
+        taken = lines[start:]
+        del lines[start:]
+        return taken
+
+    @classmethod
+    def load(cls, path: Path) -> "IndexFile":
+        """Parse an INDEX.md file.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        from chkcc import cache
+
+        if not path.exists():
+            raise FileNotFoundError(f"INDEX.md not found: {path}")
+        return cls(cache.read_text(path))
+
+    def save(self, path: Path) -> None:
+        """Write the serialized index back to path."""
+        from chkcc import atomic, cache
+
+        atomic.write_atomic(path, self.serialize())
+        cache.invalidate(path)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.rows or name in self.sections
+
+    def table_rows(self) -> list[IndexRow]:
+        """Return the data rows in table order (duplicates included)."""
+        return [row for row in self.rows.values() if row.checkpoint]
+
+    def summary_sections(self) -> dict[str, dict[str, str]]:
+        """Map each checkpoint summary section title to its fields."""
+        return {
+            section.title: section.fields()
+            for section in self.sections.values()
+            if section.title and is_summary_title(section.title)
+        }
+
+    def remove(self, name: str) -> bool:
+        """Remove every table row and summary section of a checkpoint.
+
+        Duplicates are removed too: they are stored under opaque keys, so
+        removal matches on the checkpoint name rather than the key.
+
+        Returns:
+            True if anything was removed
+        """
+        rows = [key for key, row in self.rows.items() if row.checkpoint == name]
+        sections = [key for key, section in self.sections.items() if section.title == name]
+        for key in rows:
+            del self.rows[key]
+        for key in sections:
+            del self.sections[key]
+        removed = bool(rows or sections)
+        if removed:
+            self._sync_empty_state()
+        return removed
+
+    def has_empty_state(self) -> bool:
+        """Check if the text after the table has an empty state message."""
+        return any(EMPTY_STATE.match(line.strip()) for line in self.middle)
+
+    def _sync_empty_state(self) -> None:
+        """Show the empty state message once the table has no rows."""
+        if not any(row.checkpoint for row in self.rows.values()) and not self.has_empty_state():
+            self.middle = ["", self.empty_state_message(), *self.middle]
+
+    def empty_state_message(self) -> str:
+        """Return the empty state line for this index's title."""
+        for line in self.head:
+            match = TITLE.match(line)
+            if match:
+                return f"*No {match.group(1).lower()} checkpoints.*"
+        return "*No active checkpoints.*"
+
+    def serialize(self) -> str:
+        """Return the INDEX.md text."""
+        lines = list(self.head)
+        lines.extend(row.line for row in self.rows.values())
+        lines.extend(self.middle)
+        for section in self.sections.values():
+            lines.extend(section.lines() if section.title else [*section.lead, *section.content])
+        lines.extend(self.tail)
+        content = "\n".join(lines)
+        if not content.endswith("\n"):
+            content += "\n"
+        return content
@@ -5,6 +5,8 @@ from importlib import resources
 from importlib.resources import abc as resources_abc
 from pathlib import Path
 
+from chkcc.atomic import write_atomic
+
 INDEX_TEMPLATE = """# {title} Checkpoints
 
 | Checkpoint | Description | Last Updated |
@@ -15,6 +17,11 @@ INDEX_TEMPLATE = """# {title} Checkpoints
 *No {status} checkpoints.*
 """
 
+# Local caches written next to the checkpoints (metadata index, etc.)
+GITIGNORE_TEMPLATE = """# chkcc caches (safe to delete, rebuilt on demand)
+.chkcc-*
+"""
+
 
 def create_directory_structure(base_dir: Path) -> list[str]:
     """Create checkpoints directory structure. Returns list of created paths."""
@@ -39,16 +46,28 @@ def create_index_files(base_dir: Path) -> list[str]:
     archive_index = base_dir / "archive" / "INDEX.md"
 
     if not active_index.exists():
-        active_index.write_text(INDEX_TEMPLATE.format(title="Active", status="active"))
+        write_atomic(active_index, INDEX_TEMPLATE.format(title="Active", status="active"))
         created.append(str(active_index))
 
     if not archive_index.exists():
-        archive_index.write_text(INDEX_TEMPLATE.format(title="Archived", status="archived"))
+        write_atomic(archive_index, INDEX_TEMPLATE.format(title="Archived", status="archived"))
         created.append(str(archive_index))
 
     return created
 
 
+def create_gitignore(base_dir: Path) -> list[str]:
+    """Create .gitignore for chkcc cache files. Returns list of created paths."""
+    created = []
+
+    gitignore = base_dir / ".gitignore"
+    if base_dir.exists() and not gitignore.exists():
+        write_atomic(gitignore, GITIGNORE_TEMPLATE)
+        created.append(str(gitignore))
+
+    return created
+
+
 def install_skill_files(project_root: Path) -> list[str]:
     """
     Copy all files from package chkcc/data/skill/ to .claude/skills/coihuin-compress/.
@@ -70,7 +89,7 @@ def install_skill_files(project_root: Path) -> list[str]:
             if item.is_file():
                 target_path = skills_dir / rel_path
                 target_path.parent.mkdir(parents=True, exist_ok=True)
-                target_path.write_bytes(item.read_bytes())
+                write_atomic(target_path, item.read_bytes())
                 created.append(str(target_path))
             elif item.is_dir():
                 traverse(item, rel_path)
@@ -129,7 +148,7 @@ def install_hooks(project_root: Path) -> list[tuple[bool, str]]:
         results.append((False, "SessionStart hook already installed"))
 
     # Write back settings
-    settings_path.write_text(json.dumps(settings, indent=2) + "\n")
+    write_atomic(settings_path, json.dumps(settings, indent=2) + "\n")
 
     return results
 
@@ -146,6 +165,7 @@ def cmd_init(base_dir: Path, project_root: Path) -> None:
 
     # Create INDEX files
     created_files = create_index_files(base_dir)
+    created_files += create_gitignore(base_dir)
     for f in created_files:
         print(f"  Created: {f}")
 
@@ -0,0 +1,264 @@
+"""
+Checkpoint lineage graph for coihuin-compress.
+
+A Lineage is built once from a scan: parent and children maps, the depth of
+every checkpoint and a pre-order (Euler tour) numbering in which each subtree
+occupies a contiguous interval. With the intervals, "is A an ancestor of B"
+is two integer comparisons, the descendants of a checkpoint are a slice of
+the pre-order, and subtree sizes need no traversal.
+
+Building the graph also finds what makes it not a forest, in linear time:
+duplicate ids (the first scanned checkpoint wins; active/ is scanned before
+archive/), dangling parents (the checkpoint is shown as a root) and parent
+cycles (broken at their oldest checkpoint, which is shown as a root). Other
+checkpoints sharing a duplicate id are left out of the graph and the
+rendered tree; they only appear in the problem report, which `tree`,
+`validate` and `doctor` print.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from chkcc.tree import Checkpoint, format_date, require_directory, scan_checkpoints
+
+
+def describe(checkpoint: Checkpoint) -> str:
+    """Return "active/chk-x.md"-style location of a checkpoint for messages."""
+    return (Path(checkpoint.path.parent.name) / checkpoint.path.name).as_posix()
+
+
+@dataclass
+class LineageProblems:
+    """Ways the parent links fail to form a forest."""
+
+    # Id -> every checkpoint using it, the one kept in the graph first
+    duplicates: dict[str, list[Checkpoint]] = field(default_factory=dict)
+    # Checkpoints whose parent id matches no checkpoint
+    dangling: list[Checkpoint] = field(default_factory=list)
+    # Each cycle starts at the checkpoint where it was broken, then follows parents
+    cycles: list[list[Checkpoint]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.duplicates or self.dangling or self.cycles)
+
+    def errors(self) -> list[str]:
+        """Describe duplicate ids and cycles (the graph is wrong)."""
+        messages = [
+            f"Duplicate checkpoint id '{checkpoint_id}': "
+            + ", ".join(describe(cp) for cp in checkpoints)
+            + f" (using {describe(checkpoints[0])})"
+            for checkpoint_id, checkpoints in self.duplicates.items()
+        ]
+        messages.extend(
+            "Parent cycle: " + " -> ".join(cp.id for cp in cycle + cycle[:1])
+            + f" (showing {cycle[0].id} as a root)"
+            for cycle in self.cycles
+        )
+        return messages
+
+    def warnings(self) -> list[str]:
+        """Describe dangling parents (often an archive that was deleted)."""
+        return [
+            f"Unknown parent '{cp.parent}' of {cp.id} ({describe(cp)}), shown as a root"
+            for cp in self.dangling
+        ]
+
+
+def print_lineage_problems(problems: LineageProblems, status_filter: str = "all") -> None:
+    """Warn on stderr about duplicate ids, parent cycles and dangling parents.
+
+    Args:
+        problems: LineageProblems of the scanned checkpoints
+        status_filter: Scan filter; with 'active' or 'archive' a parent in
+            the other directory looks dangling, so those aren't reported
+    """
+    import sys
+
+    messages = problems.errors()
+    if status_filter == "all":
+        messages += problems.warnings()
+    for message in messages:
+        print(f"Warning: {message}", file=sys.stderr)
+    if messages:
+        print("Run 'chkcc validate <checkpoints dir>' for the full report.", file=sys.stderr)
+
+
+class Lineage:
+    """Parent/child graph over scanned checkpoints with interval indexes."""
+
+    def __init__(self, checkpoints: list[Checkpoint]) -> None:
+        """Index checkpoints; O(n log n) for sorting siblings, O(n) otherwise.
+
+        Args:
+            checkpoints: Checkpoints from scan_checkpoints (any order)
+        """
+        self.problems = LineageProblems()
+        self.by_id: dict[str, Checkpoint] = {}
+        for cp in checkpoints:
+            kept = self.by_id.setdefault(cp.id, cp)
+            if kept is not cp:
+                self.problems.duplicates.setdefault(cp.id, [kept]).append(cp)
+
+        # Effective parent of each kept checkpoint: None for roots, dangling
+        # parents and the checkpoint where a cycle is broken
+        self.parent: dict[str, str | None] = {}
+        for cp in self.by_id.values():
+            if cp.parent is not None and cp.parent not in self.by_id:
+                self.problems.dangling.append(cp)
+            self.parent[cp.id] = cp.parent if cp.parent in self.by_id else None
+        self._break_cycles()
+
+        # parent_id -> children sorted oldest first; None holds the roots
+        self.children: dict[str | None, list[Checkpoint]] = {}
+        for cp in self.by_id.values():
+            self.children.setdefault(self.parent[cp.id], []).append(cp)
+        for siblings in self.children.values():
+            siblings.sort(key=lambda c: c.created or datetime.min)
+
+        # Pre-order walk with an explicit stack; a checkpoint's subtree is
+        # order[start[id]:end[id]]
+        self.order: list[Checkpoint] = []
+        self.depth: dict[str, int] = {}
+        self._start: dict[str, int] = {}
+        self._end: dict[str, int] = {}
+        stack: list[tuple[Checkpoint, int, bool]] = [
+            (root, 0, False) for root in reversed(self.children.get(None, []))
+        ]
+        while stack:
+            node, depth, leaving = stack.pop()
+            if leaving:
+                self._end[node.id] = len(self.order)
+                continue
+            self._start[node.id] = len(self.order)
+            self.depth[node.id] = depth
+            self.order.append(node)
+            stack.append((node, depth, True))
+            stack.extend((child, depth + 1, False) for child in reversed(self.children.get(node.id, [])))
+
+    def _break_cycles(self) -> None:
+        """Find parent cycles in O(n) and make the oldest checkpoint of each a root.
+
+        Every checkpoint has at most one parent, so following parents from
+        any start either ends at a root, reaches a checkpoint already walked,
+        or comes back onto the current walk: that last case is a cycle.
+        """
+        done: set[str] = set()
+        for start in self.by_id:
+            walk: dict[str, int] = {}  # id -> position on the current walk
+            node = start
+            while node is not None and node not in done and node not in walk:
+                walk[node] = len(walk)
+                node = self.parent[node]
+            if node is not None and node in walk:
+                ids = list(walk)[walk[node]:]
+                cycle = [self.by_id[checkpoint_id] for checkpoint_id in ids]
+                entry = min(range(len(cycle)), key=lambda n: (cycle[n].created or datetime.min, cycle[n].id))
+                self.parent[cycle[entry].id] = None
+                self.problems.cycles.append(cycle[entry:] + cycle[:entry])
+            done.update(walk)
+
+    def __contains__(self, checkpoint_id: str) -> bool:
+        return checkpoint_id in self.by_id
+
+    def get(self, checkpoint_id: str) -> Checkpoint:
+        """Return the checkpoint with an id.
+
+        Raises:
+            ValueError: If no scanned checkpoint has this id
+        """
+        checkpoint = self.by_id.get(checkpoint_id)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint with id '{checkpoint_id}'")
+        return checkpoint
+
+    def parent_of(self, checkpoint_id: str) -> Checkpoint | None:
+        """Return the parent checkpoint, or None for a root."""
+        self.get(checkpoint_id)
+        parent = self.parent[checkpoint_id]
+        return self.by_id[parent] if parent is not None else None
+
+    def children_of(self, checkpoint_id: str) -> list[Checkpoint]:
+        """Return the direct children, oldest first."""
+        return self.children.get(checkpoint_id, [])
+
+    def is_ancestor(self, ancestor_id: str, descendant_id: str) -> bool:
+        """Check in O(1) whether ancestor_id is a proper ancestor of descendant_id."""
+        start = self._start.get(ancestor_id)
+        position = self._start.get(descendant_id)
+        if start is None or position is None or ancestor_id == descendant_id:
+            return False
+        return start < position < self._end[ancestor_id]
+
+    def subtree_size(self, checkpoint_id: str) -> int:
+        """Return the number of checkpoints in a subtree, itself included."""
+        self.get(checkpoint_id)
+        return self._end.get(checkpoint_id, 0) - self._start.get(checkpoint_id, 0)
+
+    def ancestors(self, checkpoint_id: str) -> list[Checkpoint]:
+        """Return the ancestors, parent first and root last."""
+        result = []
+        node = self.parent_of(checkpoint_id)
+        while node is not None:
+            result.append(node)
+            node = self.parent_of(node.id)
+        return result
+
+    def path(self, checkpoint_id: str) -> list[Checkpoint]:
+        """Return the checkpoints from the root down to checkpoint_id."""
+        return self.ancestors(checkpoint_id)[::-1] + [self.get(checkpoint_id)]
+
+    def descendants(self, checkpoint_id: str) -> list[Checkpoint]:
+        """Return every descendant in pre-order (each parent before its children)."""
+        self.get(checkpoint_id)
+        start = self._start.get(checkpoint_id)
+        if start is None:
+            return []
+        return self.order[start + 1:self._end[checkpoint_id]]
+
+
+def load_lineage(base_dir: Path, jobs: int = 1) -> Lineage:
+    """Scan active/ and archive/ and build their Lineage.
+
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+        NotADirectoryError: If path is not a directory
+    """
+    require_directory(base_dir)
+    lineage = Lineage(scan_checkpoints(base_dir, jobs=jobs))
+    print_lineage_problems(lineage.problems)
+    return lineage
+
+
+def query(lineage: Lineage, checkpoint_id: str, mode: str) -> list[tuple[Checkpoint, int]]:
+    """Return the checkpoints selected by a lineage query with their depths.
+
+    Args:
+        lineage: Lineage to query
+        checkpoint_id: Checkpoint the query starts from
+        mode: 'ancestors' (parent first), 'descendants' (pre-order) or
+            'path' (root first, ending with checkpoint_id)
+
+    Raises:
+        ValueError: If the checkpoint or the mode is unknown
+    """
+    if mode == "ancestors":
+        selected = lineage.ancestors(checkpoint_id)
+    elif mode == "descendants":
+        selected = lineage.descendants(checkpoint_id)
+    elif mode == "path":
+        selected = lineage.path(checkpoint_id)
+    else:
+        raise ValueError(f"Unknown lineage query: {mode}")
+    return [(cp, lineage.depth.get(cp.id, 0)) for cp in selected]
+
+
+def print_query(results: list[tuple[Checkpoint, int]], mode: str) -> None:
+    """Print query results; descendants and paths are indented by depth."""
+    if not results:
+        print(f"(no {mode})")
+        return
+    base_depth = min(depth for _, depth in results)
+    for cp, depth in results:
+        indent = "" if mode == "ancestors" else "  " * (depth - base_depth)
+        print(f"{indent}{cp.id} ({format_date(cp.created)}) [{cp.display_status}]")
@@ -0,0 +1,129 @@
+"""
+Cross-process locking for coihuin-compress.
+
+Read-modify-write operations (setting the current checkpoint, appending a
+delta, archiving, updating INDEX.md and LEARNINGS.md) hold an advisory
+`fcntl.flock` on `checkpoints/.chkcc-lock`, so concurrent sessions working on
+the same checkpoints directory serialize instead of interleaving. One lock
+covers the whole directory because several operations touch more than one
+file (clear-then-set current, archive moving files and rewriting INDEX.md).
+
+The lock is reentrant within a process, so locked operations can call each
+other. Waiting gives up after a timeout: CHKCC_LOCK_TIMEOUT seconds if set
+(`chkcc --lock-timeout` sets it), otherwise DEFAULT_TIMEOUT. On platforms
+without fcntl the lock only serializes threads of the current process.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+LOCK_FILENAME = ".chkcc-lock"
+DEFAULT_TIMEOUT = 30.0
+TIMEOUT_ENV = "CHKCC_LOCK_TIMEOUT"
+POLL_INTERVAL = 0.01
+
+_thread_lock = threading.RLock()
+# Locks held by this process: (st_dev, st_ino) of the lock file -> [fd, depth]
+_held: dict[tuple[int, int], list[int]] = {}
+
+
+class LockTimeout(TimeoutError):
+    """Raised when the checkpoints lock can't be acquired in time."""
+
+
+def lock_dir_for(directory: Path) -> Path:
+    """Return the checkpoints directory whose lock guards files in directory.
+
+    Files in active/ or archive/ are guarded by the lock of their parent.
+    """
+    if directory.name in ("active", "archive"):
+        return directory.parent
+    return directory
+
+
+def get_timeout() -> float:
+    """Return the lock timeout in seconds from the environment or the default."""
+    try:
+        return float(os.environ[TIMEOUT_ENV])
+    except (KeyError, ValueError):
+        return DEFAULT_TIMEOUT
+
+
+@contextmanager
+def locked(base_dir: Path, timeout: float | None = None) -> Iterator[None]:
+    """Hold the exclusive lock of a checkpoints directory.
+
+    Args:
+        base_dir: Checkpoints directory (the lock file is created in it)
+        timeout: Seconds to wait; None uses get_timeout()
+
+    Raises:
+        LockTimeout: If another process holds the lock for longer than timeout
+        FileNotFoundError: If base_dir doesn't exist
+    """
+    if timeout is None:
+        timeout = get_timeout()
+    deadline = time.monotonic() + timeout
+
+    if not _thread_lock.acquire(timeout=max(timeout, 0)):
+        raise LockTimeout(f"Timed out after {timeout:g}s waiting for lock on {base_dir}")
+
+    key = None
+    try:
+        try:
+            fd = os.open(os.path.join(base_dir, LOCK_FILENAME), os.O_RDWR | os.O_CREAT, 0o666)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Checkpoints directory not found: {base_dir}") from None
+        stat_result = os.fstat(fd)
+        key = (stat_result.st_dev, stat_result.st_ino)
+
+        if key in _held:
+            # Reentrant acquire: the process already holds this lock
+            os.close(fd)
+            _held[key][1] += 1
+        else:
+            try:
+                _acquire(fd, deadline, timeout, base_dir)
+            except BaseException:
+                os.close(fd)
+                key = None
+                raise
+            _held[key] = [fd, 1]
+
+        yield
+    finally:
+        try:
+            if key is not None:
+                entry = _held[key]
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del _held[key]
+                    # Closing the descriptor releases the flock
+                    os.close(entry[0])
+        finally:
+            _thread_lock.release()
+
+
+def _acquire(fd: int, deadline: float, timeout: float, base_dir: Path) -> None:
+    if fcntl is None:
+        return
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                raise LockTimeout(
+                    f"Timed out after {timeout:g}s waiting for lock on {base_dir} "
+                    f"(another chkcc process is writing)"
+                ) from None
+            time.sleep(POLL_INTERVAL)
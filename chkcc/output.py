@@ -0,0 +1,107 @@
+"""
+Machine-readable output for coihuin-compress.
+
+Converts checkpoints and validation reports to plain dicts and writes them
+as a single JSON document or as NDJSON (one record per line, flushed as each
+record is produced so consumers can pipe results while a scan is running).
+"""
+
+import json
+import sys
+from typing import Iterable, TextIO
+
+from chkcc.tree import Checkpoint
+from chkcc.validate import FileReport, ValidationResult
+
+
+def checkpoint_record(checkpoint: Checkpoint, **extra) -> dict:
+    """Convert a Checkpoint to a JSON-serializable dict.
+
+    Args:
+        checkpoint: Checkpoint to convert
+        **extra: Additional fields to include (e.g. depth)
+
+    Returns:
+        Dict with the Checkpoint fields plus display_status
+    """
+    record = {
+        "id": checkpoint.id,
+        "created": checkpoint.created.isoformat() if checkpoint.created else None,
+        "parent": checkpoint.parent,
+        "path": str(checkpoint.path),
+        "status": checkpoint.status,
+        "display_status": checkpoint.display_status,
+        "is_archived": checkpoint.is_archived,
+        "problem": checkpoint.problem,
+        "next_action": checkpoint.next_action,
+    }
+    record.update(extra)
+    return record
+
+
+def result_record(result: ValidationResult) -> dict:
+    """Convert a ValidationResult to a JSON-serializable dict."""
+    return {
+        "valid": result.valid,
+        "errors": result.errors,
+        "structural_warnings": result.structural_warnings,
+        "advisory_warnings": result.advisory_warnings,
+    }
+
+
+def report_record(report: FileReport) -> dict:
+    """Convert a validation FileReport to a JSON-serializable dict.
+
+    Files that could not be validated have valid=False and an error message
+    instead of result lists.
+    """
+    record = {"path": str(report.path), "type": report.file_type}
+    if report.result is None:
+        record.update(valid=False, error=report.error)
+    else:
+        record.update(result_record(report.result))
+    return record
+
+
+def write_records(records: Iterable[dict], output_format: str, stream: TextIO | None = None) -> None:
+    """Write records as a JSON array or as NDJSON.
+
+    Args:
+        records: Records to write; consumed lazily for NDJSON
+        output_format: 'json' or 'ndjson'
+        stream: Output stream (default: sys.stdout)
+
+    Raises:
+        ValueError: If output_format is not 'json' or 'ndjson'
+    """
+    stream = stream or sys.stdout
+    if output_format == "json":
+        json.dump(list(records), stream, indent=2, ensure_ascii=False)
+        stream.write("\n")
+    elif output_format == "ndjson":
+        for record in records:
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            stream.flush()
+    else:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+
+def write_record(record: dict | None, output_format: str, stream: TextIO | None = None) -> None:
+    """Write a single record (or null) as JSON or as one NDJSON line.
+
+    Args:
+        record: Record to write, or None
+        output_format: 'json' or 'ndjson'
+        stream: Output stream (default: sys.stdout)
+
+    Raises:
+        ValueError: If output_format is not 'json' or 'ndjson'
+    """
+    stream = stream or sys.stdout
+    if output_format == "json":
+        json.dump(record, stream, indent=2, ensure_ascii=False)
+    elif output_format == "ndjson":
+        json.dump(record, stream, ensure_ascii=False)
+    else:
+        raise ValueError(f"Unknown output format: {output_format}")
+    stream.write("\n")
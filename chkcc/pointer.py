@@ -0,0 +1,138 @@
+"""
+Current checkpoint pointer file for coihuin-compress.
+
+`checkpoints/.chkcc-current` records the path of the checkpoint marked
+`status: current`, relative to the checkpoints directory, or is empty when no
+checkpoint is current. chkcc updates it together with the frontmatter under
+the checkpoints lock, so switching the current checkpoint never needs a scan.
+A missing pointer means the state is unknown and is rebuilt by one scan.
+Frontmatter stays the source of truth: readers verify the pointed-to status,
+an empty pointer is only trusted while nothing in active/ is newer than it
+(so a hand edit to `status: current` is found), and `chkcc current --repair`
+reconciles the two after other hand edits.
+
+This module is on the SessionStart hot path, so it only imports `os` and
+`chkcc.atomic`, which itself only imports `os`.
+"""
+
+import os
+
+from chkcc.atomic import write_atomic
+
+POINTER_FILENAME = ".chkcc-current"
+
+
+def read_state(base_dir: str | os.PathLike) -> tuple[bool, str | None]:
+    """Read the pointer file, distinguishing "no current" from "unknown".
+
+    Args:
+        base_dir: Base checkpoints directory
+
+    Returns:
+        (known, path): known is False if the pointer is missing, unreadable,
+        points outside the checkpoints dir, or is empty but older than a file
+        in active/. If known, path is the pointed-to
+        checkpoint (joined with base_dir), or None if no checkpoint is current.
+    """
+    try:
+        with open(os.path.join(base_dir, POINTER_FILENAME), encoding="utf-8") as f:
+            relative = f.readline().strip()
+            written = os.fstat(f.fileno()).st_mtime_ns
+    except (OSError, UnicodeDecodeError):
+        return False, None
+
+    if not relative:
+        return not active_changed_since(base_dir, written), None
+    if os.path.isabs(relative) or ".." in relative.split("/"):
+        return False, None
+
+    return True, os.path.join(base_dir, *relative.split("/"))
+
+
+def active_changed_since(base_dir: str | os.PathLike, mtime_ns: int) -> bool:
+    """Check if active/ or a checkpoint in it was modified after mtime_ns.
+
+    Costs one stat per active checkpoint, far less than the scan it guards:
+    the directory mtime catches added and moved-in files, the file mtimes
+    catch edits in place. chkcc writes the pointer after the checkpoint, so
+    its own writes never count as newer.
+    """
+    active_dir = os.path.join(base_dir, "active")
+    try:
+        if os.stat(active_dir).st_mtime_ns > mtime_ns:
+            return True
+        with os.scandir(active_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md") and entry.stat().st_mtime_ns > mtime_ns:
+                    return True
+    except OSError:
+        return False
+    return False
+
+
+def read_pointer(base_dir: str | os.PathLike) -> str | None:
+    """Return the checkpoint path recorded in the pointer file.
+
+    Args:
+        base_dir: Base checkpoints directory
+
+    Returns:
+        Path to the pointed-to checkpoint (joined with base_dir), or None if
+        the pointer is missing, empty or points outside the checkpoints dir.
+    """
+    return read_state(base_dir)[1]
+
+
+def write_pointer(base_dir: str | os.PathLike, checkpoint_path: str | os.PathLike) -> None:
+    """Record checkpoint_path as the current checkpoint.
+
+    Best effort: a failed write leaves a stale pointer, which readers detect
+    by checking the target's frontmatter status.
+    """
+    relative = os.path.relpath(checkpoint_path, base_dir).replace(os.sep, "/")
+
+    try:
+        write_atomic(os.path.join(base_dir, POINTER_FILENAME), relative + "\n", durable=False)
+    except OSError:
+        pass
+
+
+def clear_pointer(base_dir: str | os.PathLike) -> None:
+    """Record that no checkpoint is current (an empty pointer file)."""
+    try:
+        write_atomic(os.path.join(base_dir, POINTER_FILENAME), "", durable=False)
+    except OSError:
+        pass
+
+
+def remove_pointer(base_dir: str | os.PathLike) -> None:
+    """Remove the pointer file, so the next lookup rebuilds it by scanning."""
+    try:
+        os.remove(os.path.join(base_dir, POINTER_FILENAME))
+    except OSError:
+        pass
+
+
+def read_header_status(checkpoint_path: str | os.PathLike) -> str | None:
+    """Read the frontmatter status of a checkpoint without parsing YAML.
+
+    Reads line by line and stops at the closing `---` fence, so the body of
+    large checkpoints is never loaded.
+
+    Returns:
+        The status value, 'active' if the frontmatter has no status field,
+        or None if the file is missing or has no frontmatter.
+    """
+    try:
+        with open(checkpoint_path, encoding="utf-8") as f:
+            if f.readline().rstrip() != "---":
+                return None
+            for line in f:
+                if line.rstrip() == "---":
+                    return "active"
+                if line.startswith("status:"):
+                    return line[len("status:"):].split("#", 1)[0].strip().strip("'\"")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    return None
@@ -0,0 +1,288 @@
+"""
+Prime command for coihuin-compress.
+
+`chkcc prime` runs from the SessionStart hook on every Claude session, so it
+has a dedicated fast path: the CLI dispatches here before building the
+argparse parser or importing any other subcommand, and the current checkpoint
+is resolved through the `.chkcc-current` pointer instead of a scan. The full
+lookup in `chkcc.current` is only imported when the pointer is missing or
+stale.
+
+Faster still, commands that change the current checkpoint (`current`,
+`scaffold`, `archive`, `compact`) write a ready-to-emit snapshot to
+`.chkcc-prime`. Its first line records the stat signatures (mtime, size,
+inode) of the pointer and of the checkpoint it was copied from; if both still
+match, prime is one small read and a write to stdout. A stale snapshot (e.g.
+the checkpoint was edited by hand) falls back to the lookup above, which
+rewrites it.
+
+`--budget N` emits only the highest-value sections that fit in N estimated
+tokens (see chkcc.budget). The rendering is cached in `.chkcc-prime-budget`,
+keyed by the checkpoint's mtime, size and inode, so repeat primes of an
+unchanged checkpoint read one small file and import nothing else.
+"""
+
+import os
+import sys
+
+from chkcc.atomic import write_atomic
+from chkcc.pointer import (
+    POINTER_FILENAME,
+    active_changed_since,
+    read_header_status,
+    read_pointer,
+    read_state,
+)
+
+DEFAULT_DIR = "./checkpoints"
+BUDGET_CACHE_FILENAME = ".chkcc-prime-budget"
+# Bump when the budgeted rendering changes, so old caches are ignored
+BUDGET_CACHE_VERSION = "1"
+SNAPSHOT_FILENAME = ".chkcc-prime"
+SNAPSHOT_VERSION = "v1"
+
+
+def find_current_path(base_dir: str) -> str | None:
+    """Return the path of the current checkpoint, or None if there is none.
+
+    Args:
+        base_dir: Base checkpoints directory (parent of active/)
+    """
+    pointed = read_pointer(base_dir)
+    if pointed is not None and read_header_status(pointed) == "current":
+        return pointed
+
+    # Slow path: scan active/ (also repairs the pointer for next time)
+    from pathlib import Path
+
+    from chkcc import current
+
+    checkpoint = current.get_current(Path(base_dir))
+    if checkpoint is None:
+        return None
+    return str(checkpoint.path)
+
+
+def stat_signature(path: str) -> str:
+    """Return "mtime_ns:size:inode" of a file, or "-" if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "-"
+    return f"{stat.st_mtime_ns}:{stat.st_size}:{stat.st_ino}"
+
+
+def read_snapshot(base_dir: str) -> str | None:
+    """Return the snapshot content if it matches the pointer and its source.
+
+    Returns:
+        The text to emit ('' when no checkpoint is current), or None if the
+        snapshot is missing or stale (for "no current", also if a file in
+        active/ changed since the pointer was written)
+    """
+    try:
+        with open(os.path.join(base_dir, SNAPSHOT_FILENAME), encoding="utf-8") as f:
+            parts = f.readline().rstrip("\n").split(" ", 3)
+            if len(parts) != 4 or parts[0] != SNAPSHOT_VERSION:
+                return None
+            _, pointer_signature, source_signature, relative = parts
+            if pointer_signature != stat_signature(os.path.join(base_dir, POINTER_FILENAME)):
+                return None
+            # "No current" holds only while active/ is no newer than the pointer
+            if not relative and active_changed_since(base_dir, int(pointer_signature.split(":")[0])):
+                return None
+            source = os.path.join(base_dir, relative) if relative else None
+            if source_signature != (stat_signature(source) if source else "-"):
+                return None
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def write_snapshot(
+    base_dir: str,
+    path: str | None,
+    content: str | None = None,
+    *,
+    pointer_signature: str | None = None,
+    source_signature: str | None = None,
+) -> None:
+    """Record what prime emits for the current pointer state.
+
+    Best effort: a failed write leaves a missing or stale snapshot, which
+    read_snapshot rejects. Signatures must be taken before the pointer and
+    the checkpoint are read, so a change racing with this call makes the
+    snapshot stale instead of wrong.
+
+    Args:
+        base_dir: Base checkpoints directory
+        path: Current checkpoint, or None if no checkpoint is current
+        content: Checkpoint text if already read (read from path otherwise)
+        pointer_signature: Pointer signature taken before it was read
+        source_signature: Checkpoint signature taken before content was read
+    """
+    snapshot_path = os.path.join(base_dir, SNAPSHOT_FILENAME)
+    try:
+        if pointer_signature is None:
+            pointer_signature = stat_signature(os.path.join(base_dir, POINTER_FILENAME))
+        if path is None:
+            source_signature, relative, content = "-", "", ""
+        else:
+            if content is None:
+                source_signature = stat_signature(path)
+                with open(path, encoding="utf-8") as f:
+                    content = f.read()
+            elif source_signature is None:
+                return
+            relative = os.path.relpath(path, base_dir).replace(os.sep, "/")
+        key = f"{SNAPSHOT_VERSION} {pointer_signature} {source_signature} {relative}\n"
+        write_atomic(snapshot_path, key + content, durable=False)
+    except (OSError, UnicodeDecodeError):
+        pass
+
+
+def remove_snapshot(base_dir: str) -> None:
+    """Delete the snapshot so the next prime takes the lookup path."""
+    try:
+        os.remove(os.path.join(base_dir, SNAPSHOT_FILENAME))
+    except OSError:
+        pass
+
+
+def refresh_snapshot(base_dir: str | os.PathLike, changed: str | os.PathLike | None = None) -> None:
+    """Rewrite the snapshot after chkcc changed the current checkpoint state.
+
+    Call after the pointer has been updated.
+
+    Args:
+        base_dir: Base checkpoints directory
+        changed: A checkpoint that was modified; the snapshot is only
+            rewritten if it is the current one
+    """
+    base_dir = os.fspath(base_dir)
+    known, pointed = read_state(base_dir)
+    if changed is not None and (
+        pointed is None or os.path.abspath(pointed) != os.path.abspath(changed)
+    ):
+        return
+
+    if not known or (pointed is not None and read_header_status(pointed) != "current"):
+        remove_snapshot(base_dir)
+    else:
+        write_snapshot(base_dir, pointed)
+
+
+def budgeted_content(base_dir: str, path: str, budget: int) -> str:
+    """Return the budgeted rendering of a checkpoint, from cache when fresh.
+
+    Args:
+        base_dir: Base checkpoints directory (holds the cache file)
+        path: Checkpoint file
+        budget: Token budget
+    """
+    stat = os.stat(path)
+    key = (
+        f"v{BUDGET_CACHE_VERSION} {budget} {stat.st_mtime_ns} {stat.st_size} {stat.st_ino} "
+        f"{os.path.relpath(path, base_dir)}\n"
+    )
+    cache_path = os.path.join(base_dir, BUDGET_CACHE_FILENAME)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            if f.readline() == key:
+                return f.read()
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    from chkcc.budget import render_budgeted
+
+    with open(path, encoding="utf-8") as f:
+        rendered = render_budgeted(f.read(), budget)
+    try:
+        write_atomic(cache_path, key + rendered, durable=False)
+    except OSError:
+        pass
+    return rendered
+
+
+def prime(base_dir: str, budget: int | None = None) -> int:
+    """Write the current checkpoint content to stdout.
+
+    Exits silently when there is no current checkpoint, so the hook never
+    produces noise in projects without checkpoints.
+
+    Args:
+        base_dir: Base checkpoints directory
+        budget: If given, emit only what fits in this many estimated tokens
+
+    Returns:
+        Exit code (always 0)
+    """
+    if budget is None:
+        content = read_snapshot(base_dir)
+        if content is not None:
+            sys.stdout.write(content)
+            return 0
+
+    pointer_signature = stat_signature(os.path.join(base_dir, POINTER_FILENAME))
+    path = find_current_path(base_dir)
+    if path is None:
+        # Without a pointer, "nothing is current" is only known after a scan
+        if budget is None and pointer_signature != "-" and os.path.isdir(base_dir):
+            write_snapshot(base_dir, None, pointer_signature=pointer_signature)
+        return 0
+
+    if budget is not None:
+        content = budgeted_content(base_dir, path, budget)
+    else:
+        source_signature = stat_signature(path)
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        write_snapshot(
+            base_dir, path, content,
+            pointer_signature=pointer_signature, source_signature=source_signature,
+        )
+    sys.stdout.write(content)  # Content is emitted verbatim, no extra newline
+    return 0
+
+
+def parse_args(argv: list[str]) -> tuple[str, int | None] | None:
+    """Parse `prime` arguments without argparse.
+
+    Args:
+        argv: Arguments after the `prime` subcommand
+
+    Returns:
+        (checkpoints directory, token budget or None), or None if argv needs
+        the full parser (e.g. --help, an unknown option or a bad budget).
+    """
+    base_dir = DEFAULT_DIR
+    budget = None
+    args = list(argv)
+    while args:
+        arg = args.pop(0)
+        if arg in ("--dir", "--budget") and args:
+            name, value = arg[2:], args.pop(0)
+        elif arg.startswith(("--dir=", "--budget=")):
+            name, value = arg[2:].split("=", 1)
+        else:
+            return None
+        if name == "dir":
+            base_dir = value
+        elif value.isdigit() and int(value) > 0:
+            budget = int(value)
+        else:
+            return None
+    return base_dir, budget
+
+
+def main(argv: list[str]) -> int | None:
+    """Fast-path entry point for `chkcc prime`.
+
+    Returns:
+        Exit code, or None to fall back to the regular argparse dispatch.
+    """
+    options = parse_args(argv)
+    if options is None:
+        return None
+    base_dir, budget = options
+    return prime(os.path.abspath(os.path.expanduser(base_dir)), budget)
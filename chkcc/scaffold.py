@@ -8,7 +8,7 @@ templates, enabling quick creation of properly structured checkpoint files.
 from datetime import datetime, timezone
 from pathlib import Path
 
-from chkcc import current
+from chkcc import atomic, cache, current, lock, pointer, prime
 
 
 def get_timestamp() -> str:
@@ -92,13 +92,17 @@ def get_checkpoint_template(
     return template
 
 
-def get_delta_template() -> str:
+def get_delta_template(timestamp: str | None = None) -> str:
     """Generate a delta markdown template to append to existing checkpoint.
 
+    Args:
+        timestamp: Delta timestamp (defaults to now)
+
     Returns:
         Markdown string with delta template including HTML guidance comments
     """
-    timestamp = get_timestamp()
+    if timestamp is None:
+        timestamp = get_timestamp()
 
     template = f"""
 
@@ -177,43 +181,100 @@ def scaffold_checkpoint(
     filename = f"{normalized_name}.md"
     file_path = output_dir / filename
 
-    if file_path.exists():
-        raise FileExistsError(f"Checkpoint already exists: {file_path}")
+    with lock.locked(lock.lock_dir_for(output_dir)):
+        if file_path.exists():
+            raise FileExistsError(f"Checkpoint already exists: {file_path}")
 
-    # Normalize and validate parent if specified
-    normalized_parent = None
-    if parent:
-        normalized_parent = normalize_checkpoint_name(parent)
-        parent_path = output_dir / f"{normalized_parent}.md"
-        if not parent_path.exists():
-            raise FileNotFoundError(f"Parent checkpoint not found: {parent_path}")
+        # Normalize and validate parent if specified
+        normalized_parent = None
+        if parent:
+            normalized_parent = normalize_checkpoint_name(parent)
+            parent_path = output_dir / f"{normalized_parent}.md"
+            if not parent_path.exists():
+                raise FileNotFoundError(f"Parent checkpoint not found: {parent_path}")
 
-    # Generate template content
-    template = get_checkpoint_template(normalized_name, normalized_parent, anchor)
+        # Generate template content
+        template = get_checkpoint_template(normalized_name, normalized_parent, anchor)
 
-    # Write the file with explicit encoding
-    file_path.write_text(template, encoding="utf-8")
+        # Write the file with explicit encoding
+        atomic.write_atomic(file_path, template)
 
-    # Handle set_current flag
-    if set_current:
-        # Resolve base_dir from output_dir
-        # If output_dir is .../checkpoints/active, base_dir is .../checkpoints
-        base_dir = output_dir.parent
+        # Handle set_current flag
+        if set_current:
+            # Resolve base_dir from output_dir
+            # If output_dir is .../checkpoints/active, base_dir is .../checkpoints
+            base_dir = output_dir.parent
 
-        # Clear any existing current checkpoint first
-        current.clear_current(base_dir)
+            # Clear any existing current checkpoint first
+            current.clear_current(base_dir)
 
-        # Set the status to current in the file we just created
-        current.update_frontmatter_status(file_path, "current")
+            # Set the status to current in the file we just created
+            current.update_frontmatter_status(file_path, "current")
+            pointer.write_pointer(base_dir, file_path)
+            prime.refresh_snapshot(base_dir)
 
     return file_path
 
 
+def read_frontmatter_block(checkpoint_path: Path) -> bytes:
+    """Read a checkpoint's frontmatter block without reading its body.
+
+    Args:
+        checkpoint_path: Path to the checkpoint file
+
+    Returns:
+        The raw bytes from the opening `---` line through the closing one
+
+    Raises:
+        ValueError: If the file has no frontmatter or it is never closed
+    """
+    with open(checkpoint_path, "rb") as f:
+        first = f.readline()
+        if first.rstrip(b"\r\n") != b"---":
+            raise ValueError(f"Invalid checkpoint format (missing frontmatter): {checkpoint_path}")
+        block = [first]
+        for line in f:
+            block.append(line)
+            if line.rstrip(b"\r\n") == b"---":
+                return b"".join(block)
+    raise ValueError(f"Invalid checkpoint format (unclosed frontmatter): {checkpoint_path}")
+
+
+def set_frontmatter_field(block: bytes, field: str, value: str) -> bytes:
+    """Set a field in a raw frontmatter block, adding it before the closing fence.
+
+    Args:
+        block: Frontmatter bytes as returned by read_frontmatter_block
+        field: Field name
+        value: New value
+
+    Returns:
+        The updated block; same length as block if the field existed with a
+        value of the same width
+    """
+    lines = block.decode("utf-8").split("\n")
+    # lines[0] is the opening fence; the closing fence is the last "---" line
+    closing = max(n for n, line in enumerate(lines) if line.rstrip("\r") == "---")
+    for n in range(1, closing):
+        if lines[n].startswith(f"{field}:"):
+            lines[n] = f"{field}: {value}"
+            break
+    else:
+        lines.insert(closing, f"{field}: {value}")
+    return "\n".join(lines).encode("utf-8")
+
+
 def scaffold_delta(checkpoint_path: Path) -> None:
     """Append a delta section to an existing checkpoint file.
 
     Updates the `last_delta` field in frontmatter and appends the delta template.
 
+    The body is never loaded: when `last_delta` already exists and the file
+    doesn't end in blank lines, the delta is appended and the fixed-width
+    timestamp is patched in place, so the cost doesn't grow with the
+    checkpoint. Otherwise (e.g. the first delta) the file is rewritten once by
+    streaming it into an atomic replacement, dropping the trailing blank lines.
+
     Args:
         checkpoint_path: Path to the existing checkpoint file
 
@@ -224,47 +285,64 @@ def scaffold_delta(checkpoint_path: Path) -> None:
     if not checkpoint_path.exists():
         raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
 
-    # Read existing content with explicit encoding
-    existing_content = checkpoint_path.read_text(encoding="utf-8")
-
-    # Validate frontmatter exists
-    if not existing_content.startswith("---"):
-        raise ValueError(f"Invalid checkpoint format (missing frontmatter): {checkpoint_path}")
-
-    # Find end of frontmatter
-    end_marker = existing_content.find("\n---", 3)
-    if end_marker == -1:
-        raise ValueError(f"Invalid checkpoint format (unclosed frontmatter): {checkpoint_path}")
-
-    # Extract frontmatter and body
-    frontmatter = existing_content[4:end_marker]  # Skip opening "---\n"
-    body = existing_content[end_marker + 4:]  # Skip "\n---"
-
-    # Update or add last_delta in frontmatter
-    timestamp = get_timestamp()
-    lines = frontmatter.split("\n")
-    updated_lines = []
-    found_last_delta = False
-
-    for line in lines:
-        if line.startswith("last_delta:"):
-            updated_lines.append(f"last_delta: {timestamp}")
-            found_last_delta = True
+    with lock.locked(lock.lock_dir_for(checkpoint_path.parent)):
+        header = read_frontmatter_block(checkpoint_path)
+
+        # Update or add last_delta in frontmatter
+        timestamp = get_timestamp()
+        new_header = set_frontmatter_field(header, "last_delta", timestamp)
+
+        # Exactly one newline separates the content from the delta, however
+        # many (if any) the file ends with
+        size = checkpoint_path.stat().st_size
+        body_end = size - count_trailing_newlines(checkpoint_path, size)
+        delta = b"\n" + get_delta_template(timestamp).encode("utf-8")
+
+        if len(new_header) == len(header) and body_end >= size - 1:
+            if body_end == size - 1:
+                delta = delta[1:]
+            # Append first: a crash in between leaves a stale last_delta, not
+            # a last_delta pointing at a missing delta
+            atomic.append_in_place(checkpoint_path, delta)
+            if new_header != header:
+                atomic.patch_in_place(checkpoint_path, 0, header, new_header)
         else:
-            updated_lines.append(line)
-
-    if not found_last_delta:
-        updated_lines.append(f"last_delta: {timestamp}")
-
-    # Reconstruct content with updated frontmatter
-    new_frontmatter = "\n".join(updated_lines)
-    updated_content = f"---\n{new_frontmatter}\n---{body}"
-
-    # Generate delta template
-    delta = get_delta_template()
-
-    # Append delta to content
-    new_content = updated_content.rstrip("\n") + "\n" + delta
-
-    # Write back with explicit encoding
-    checkpoint_path.write_text(new_content, encoding="utf-8")
+            if body_end < len(header):
+                # Nothing but blank lines after the frontmatter
+                new_header = new_header.rstrip(b"\n")
+                body_end = len(header)
+            atomic.write_atomic_chunks(
+                checkpoint_path,
+                stream_replaced_header(checkpoint_path, len(header), new_header, body_end, delta),
+            )
+        cache.invalidate(checkpoint_path)
+        prime.refresh_snapshot(lock.lock_dir_for(checkpoint_path.parent), changed=checkpoint_path)
+
+
+def count_trailing_newlines(path: Path, size: int) -> int:
+    """Count the newline bytes at the end of a file, reading backwards from size."""
+    count = 0
+    with open(path, "rb") as f:
+        end = size
+        while end > 0:
+            start = max(end - atomic.CHUNK_SIZE, 0)
+            f.seek(start)
+            chunk = f.read(end - start)
+            stripped = chunk.rstrip(b"\n")
+            count += len(chunk) - len(stripped)
+            if stripped:
+                break
+            end = start
+    return count
+
+
+def stream_replaced_header(path: Path, header_size: int, header: bytes, body_end: int, suffix: bytes):
+    """Yield header, the bytes of path from header_size to body_end in chunks, then suffix."""
+    yield header
+    with open(path, "rb") as f:
+        f.seek(header_size)
+        remaining = body_end - header_size
+        while remaining > 0 and (chunk := f.read(min(atomic.CHUNK_SIZE, remaining))):
+            remaining -= len(chunk)
+            yield chunk
+    yield suffix
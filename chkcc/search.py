@@ -0,0 +1,406 @@
+"""
+Full-text search over checkpoints for coihuin-compress.
+
+`chkcc search` answers "where did we decide X" without grepping the archive.
+Checkpoints in active/ and archive/ and the entries of LEARNINGS.md are kept
+in a SQLite FTS5 index, `.chkcc-search.db` at the root of the checkpoints
+directory. Each checkpoint is one row split into section-aware columns
+(Problem, Decisions, Artifact Trail, Learnings and the rest of the body), so
+matches in the sections that record decisions rank above passing mentions.
+Results are ordered by bm25 with per-column weights.
+
+Before every search the index is brought up to date: files are compared by
+path, mtime and size, and only new or changed files are re-read; rows of
+deleted or moved files are dropped. Like `.chkcc-index`, the database is a
+cache that is safe to delete at any time.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from chkcc import cache, lock
+from chkcc.document import HTML_COMMENT, Document, parse_document
+from chkcc.index import RACY_WINDOW_NS
+
+SEARCH_FILENAME = ".chkcc-search.db"
+# Bump when the schema or the column extraction changes; old databases are rebuilt
+SCHEMA_VERSION = 2
+LEARNINGS_FILENAME = "LEARNINGS.md"
+
+# Searchable columns, in table order, with their bm25 weights
+FIELDS = {
+    "problem": 4.0,
+    "decisions": 4.0,
+    "artifacts": 2.0,
+    "learnings": 3.0,
+    "body": 1.0,
+}
+# Query prefixes accepted for each column (e.g. `decisions:jwt`)
+FIELD_ALIASES = {
+    "problem": "problem",
+    "decision": "decisions",
+    "decisions": "decisions",
+    "artifact": "artifacts",
+    "artifacts": "artifacts",
+    "learning": "learnings",
+    "learnings": "learnings",
+    "body": "body",
+}
+SNIPPET_TOKENS = 12
+
+TERM = re.compile(r'(?:(\w+):)?("[^"]*"|\S+)')
+LEARNINGS_HEADING = re.compile(r"^\S+\s+[—-]\s+(\S+)\s*$")
+
+
+@dataclass
+class SearchResult:
+    """A matching checkpoint or LEARNINGS.md entry."""
+
+    checkpoint: str
+    kind: str  # 'active', 'archive' or 'learnings'
+    path: Path
+    score: float
+    snippet: str
+
+
+def section_fields(document: Document) -> dict[str, str]:
+    """Split a checkpoint body into the searchable columns.
+
+    Problem sections, Decisions subsections, Artifact Trail (or delta
+    Artifacts) subsections and Completion sections get their own columns,
+    wherever they appear, so deltas count too. All other lines go to body.
+    Template guidance comments are dropped so they don't match every
+    scaffolded checkpoint.
+
+    Args:
+        document: Parsed checkpoint body
+
+    Returns:
+        Dict mapping every column in FIELDS to its text
+    """
+    spans: dict[str, list[tuple[int, int]]] = {name: [] for name in FIELDS}
+    for section in document.sections:
+        title = section.title.lower()
+        if "problem" in title:
+            spans["problem"].append((section.start, section.end))
+        elif "completion" in title:
+            spans["learnings"].append((section.start, section.end))
+        for subsection in section.subsections:
+            title = subsection.title.lower()
+            if "decision" in title:
+                spans["decisions"].append((subsection.start, subsection.end))
+            elif "artifact" in title:
+                spans["artifacts"].append((subsection.start, subsection.end))
+
+    assigned = [False] * len(document.lines)
+    fields = {}
+    for name, ranges in spans.items():
+        lines = []
+        for start, end in ranges:
+            # The heading line itself is structure, not content
+            lines.extend(document.lines[start + 1:end])
+            assigned[start:end] = [True] * (end - start)
+        fields[name] = HTML_COMMENT.sub("", "\n".join(lines)).strip()
+    body = "\n".join(line for line, taken in zip(document.lines, assigned) if not taken)
+    fields["body"] = HTML_COMMENT.sub("", body).strip()
+    return fields
+
+
+def checkpoint_rows(path: Path, kind: str) -> list[tuple[str, str, dict[str, str]]]:
+    """Return the index row of a checkpoint file as (checkpoint, kind, fields)."""
+    parsed = cache.read_parsed(path)
+    checkpoint_id = path.stem
+    if isinstance(parsed.frontmatter, dict) and parsed.frontmatter.get("checkpoint"):
+        checkpoint_id = str(parsed.frontmatter["checkpoint"])
+    return [(checkpoint_id, kind, section_fields(parsed.document))]
+
+
+def learnings_rows(path: Path) -> list[tuple[str, str, dict[str, str]]]:
+    """Return one index row per `## <date> — <checkpoint>` entry of LEARNINGS.md."""
+    document = parse_document(cache.read_text(path))
+    rows = []
+    for section in document.sections:
+        match = LEARNINGS_HEADING.match(section.title)
+        checkpoint_id = match.group(1) if match else section.title
+        fields = dict.fromkeys(FIELDS, "")
+        fields["learnings"] = document.text(section)
+        rows.append((checkpoint_id, "learnings", fields))
+    return rows
+
+
+def list_sources(base_dir: Path) -> dict[str, tuple[Path, str]]:
+    """Map the relative path of every indexable file to (path, kind)."""
+    sources = {}
+    for kind in ("active", "archive"):
+        dir_path = base_dir / kind
+        if dir_path.is_dir():
+            for path in dir_path.glob("chk-*.md"):
+                sources[path.relative_to(base_dir).as_posix()] = (path, kind)
+    learnings = base_dir / LEARNINGS_FILENAME
+    if learnings.is_file():
+        sources[LEARNINGS_FILENAME] = (learnings, "learnings")
+    return sources
+
+
+def _create_schema(db: sqlite3.Connection) -> None:
+    """(Re)create the tables inside the caller's transaction."""
+    columns = ", ".join(FIELDS)
+    weights = ", ".join(["0.0", "0.0"] + [str(weight) for weight in FIELDS.values()])
+    statements = [
+        "DROP TABLE IF EXISTS entries",
+        "DROP TABLE IF EXISTS entry_sources",
+        "DROP TABLE IF EXISTS sources",
+        "CREATE TABLE sources ("
+        " id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE,"
+        " mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL)",
+        "CREATE TABLE entry_sources (entry INTEGER PRIMARY KEY, source INTEGER NOT NULL)",
+        "CREATE INDEX entry_sources_source ON entry_sources (source)",
+        f"CREATE VIRTUAL TABLE entries USING fts5("
+        f"checkpoint UNINDEXED, kind UNINDEXED, {columns}, tokenize = 'porter unicode61')",
+        f"INSERT INTO entries (entries, rank) VALUES ('rank', 'bm25({weights})')",
+        f"PRAGMA user_version = {SCHEMA_VERSION}",
+    ]
+    for statement in statements:
+        db.execute(statement)
+
+
+def open_index(base_dir: Path) -> sqlite3.Connection:
+    """Open the search database, creating or rebuilding it as needed.
+
+    Raises:
+        FileNotFoundError: If the checkpoints directory doesn't exist
+        RuntimeError: If this Python's SQLite was built without FTS5
+    """
+    if not base_dir.is_dir():
+        raise FileNotFoundError(f"Checkpoints directory not found: {base_dir}")
+
+    db_path = base_dir / SEARCH_FILENAME
+    for attempt in range(2):
+        db = sqlite3.connect(db_path, timeout=lock.get_timeout(), isolation_level=None)
+        try:
+            if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                db.execute("BEGIN IMMEDIATE")
+                # Another process may have rebuilt it while we waited
+                if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                    _create_schema(db)
+                db.execute("COMMIT")
+            return db
+        except sqlite3.OperationalError as e:
+            db.close()
+            if "fts5" in str(e):
+                raise RuntimeError("chkcc search needs SQLite with the FTS5 extension") from e
+            raise
+        except sqlite3.DatabaseError:
+            # Not a database (e.g. truncated): it's a cache, start over
+            db.close()
+            if attempt:
+                raise
+            db_path.unlink(missing_ok=True)
+    raise AssertionError("unreachable")
+
+
+def sync_index(db: sqlite3.Connection, base_dir: Path) -> tuple[int, int]:
+    """Re-index files that changed since the last sync and drop deleted ones.
+
+    Args:
+        db: Connection from open_index
+        base_dir: Checkpoints directory
+
+    Returns:
+        (files re-indexed, files removed)
+    """
+    sources = list_sources(base_dir)
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        known = {
+            path: (source_id, mtime_ns, size)
+            for source_id, path, mtime_ns, size in db.execute(
+                "SELECT id, path, mtime_ns, size FROM sources"
+            )
+        }
+
+        removed = [known[key][0] for key in known.keys() - sources.keys()]
+        for source_id in removed:
+            _delete_source(db, source_id)
+
+        updated = 0
+        now_ns = time.time_ns()
+        for key, (path, kind) in sorted(sources.items()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entry = known.get(key)
+            if entry is not None and entry[1:] == (stat.st_mtime_ns, stat.st_size):
+                continue
+
+            try:
+                rows = learnings_rows(path) if kind == "learnings" else checkpoint_rows(path, kind)
+            except (OSError, UnicodeDecodeError):
+                continue
+            # A file written within the timestamp granularity could change
+            # again without changing mtime or size; re-index it next time
+            mtime_ns = stat.st_mtime_ns if now_ns - stat.st_mtime_ns > RACY_WINDOW_NS else -1
+
+            if entry is not None:
+                _delete_source(db, entry[0])
+            source_id = db.execute(
+                "INSERT INTO sources (id, path, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                (entry[0] if entry else None, key, mtime_ns, stat.st_size),
+            ).lastrowid
+            for checkpoint_id, row_kind, fields in rows:
+                cursor = db.execute(
+                    f"INSERT INTO entries (checkpoint, kind, {', '.join(FIELDS)}) "
+                    f"VALUES (?, ?{', ?' * len(FIELDS)})",
+                    (checkpoint_id, row_kind, *(fields[name] for name in FIELDS)),
+                )
+                db.execute(
+                    "INSERT INTO entry_sources (entry, source) VALUES (?, ?)",
+                    (cursor.lastrowid, source_id),
+                )
+            updated += 1
+
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    return updated, len(removed)
+
+
+def _delete_source(db: sqlite3.Connection, source_id: int) -> None:
+    db.execute(
+        "DELETE FROM entries WHERE rowid IN (SELECT entry FROM entry_sources WHERE source = ?)",
+        (source_id,),
+    )
+    db.execute("DELETE FROM entry_sources WHERE source = ?", (source_id,))
+    db.execute("DELETE FROM sources WHERE id = ?", (source_id,))
+
+
+def build_query(query: str, field: str | None = None) -> str:
+    """Turn user input into an FTS5 query.
+
+    Every word must match (in any column, or in `field`). Words are quoted
+    so punctuation such as paths can't break the FTS5 syntax; `"..."` keeps a
+    phrase together, a trailing `*` matches a prefix and a `decisions:`
+    style prefix limits one word to a column.
+
+    Args:
+        query: Search terms
+        field: Column (or alias) to search instead of all columns
+
+    Raises:
+        ValueError: If the query has no terms or names an unknown field
+    """
+    def column(name: str) -> str:
+        resolved = FIELD_ALIASES.get(name.lower())
+        if resolved is None:
+            raise ValueError(f"Unknown search field: {name} (use one of: {', '.join(FIELDS)})")
+        return resolved
+
+    terms = []
+    for match in TERM.finditer(query):
+        prefix, text = match.groups()
+        if prefix is not None and prefix.lower() not in FIELD_ALIASES:
+            # Not a field prefix, e.g. "http://..." or "note:"
+            text, prefix = match.group(0), None
+        star = text.endswith("*") and len(text) > 1
+        text = text.rstrip("*") if star else text
+        if len(text) >= 2 and text.startswith('"') and text.endswith('"'):
+            text = text[1:-1]
+        if not text.strip():
+            continue
+        term = '"' + text.replace('"', '""') + '"' + ("*" if star else "")
+        terms.append(f"{column(prefix)} : {term}" if prefix else term)
+
+    if not terms:
+        raise ValueError("Search query is empty")
+    expression = " ".join(terms)
+    if field is not None:
+        expression = f"{column(field)} : ({expression})"
+    return expression
+
+
+def search(
+    base_dir: Path,
+    query: str,
+    limit: int = 10,
+    field: str | None = None,
+    kind: str = "all",
+) -> list[SearchResult]:
+    """Search checkpoints and learnings, best matches first.
+
+    Args:
+        base_dir: Checkpoints directory
+        query: Search terms (see build_query)
+        limit: Maximum number of results
+        field: Only search this column (problem, decisions, artifacts,
+            learnings or body)
+        kind: 'active', 'archive', 'learnings' or 'all'
+
+    Returns:
+        Matching checkpoints and LEARNINGS.md entries, ordered by bm25
+
+    Raises:
+        FileNotFoundError: If the checkpoints directory doesn't exist
+        ValueError: If the query is empty or names an unknown field
+        RuntimeError: If SQLite lacks FTS5
+    """
+    expression = build_query(query, field)
+    db = open_index(base_dir)
+    try:
+        sync_index(db, base_dir)
+        sql = (
+            "SELECT entries.checkpoint, entries.kind, sources.path, entries.rank, "
+            f"snippet(entries, -1, '[', ']', '…', {SNIPPET_TOKENS}) "
+            "FROM entries "
+            "JOIN entry_sources ON entry_sources.entry = entries.rowid "
+            "JOIN sources ON sources.id = entry_sources.source "
+            "WHERE entries MATCH ?"
+        )
+        params: list = [expression]
+        if kind != "all":
+            sql += " AND entries.kind = ?"
+            params.append(kind)
+        sql += " ORDER BY entries.rank LIMIT ?"
+        params.append(limit)
+        rows = db.execute(sql, params).fetchall()
+    finally:
+        db.close()
+
+    return [
+        SearchResult(
+            checkpoint=checkpoint_id,
+            kind=row_kind,
+            path=base_dir / relative,
+            score=-score,  # bm25 is lower-is-better; report higher-is-better
+            snippet=" ".join(snippet.split()),
+        )
+        for checkpoint_id, row_kind, relative, score, snippet in rows
+    ]
+
+
+def search_record(result: SearchResult) -> dict:
+    """Convert a search result to a JSON-serializable dict."""
+    return {
+        "checkpoint": result.checkpoint,
+        "kind": result.kind,
+        "path": str(result.path),
+        "score": result.score,
+        "snippet": result.snippet,
+    }
+
+
+def print_results(results: list[SearchResult], base_dir: Path, query: str) -> None:
+    """Print search results, one checkpoint per entry with a snippet."""
+    if not results:
+        print(f"No matches for: {query}")
+        return
+    for result in results:
+        relative = result.path.relative_to(base_dir).as_posix()
+        print(f"{result.checkpoint}  [{result.kind}]  {relative}")
+        if result.snippet:
+            print(f"    {result.snippet}")
@@ -8,42 +8,42 @@ that complements the tree command's structure-focused view.
 import re
 from pathlib import Path
 
-from chkcc.tree import Checkpoint, format_date, scan_checkpoints
+from chkcc.document import Document
+from chkcc.tree import Checkpoint, format_date, iter_checkpoints, scan_checkpoints
 
+PROBLEM_TITLE = re.compile(r"Problem", re.IGNORECASE)
+NEXT_ACTIONS_TITLE = re.compile(r"Next\s+Actions", re.IGNORECASE)
 
-def extract_problem_summary(content: str) -> str:
+
+def extract_problem_summary(document: Document) -> str:
     """Extract first line of ## Problem section.
 
     Returns the first non-empty line after '## Problem' heading.
     Returns empty string if section not found.
 
     Args:
-        content: Full markdown content of checkpoint file
+        document: Parsed checkpoint body (see document.parse_document)
 
     Returns:
         First non-empty line of Problem section, or empty string
     """
-    # Match ## Problem heading (with optional whitespace)
-    pattern = r"^##\s+Problem\s*$"
-    lines = content.split("\n")
-
-    in_problem_section = False
-    for line in lines:
-        if in_problem_section:
+    for section in document.sections:
+        if not PROBLEM_TITLE.fullmatch(section.title):
+            continue
+        for line in document.content_lines(section):
             # Skip empty lines until we find content
             stripped = line.strip()
             if stripped:
-                # Stop at next heading
+                # Stop at a subsection heading
                 if stripped.startswith("#"):
                     return ""
                 return stripped
-        elif re.match(pattern, line, re.IGNORECASE):
-            in_problem_section = True
+        return ""
 
     return ""
 
 
-def extract_next_action(content: str) -> str | None:
+def extract_next_action(document: Document) -> str | None:
     """Extract first uncompleted item from ### Next Actions section.
 
     Returns first uncompleted list item (- or * prefixed, with [ ] or no checkbox)
@@ -51,34 +51,31 @@ def extract_next_action(content: str) -> str | None:
     Returns None if section not found or empty.
 
     Args:
-        content: Full markdown content of checkpoint file
+        document: Parsed checkpoint body (see document.parse_document)
 
     Returns:
         First uncompleted list item text (without prefix/checkbox), or None
     """
-    # Match ### Next Actions heading (with optional whitespace)
-    pattern = r"^###\s+Next\s+Actions\s*$"
-    lines = content.split("\n")
-
-    in_next_actions = False
-    for line in lines:
-        if in_next_actions:
-            stripped = line.strip()
-            # Stop at next heading
-            if stripped.startswith("#"):
-                return None
-            # Look for list items (- or *)
-            list_match = re.match(r"^[-*]\s+(.+)$", stripped)
-            if list_match:
-                item_text = list_match.group(1)
-                # Skip completed items (marked with [x] or [X])
-                if re.match(r"^\[[xX]\]", item_text):
-                    continue
-                # Remove uncompleted checkbox if present: [ ]
-                item_text = re.sub(r"^\[ \]\s*", "", item_text)
-                return item_text.strip()
-        elif re.match(pattern, line, re.IGNORECASE):
-            in_next_actions = True
+    for section in document.sections:
+        for subsection in section.subsections:
+            if not NEXT_ACTIONS_TITLE.fullmatch(subsection.title):
+                continue
+            for line in document.content_lines(subsection):
+                stripped = line.strip()
+                # Stop at a deeper heading
+                if stripped.startswith("#"):
+                    return None
+                # Look for list items (- or *)
+                list_match = re.match(r"^[-*]\s+(.+)$", stripped)
+                if list_match:
+                    item_text = list_match.group(1)
+                    # Skip completed items (marked with [x] or [X])
+                    if re.match(r"^\[[xX]\]", item_text):
+                        continue
+                    # Remove uncompleted checkbox if present: [ ]
+                    item_text = re.sub(r"^\[ \]\s*", "", item_text)
+                    return item_text.strip()
+            return None
 
     return None
 
@@ -116,25 +113,56 @@ def format_status_entry(
     return "\n".join(lines)
 
 
-def cmd_status(base_dir: Path, show_all: bool = False) -> None:
+def sort_for_status(checkpoints: list[Checkpoint]) -> None:
+    """Sort checkpoints in place: current first, then by date (newest first)."""
+
+    def sort_key(cp: Checkpoint) -> tuple[int, float]:
+        # Only active (non-archived) checkpoints with status='current' get priority
+        status_priority = 0 if (not cp.is_archived and cp.status == "current") else 1
+        timestamp = cp.created.timestamp() if cp.created else 0
+        return (status_priority, -timestamp)
+
+    checkpoints.sort(key=sort_key)
+
+
+def cmd_status(
+    base_dir: Path, show_all: bool = False, jobs: int = 1, output_format: str = "text"
+) -> None:
     """Display checkpoint status summaries.
 
     Args:
         base_dir: Base checkpoints directory (parent of active/ and archive/)
         show_all: If True, include archived checkpoints. Default False.
+        jobs: Number of worker threads for scanning (see scan_checkpoints)
+        output_format: 'text', 'json' (sorted array) or 'ndjson' (one record
+            per checkpoint, streamed in scan order)
 
     Logic:
     1. Call scan_checkpoints() from tree.py
     2. Filter to active-only unless show_all=True
     3. Sort: current first, then by date (newest first)
-    4. For each: read file, extract problem/next, format and print
+    4. For each: format the indexed problem/next summaries and print
     5. If no checkpoints found, print appropriate message
     """
     # Determine filter based on show_all flag
     status_filter = "all" if show_all else "active"
 
+    if output_format == "ndjson":
+        from chkcc.output import checkpoint_record, write_records
+
+        checkpoints = iter_checkpoints(base_dir, status_filter, jobs=jobs)
+        write_records((checkpoint_record(cp) for cp in checkpoints), output_format)
+        return
+
     # Scan checkpoints
-    checkpoints = scan_checkpoints(base_dir, status_filter)
+    checkpoints = scan_checkpoints(base_dir, status_filter, jobs=jobs)
+    sort_for_status(checkpoints)
+
+    if output_format != "text":
+        from chkcc.output import checkpoint_record, write_records
+
+        write_records((checkpoint_record(cp) for cp in checkpoints), output_format)
+        return
 
     if not checkpoints:
         if show_all:
@@ -143,29 +171,11 @@ def cmd_status(base_dir: Path, show_all: bool = False) -> None:
             print("No active checkpoints found.")
         return
 
-    # Sort: current first, then by date (newest first)
-    def sort_key(cp: Checkpoint) -> tuple[int, float]:
-        # Only active (non-archived) checkpoints with status='current' get priority
-        status_priority = 0 if (not cp.is_archived and cp.status == "current") else 1
-        timestamp = cp.created.timestamp() if cp.created else 0
-        return (status_priority, -timestamp)
-
-    checkpoints.sort(key=sort_key)
-
-    # Collect entries, handling read errors
-    entries = []
-    for cp in checkpoints:
-        try:
-            content = cp.path.read_text()
-        except (OSError, UnicodeDecodeError) as e:
-            import sys
-            print(f"Warning: Could not read {cp.path}: {e}", file=sys.stderr)
-            continue
-
-        problem = extract_problem_summary(content)
-        next_action = extract_next_action(content)
-        entry = format_status_entry(cp, problem, next_action)
-        entries.append(entry)
+    # Problem and next action come from the metadata index, no re-read needed
+    entries = [
+        format_status_entry(cp, cp.problem, cp.next_action)
+        for cp in checkpoints
+    ]
 
     # Print with blank lines between
     print("\n\n".join(entries))
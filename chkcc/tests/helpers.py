@@ -0,0 +1,64 @@
+"""Shared helpers for the chkcc test suite."""
+
+import os
+import time
+
+
+def render_sections(sections, level=2):
+    """Render a mapping of heading -> content as markdown sections.
+
+    A dict value becomes nested subsections one heading level down.
+    """
+    parts = []
+    for title, content in sections.items():
+        if isinstance(content, dict):
+            content = "\n" + render_sections(content, level + 1)
+        parts.append(f"{'#' * level} {title}\n{content}")
+    return "\n\n".join(parts)
+
+
+def write_checkpoint(
+    path,
+    name=None,
+    *,
+    created="2026-01-03T10:00:00Z",
+    status="active",
+    parent=None,
+    sections=None,
+    age=None,
+    mtime=None,
+):
+    """Write a checkpoint file, creating its directory if needed.
+
+    Args:
+        path: Checkpoint file to write
+        name: Checkpoint id (defaults to the file stem)
+        created: Value of the created field
+        status: Value of the status field, or None to leave it out
+        parent: Parent checkpoint id, or None for a root
+        sections: Heading -> content mapping for the body (see render_sections);
+            defaults to a single Problem section
+        age: Backdate the mtime by this many seconds, e.g. to get the file out
+            of the indexes' racy window
+        mtime: Set this absolute mtime instead
+
+    Returns:
+        The written path
+    """
+    name = name or path.stem
+    lines = ["---", f"checkpoint: {name}", f"created: {created}"]
+    if status is not None:
+        lines.append(f"status: {status}")
+    if parent:
+        lines.append(f"parent: {parent}")
+    if sections is None:
+        sections = {"Problem": f"Problem of {name}."}
+    lines += ["---", "", render_sections(sections), ""]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines))
+    if age is not None:
+        mtime = time.time() - age
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
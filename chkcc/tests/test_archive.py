@@ -0,0 +1,130 @@
+"""Tests for single and batch archiving."""
+
+from argparse import Namespace
+
+import pytest
+
+from chkcc import archive
+from chkcc.cli import cmd_archive
+from chkcc.index_md import IndexFile
+from chkcc.tests.helpers import write_checkpoint
+
+INDEX = """# Active Checkpoints
+
+| Checkpoint | Description | Last Updated |
+|------------|-------------|--------------|
+{rows}
+"""
+
+
+def completed(name):
+    """Body sections of a checkpoint with a Completion section."""
+    return {"Problem": f"Problem of {name}.", "Completion": f"**Learnings**: Learned from {name}."}
+
+
+@pytest.fixture
+def lineage(tmp_path):
+    """Create chk-root -> chk-mid -> chk-leaf (all completed) and an open chk-other."""
+    active = tmp_path / "active"
+    active.mkdir()
+    write_checkpoint(active / "chk-root.md", status=None, sections=completed("chk-root"))
+    write_checkpoint(active / "chk-mid.md", status=None, parent="chk-root", sections=completed("chk-mid"))
+    write_checkpoint(active / "chk-leaf.md", status=None, parent="chk-mid", sections=completed("chk-leaf"))
+    write_checkpoint(active / "chk-other.md", status=None)
+    names = ["chk-root", "chk-mid", "chk-leaf", "chk-other"]
+    (active / "INDEX.md").write_text(
+        INDEX.format(rows="\n".join(f"| {n} | {n} | 2026-01-03 |" for n in names))
+    )
+    return tmp_path
+
+
+def test_archive_refuses_parent_with_active_children(lineage):
+    """A single archive still checks for active children."""
+    with pytest.raises(ValueError, match="has active children"):
+        archive.archive_checkpoint(lineage / "active" / "chk-mid.md")
+
+
+def test_batch_archives_leaves_first(lineage):
+    """Parents and children archived together are moved leaves first."""
+    active = lineage / "active"
+    paths = [active / "chk-root.md", active / "chk-leaf.md", active / "chk-mid.md"]
+
+    archived = archive.archive_batch(paths)
+
+    assert [p.name for p in archived] == ["chk-leaf.md", "chk-mid.md", "chk-root.md"]
+    assert all(p.exists() and p.parent.name == "archive" for p in archived)
+    assert [row.checkpoint for row in IndexFile.load(active / "INDEX.md").table_rows()] == ["chk-other"]
+    learnings = (lineage / "LEARNINGS.md").read_text()
+    assert learnings.count("## ") == 3
+    assert learnings.index("chk-leaf") < learnings.index("chk-root")
+
+
+def test_batch_validates_before_moving(lineage):
+    """An invalid member aborts the whole batch before any file moves."""
+    active = lineage / "active"
+
+    with pytest.raises(ValueError, match="Completion"):
+        archive.archive_batch([active / "chk-leaf.md", active / "chk-other.md"])
+
+    assert (active / "chk-leaf.md").exists()
+    assert not (lineage / "LEARNINGS.md").exists()
+
+
+def test_archive_refuses_to_overwrite_archived_checkpoint(lineage, capsys):
+    """A single archive no longer replaces an existing archive/<name>."""
+    leaf = lineage / "active" / "chk-leaf.md"
+    archived = write_checkpoint(lineage / "archive" / "chk-leaf.md", sections=completed("old chk-leaf"))
+
+    with pytest.raises(FileExistsError, match="chk-leaf.md"):
+        archive.archive_checkpoint(leaf)
+
+    args = Namespace(files=[str(leaf)], batch=False, completed=False, root=None, force=False)
+    assert cmd_archive(args) == 1
+    assert "Already archived" in capsys.readouterr().err
+    assert leaf.exists()
+    assert "old chk-leaf" in archived.read_text()
+
+
+def test_batch_refuses_to_overwrite_archived_checkpoint(lineage):
+    """A name already in archive/ aborts the batch before anything changes."""
+    active = lineage / "active"
+    archived = write_checkpoint(lineage / "archive" / "chk-mid.md", sections=completed("old chk-mid"))
+    index_before = (active / "INDEX.md").read_text()
+
+    with pytest.raises(FileExistsError, match="chk-mid.md"):
+        archive.archive_batch([active / "chk-leaf.md", active / "chk-mid.md"])
+
+    assert "old chk-mid" in archived.read_text()
+    assert (active / "chk-leaf.md").exists() and (active / "chk-mid.md").exists()
+    assert (active / "INDEX.md").read_text() == index_before
+    assert not (lineage / "LEARNINGS.md").exists()
+
+
+def test_select_completed_and_subtree(lineage):
+    """Selectors pick completed checkpoints or a whole subtree."""
+    completed = {p.name for p in archive.select_completed(lineage)}
+    subtree = [p.name for p in archive.select_subtree(lineage, "chk-mid")]
+
+    assert completed == {"chk-root.md", "chk-mid.md", "chk-leaf.md"}
+    assert subtree == ["chk-mid.md", "chk-leaf.md"]
+    with pytest.raises(ValueError):
+        archive.select_subtree(lineage, "chk-missing")
+
+
+def test_leaves_first_handles_cycles():
+    """Ordering terminates on cyclic parent links."""
+    order = archive.leaves_first(["a", "b", "c"], {"a": "b", "b": "a", "c": "a"})
+
+    assert sorted(order) == ["a", "b", "c"]
+    assert order[0] == "c"
+
+
+def test_archive_removes_every_index_row_of_a_checkpoint(lineage):
+    """A checkpoint listed twice in INDEX.md loses both rows when archived."""
+    index_path = lineage / "active" / "INDEX.md"
+    index_path.write_text(index_path.read_text() + "| chk-leaf | Leaf again | 2026-01-04 |\n")
+
+    archive.archive_checkpoint(lineage / "active" / "chk-leaf.md")
+
+    rows = [row.checkpoint for row in IndexFile.load(index_path).table_rows()]
+    assert rows == ["chk-root", "chk-mid", "chk-other"]
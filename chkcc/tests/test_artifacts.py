@@ -0,0 +1,116 @@
+"""Tests for artifact lookups (chkcc who-touched)."""
+
+from argparse import Namespace
+
+import pytest
+
+from chkcc import artifacts, index
+from chkcc.cli import cmd_who_touched
+from chkcc.tests.helpers import write_checkpoint
+
+
+def trail(*files):
+    """Body sections listing files in the Artifact Trail."""
+    rows = "".join(f"\n| `{file}` | modified | change |" for file in files)
+    table = "| File | Status | Key Change |\n|------|--------|------------|" + rows
+    return {"Problem": "Problem.", "Essential Information": {"Artifact Trail": table, "Next Actions": "- Next"}}
+
+
+@pytest.fixture
+def checkpoints_dir(tmp_path):
+    """Two checkpoints sharing src/auth.py, one of them archived."""
+    (tmp_path / "active").mkdir()
+    (tmp_path / "archive").mkdir()
+    write_checkpoint(
+        tmp_path / "archive" / "chk-old.md",
+        created="2026-01-01T00:00:00Z",
+        sections=trail("src/auth.py", "docs/auth.md"),
+        age=10,
+    )
+    write_checkpoint(
+        tmp_path / "active" / "chk-new.md",
+        created="2026-01-05T00:00:00Z",
+        sections=trail("src/auth.py", "src/db/models.py"),
+        age=10,
+    )
+    return tmp_path
+
+
+def test_exact_path_oldest_first(checkpoints_dir):
+    """An exact path returns every checkpoint listing it, oldest first."""
+    results = artifacts.who_touched(checkpoints_dir, "./src/auth.py")
+
+    assert [(c.id, paths) for c, paths in results] == [
+        ("chk-old", ["src/auth.py"]),
+        ("chk-new", ["src/auth.py"]),
+    ]
+
+
+def test_glob_and_directory(checkpoints_dir):
+    """Globs and trailing-slash directories match several artifacts."""
+    results = artifacts.who_touched(checkpoints_dir, "src/*.py")
+    assert [(c.id, paths) for c, paths in results] == [
+        ("chk-old", ["src/auth.py"]),
+        ("chk-new", ["src/auth.py", "src/db/models.py"]),
+    ]
+
+    results = artifacts.who_touched(checkpoints_dir, "src/db/")
+    assert [c.id for c, _ in results] == ["chk-new"]
+
+
+def test_delta_only_artifact(tmp_path):
+    """Files listed only in a delta's Artifacts table are found too."""
+    delta = (
+        "| File | Action | Description |\n|------|--------|-------------|\n"
+        "| `src/late.py` | created | Added after the checkpoint |"
+    )
+    sections = trail("src/auth.py")
+    sections["Delta: 2026-01-06T00:00:00Z"] = {"What Changed": "- More work", "Artifacts": delta}
+    write_checkpoint(tmp_path / "active" / "chk-delta.md", sections=sections, age=10)
+
+    results = artifacts.who_touched(tmp_path, "src/late.py")
+
+    assert [(c.id, paths) for c, paths in results] == [("chk-delta", ["src/late.py"])]
+
+
+def test_status_filter_and_absolute_path(checkpoints_dir):
+    """Absolute paths are made relative to the project root."""
+    results = artifacts.who_touched(
+        checkpoints_dir, str(checkpoints_dir / "docs" / "auth.md"),
+        status_filter="archive", project_root=checkpoints_dir,
+    )
+
+    assert [c.id for c, _ in results] == ["chk-old"]
+    assert artifacts.who_touched(checkpoints_dir, "docs/auth.md", status_filter="active") == []
+
+
+def test_lookup_does_not_reparse_unchanged_files(checkpoints_dir, monkeypatch):
+    """After the first scan, lookups are served from the index."""
+    artifacts.who_touched(checkpoints_dir, "src/auth.py")
+    calls = []
+    monkeypatch.setattr(index, "read_metadata", lambda p: calls.append(p))
+
+    assert len(artifacts.who_touched(checkpoints_dir, "src/auth.py")) == 2
+    assert calls == []
+
+
+def test_cmd_who_touched(checkpoints_dir, capsys):
+    """The CLI prints each checkpoint with its matching artifacts."""
+    args = Namespace(dir=str(checkpoints_dir), path="src/db/*", status="all", format="text")
+
+    assert cmd_who_touched(args) == 0
+    assert capsys.readouterr().out == "chk-new [active] (2026-01-05)\n  src/db/models.py\n"
+
+    args.path = "missing.py"
+    assert cmd_who_touched(args) == 0
+    assert "No checkpoints list missing.py" in capsys.readouterr().out
+
+
+def test_cmd_who_touched_rejects_file_as_dir(tmp_path, capsys):
+    """A --dir that is a file is reported as an error."""
+    not_a_dir = tmp_path / "file.md"
+    not_a_dir.write_text("x")
+    args = Namespace(dir=str(not_a_dir), path="src/auth.py", status="all", format="text")
+
+    assert cmd_who_touched(args) == 1
+    assert "Not a directory" in capsys.readouterr().err
@@ -0,0 +1,211 @@
+"""Fault-injection tests for crash-safe writes."""
+
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import chkcc
+from chkcc import archive, atomic, init, scaffold
+from chkcc.archive import update_index
+
+ORIGINAL = "original content\n"
+INDEX = """# Active Checkpoints
+
+| Checkpoint | Description | Last Updated |
+|------------|-------------|--------------|
+| chk-a | A | 2026-01-03 |
+"""
+
+
+class InjectedFault(OSError):
+    """Raised by the patched syscalls below."""
+
+
+def fail_after(monkeypatch, name, calls=0):
+    """Make os.<name> raise InjectedFault after `calls` successful calls."""
+    original = getattr(os, name)
+    remaining = [calls]
+
+    def faulty(*args, **kwargs):
+        if remaining[0] <= 0:
+            raise InjectedFault(f"injected {name} failure")
+        remaining[0] -= 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(os, name, faulty)
+
+
+def leftovers(directory):
+    """Return temporary files left in a directory."""
+    return [p.name for p in Path(directory).iterdir() if p.name.startswith(atomic.TMP_PREFIX)]
+
+
+@pytest.mark.parametrize("syscall,calls", [("write", 1), ("fsync", 0), ("replace", 0)])
+def test_failed_write_keeps_original(tmp_path, monkeypatch, syscall, calls):
+    """A write that dies midway leaves the old content and no temp file."""
+    path = tmp_path / "chk-a.md"
+    path.write_text(ORIGINAL)
+    fail_after(monkeypatch, syscall, calls)
+
+    with pytest.raises(InjectedFault):
+        atomic.write_atomic(path, "x" * (atomic.CHUNK_SIZE * 3))
+
+    monkeypatch.undo()
+    assert path.read_text() == ORIGINAL
+    assert leftovers(tmp_path) == []
+
+
+def test_write_preserves_permissions(tmp_path):
+    """Replacing a file keeps its mode bits."""
+    path = tmp_path / "chk-a.md"
+    path.write_text(ORIGINAL)
+    path.chmod(0o600)
+
+    atomic.write_atomic(path, "new\n")
+
+    assert path.read_text() == "new\n"
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_killed_writer_leaves_original(tmp_path):
+    """SIGKILL in the middle of a write never exposes a partial file."""
+    path = tmp_path / "INDEX.md"
+    path.write_text(ORIGINAL)
+    script = (
+        "import os, sys, time\n"
+        "from chkcc import atomic\n"
+        "real_write = os.write\n"
+        "def slow_write(fd, data):\n"
+        "    n = real_write(fd, data)\n"
+        "    print('writing', flush=True)\n"
+        "    time.sleep(60)\n"
+        "    return n\n"
+        "os.write = slow_write\n"
+        "atomic.write_atomic(sys.argv[1], 'y' * (atomic.CHUNK_SIZE * 4))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(Path(chkcc.__file__).parent.parent)}
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script, str(path)], env=env, stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert proc.stdout.readline().strip() == "writing"
+        proc.send_signal(signal.SIGKILL)
+    finally:
+        proc.wait(timeout=10)
+        proc.stdout.close()
+
+    assert path.read_text() == ORIGINAL
+    # The orphaned temp file is hidden and ignored by checkpoint scans
+    assert all(not name.endswith(".md") for name in leftovers(tmp_path))
+
+
+def test_scaffold_delta_fault_keeps_checkpoint(tmp_path, monkeypatch):
+    """A failed delta append leaves the checkpoint byte-for-byte intact."""
+    path = tmp_path / "chk-a.md"
+    content = "---\ncheckpoint: chk-a\ncreated: 2026-01-03T10:00:00Z\n---\n\n## Problem\nX\n"
+    path.write_text(content)
+    fail_after(monkeypatch, "replace")
+
+    with pytest.raises(InjectedFault):
+        scaffold.scaffold_delta(path)
+
+    monkeypatch.undo()
+    assert path.read_text() == content
+
+
+def test_in_place_delta_fault_keeps_checkpoint(tmp_path, monkeypatch):
+    """A failed in-place append is truncated away again."""
+    path = tmp_path / "chk-a.md"
+    content = "---\ncheckpoint: chk-a\nlast_delta: 2026-01-03T10:00:00Z\n---\n\n## Problem\nX\n"
+    path.write_text(content)
+    fail_after(monkeypatch, "fsync")
+
+    with pytest.raises(InjectedFault):
+        scaffold.scaffold_delta(path)
+
+    monkeypatch.undo()
+    assert path.read_text() == content
+
+
+def test_scaffold_delta_appends_in_place(tmp_path):
+    """Later deltas patch last_delta and append without replacing the file."""
+    path = tmp_path / "chk-a.md"
+    body = "\n## Problem\n" + "Long history.\n" * 1000
+    path.write_text("---\ncheckpoint: chk-a\n---\n" + body)
+
+    scaffold.scaffold_delta(path)
+    inode = path.stat().st_ino
+    scaffold.scaffold_delta(path)
+
+    content = path.read_text()
+    assert path.stat().st_ino == inode
+    assert content.startswith("---\ncheckpoint: chk-a\nlast_delta: ")
+    assert content.count("## Delta: ") == 2
+    assert content.split("\n---\n", 1)[1].startswith(body)
+    header = content.split("\n---\n", 1)[0]
+    assert header.split("last_delta: ")[1] == content.rsplit("## Delta: ", 1)[1].split("\n")[0]
+
+
+@pytest.mark.parametrize("last_delta", ["", "last_delta: 2026-01-01T00:00:00Z\n"])
+@pytest.mark.parametrize("ending", ["X", "X\n", "X\n\n\n", ""])
+def test_scaffold_delta_normalizes_file_ending(tmp_path, monkeypatch, last_delta, ending):
+    """One newline separates the delta from the content, however the file ends."""
+    stamp = "2026-01-04T00:00:00Z"
+    monkeypatch.setattr(scaffold, "get_timestamp", lambda: stamp)
+    path = tmp_path / "chk-a.md"
+    body = f"\n## Problem\n{ending}" if ending else "\n\n"
+    path.write_text(f"---\ncheckpoint: chk-a\n{last_delta}---\n" + body)
+
+    scaffold.scaffold_delta(path)
+
+    content = "\n\n## Problem\nX" if ending else ""
+    expected = f"---\ncheckpoint: chk-a\nlast_delta: {stamp}\n---{content}\n" + scaffold.get_delta_template(stamp)
+    assert path.read_text() == expected
+
+
+def test_index_and_learnings_faults_keep_files(tmp_path, monkeypatch):
+    """INDEX.md and LEARNINGS.md survive failed rewrites unchanged."""
+    index_path = tmp_path / "INDEX.md"
+    index_path.write_text(INDEX)
+    learnings_path = tmp_path / "LEARNINGS.md"
+    learnings_path.write_text("# Learnings\n")
+    fail_after(monkeypatch, "write")
+
+    with pytest.raises(InjectedFault):
+        update_index(index_path, "chk-a")
+    with pytest.raises(InjectedFault):
+        archive.append_to_learnings(tmp_path, "chk-a", "Lesson")
+
+    monkeypatch.undo()
+    assert index_path.read_text() == INDEX
+    assert learnings_path.read_text() == "# Learnings\n"
+    assert leftovers(tmp_path) == []
+
+
+def test_skill_file_fault_keeps_installed_files(tmp_path, monkeypatch):
+    """A failed skill install leaves the previously installed files intact."""
+    installed = [Path(p) for p in init.install_skill_files(tmp_path)]
+    for path in installed:
+        path.write_text(ORIGINAL)
+    fail_after(monkeypatch, "write")
+
+    with pytest.raises(InjectedFault):
+        init.install_skill_files(tmp_path)
+
+    monkeypatch.undo()
+    assert all(path.read_text() == ORIGINAL for path in installed)
+    assert all(leftovers(path.parent) == [] for path in installed)
+
+
+def test_append_atomic_creates_and_appends(tmp_path):
+    """Appends go through a full atomic rewrite."""
+    path = tmp_path / "LEARNINGS.md"
+
+    atomic.append_atomic(path, "a\n")
+    atomic.append_atomic(path, "b\n")
+
+    assert path.read_text() == "a\nb\n"
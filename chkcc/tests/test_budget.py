@@ -0,0 +1,83 @@
+"""Tests for token-budgeted checkpoint rendering."""
+
+from chkcc.budget import render_budgeted
+from chkcc.tokens import estimate_tokens
+
+CHECKPOINT = """---
+checkpoint: chk-a
+created: 2026-01-03T10:00:00Z
+---
+
+## Problem
+Ship the parser.
+
+## Essential Information
+
+### Decisions
+- Use a single pass
+
+### Play-By-Play
+- Oldest step
+- Middle step
+- Newest step
+
+### Artifact Trail
+| File | Status | Key Change |
+|------|--------|------------|
+| `parser.py` | created | Parser |
+
+### Current State
+- Parser drafted
+
+### Next Actions
+- Write tests
+
+---
+
+## Delta: 2026-01-04T10:00:00Z
+
+### What Changed
+Old delta text.
+
+---
+
+## Delta: 2026-01-05T10:00:00Z
+
+### What Changed
+New delta text.
+"""
+
+
+def test_small_checkpoint_is_unchanged():
+    """Content that fits the budget is emitted verbatim."""
+    assert render_budgeted(CHECKPOINT, 10_000) == CHECKPOINT
+
+
+def test_budget_keeps_core_sections_first():
+    """Problem, Decisions, Current State and Next Actions outrank history."""
+    core = render_budgeted(CHECKPOINT, 110)
+
+    assert estimate_tokens(core) <= 110
+    for text in ("Ship the parser.", "Use a single pass", "Parser drafted", "Write tests"):
+        assert text in core
+    assert "Oldest step" not in core
+    assert "Old delta text." not in core
+    assert core.rstrip().endswith("-token budget -->")
+    # Kept blocks stay in document order
+    assert core.index("### Decisions") < core.index("### Current State") < core.index("### Next Actions")
+
+
+def test_budget_prefers_recent_history():
+    """Newer deltas and Play-By-Play entries are kept before older ones."""
+    lengths = [estimate_tokens(render_budgeted(CHECKPOINT, budget)) for budget in range(60, 200, 5)]
+    rendered = {budget: render_budgeted(CHECKPOINT, budget) for budget in range(60, 200, 5)}
+
+    assert all(length <= budget for length, budget in zip(lengths, range(60, 200, 5)))
+    for text in rendered.values():
+        if "Old delta text." in text:
+            assert "New delta text." in text
+        if "Oldest step" in text:
+            assert "Newest step" in text and "New delta text." in text
+        if "Play-By-Play" in text:
+            # A heading is only kept with at least one of its entries
+            assert "step" in text
@@ -0,0 +1,103 @@
+"""Tests for the per-process content and parse cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from chkcc import cache
+from chkcc.archive import archive_checkpoint
+from chkcc.index import MetadataIndex
+
+CHECKPOINT = """---
+checkpoint: chk-done
+created: 2026-01-03T10:00:00Z
+---
+
+## Problem
+Done.
+
+## Completion
+**Learnings**: Read once.
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start every test with an empty cache."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    """Count file opens for reading and read_text calls per path name."""
+    counts: dict[str, int] = {}
+    original_open = Path.open
+    original_read_text = Path.read_text
+
+    def counting_open(self, mode="r", *args, **kwargs):
+        if "r" in mode:
+            counts[self.name] = counts.get(self.name, 0) + 1
+        return original_open(self, mode, *args, **kwargs)
+
+    def counting_read_text(self, *args, **kwargs):
+        counts[self.name] = counts.get(self.name, 0) + 1
+        # Call the original open directly so one read_text counts once
+        with original_open(self, encoding=kwargs.get("encoding")) as f:
+            return f.read()
+
+    monkeypatch.setattr(Path, "open", counting_open)
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    return counts
+
+
+def test_read_text_reuses_unchanged_content(tmp_path, count_reads):
+    """A file is read once until its stat signature changes."""
+    path = tmp_path / "chk-a.md"
+    path.write_text("one")
+
+    assert cache.read_text(path) == "one"
+    assert cache.read_text(path) == "one"
+    assert count_reads["chk-a.md"] == 1
+
+    path.write_text("two!")
+    assert cache.read_text(path) == "two!"
+    assert count_reads["chk-a.md"] == 2
+
+
+def test_read_parsed_and_invalidate(tmp_path):
+    """Parses are shared, and invalidate forces a re-read."""
+    path = tmp_path / "chk-done.md"
+    path.write_text(CHECKPOINT)
+
+    parsed = cache.read_parsed(path)
+    assert parsed.frontmatter["checkpoint"] == "chk-done"
+    assert cache.read_parsed(path) is parsed
+
+    cache.invalidate(path)
+    assert cache.peek_text(path) is None
+    assert cache.read_parsed(path) is not parsed
+
+
+def test_archive_reads_checkpoint_once(tmp_path, count_reads):
+    """Archiving parses the checkpoint once, even with a cold metadata index."""
+    (tmp_path / "active").mkdir()
+    path = tmp_path / "active" / "chk-done.md"
+    path.write_text(CHECKPOINT)
+
+    archive_checkpoint(path)
+
+    assert count_reads["chk-done.md"] == 1
+    assert (tmp_path / "LEARNINGS.md").read_text().count("Read once.") == 1
+
+
+def test_index_load_reused_until_file_changes(tmp_path):
+    """The metadata index is loaded once per process while unchanged on disk."""
+    index = MetadataIndex.load(tmp_path)
+    assert MetadataIndex.load(tmp_path) is index
+
+    (tmp_path / ".chkcc-index").write_text("{}")
+    os.utime(tmp_path / ".chkcc-index", ns=(1, 1))
+    assert MetadataIndex.load(tmp_path) is not index
@@ -0,0 +1,107 @@
+"""Regression tests for the chkcc CLI entry point: import time and piping."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import chkcc
+from chkcc import pointer
+from chkcc.tree import scan_checkpoints
+
+
+def imported_modules(*argv: str) -> set[str]:
+    """Run `chkcc <argv>` under -X importtime and return the imported module names."""
+    env = {**os.environ, "PYTHONPATH": str(Path(chkcc.__file__).parent.parent)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from chkcc.cli import main; main()", *argv],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+@pytest.fixture
+def checkpoints_dir(tmp_path):
+    """Create a checkpoints directory with a warm metadata index."""
+    active = tmp_path / "active"
+    active.mkdir()
+    checkpoint = active / "chk-test.md"
+    checkpoint.write_text("---\ncheckpoint: chk-test\ncreated: 2026-01-03T10:00:00Z\nstatus: current\n---\n")
+    stamp = time.time() - 10
+    os.utime(checkpoint, (stamp, stamp))
+    scan_checkpoints(tmp_path)
+    return tmp_path
+
+
+def test_current_does_not_import_yaml(checkpoints_dir):
+    """Showing the current checkpoint is served from the index without PyYAML."""
+    modules = imported_modules("current", "--dir", str(checkpoints_dir))
+
+    assert "chkcc.current" in modules
+    assert "yaml" not in modules
+
+
+def test_tree_does_not_import_other_subcommands(checkpoints_dir):
+    """Dispatching one subcommand leaves the others unimported."""
+    modules = imported_modules("tree", str(checkpoints_dir))
+
+    assert "chkcc.tree" in modules
+    assert not modules & {"chkcc.archive", "chkcc.doctor", "chkcc.init", "chkcc.update", "yaml"}
+
+
+def test_prime_skips_argparse(checkpoints_dir):
+    """The prime fast path runs before argparse is loaded."""
+    pointer.write_pointer(checkpoints_dir, checkpoints_dir / "active" / "chk-test.md")
+
+    modules = imported_modules("prime", "--dir", str(checkpoints_dir))
+
+    assert "chkcc.prime" in modules
+    assert not modules & {"argparse", "chkcc.tree", "chkcc.validate", "yaml"}
+
+
+def test_cached_budgeted_prime_skips_rendering(checkpoints_dir):
+    """A cached `prime --budget` rendering is served without the budget module."""
+    pointer.write_pointer(checkpoints_dir, checkpoints_dir / "active" / "chk-test.md")
+    argv = ("prime", "--dir", str(checkpoints_dir), "--budget", "100")
+
+    assert "chkcc.budget" in imported_modules(*argv)
+    modules = imported_modules(*argv)
+
+    assert "chkcc.prime" in modules
+    assert not modules & {"argparse", "chkcc.budget", "chkcc.document", "re"}
+
+
+@pytest.mark.parametrize("argv", [("status", "--format", "ndjson"), ("tree", "--format", "text")])
+def test_closed_pipe_exits_quietly(tmp_path, argv):
+    """Output piped into a reader that stops early (`| head -1`) ends silently."""
+    active = tmp_path / "active"
+    active.mkdir()
+    for n in range(1500):
+        (active / f"chk-{n:04}.md").write_text(
+            f"---\ncheckpoint: chk-{n:04}\ncreated: 2026-01-03T10:00:00Z\n---\n\n"
+            f"## Problem\nProblem number {n} with a long enough summary line to fill the pipe.\n"
+        )
+    env = {**os.environ, "PYTHONPATH": str(Path(chkcc.__file__).parent.parent)}
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "from chkcc.cli import main; main()", *argv, str(tmp_path)],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    assert proc.stdout.readline()
+    proc.stdout.close()
+    stderr = proc.stderr.read()
+
+    assert proc.wait() == 0
+    assert stderr == ""
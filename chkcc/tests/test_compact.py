@@ -0,0 +1,189 @@
+"""Tests for folding deltas into the checkpoint body."""
+
+from pathlib import Path
+
+import pytest
+
+from chkcc import compact, scaffold
+from chkcc.validate import validate_file
+
+EXAMPLE = Path(compact.__file__).parent / "data" / "skill" / "examples" / "checkpoint-with-delta.md"
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    """The checkpoint-with-delta example as a file."""
+    text = EXAMPLE.read_text().split("```markdown\n", 1)[1].split("\n```", 1)[0] + "\n"
+    path = tmp_path / "chk-auth.md"
+    path.write_text(text)
+    return path
+
+
+def test_compact_folds_deltas(checkpoint):
+    """Deltas become Play-By-Play entries and merged Artifact Trail rows."""
+    report = compact.compact_checkpoint(checkpoint)
+    content = checkpoint.read_text()
+
+    assert report.deltas == 2
+    assert "## Delta" not in content
+    assert "- 2025-12-14 → Added React auth context and useAuth hook for client-side state." in content
+    assert "- Phase 3: Registration → Blocked → Ready" in content
+    # AuthContext.tsx was in the trail and a delta: one row, still 'created'
+    assert content.count("`src/contexts/AuthContext.tsx`") == 1
+    assert "| `src/hooks/useAuth.ts` | created | Custom hook wrapping context |" in content
+    assert content.rstrip().endswith("- No commits without explicit approval")
+    assert report.bytes_after < report.bytes_before
+    assert report.tokens_after < report.tokens_before
+    assert validate_file(checkpoint).valid
+
+
+def test_compact_is_idempotent_and_deduplicates(checkpoint):
+    """Entries already in the body aren't repeated on a second run."""
+    checkpoint.write_text(
+        checkpoint.read_text()
+        + "\n---\n\n## Delta: 2025-12-15T09:00:00Z\n\n### Decisions\n\n"
+        + "- Storage: HttpOnly cookies (not localStorage)\n- Tokens expire after 15 minutes\n"
+    )
+
+    compact.compact_checkpoint(checkpoint)
+    once = checkpoint.read_text()
+    report = compact.compact_checkpoint(checkpoint)
+
+    assert report.deltas == 0
+    assert checkpoint.read_text() == once
+    assert once.count("HttpOnly cookies") == 1
+    assert "- Tokens expire after 15 minutes" in once
+
+
+def test_compact_empty_template_deltas_restores_body(tmp_path):
+    """Untouched template deltas fold away to nothing."""
+    path = scaffold.scaffold_checkpoint("x", output_dir=tmp_path)
+    body = path.read_text().split("\n---\n", 1)[1]
+    scaffold.scaffold_delta(path)
+    scaffold.scaffold_delta(path)
+
+    compact.compact_checkpoint(path)
+
+    assert path.read_text().split("\n---\n", 1)[1] == body
+
+
+def test_compact_dry_run_writes_nothing(checkpoint):
+    """A dry run only reports."""
+    before = checkpoint.read_text()
+
+    report = compact.compact_checkpoint(checkpoint, dry_run=True)
+
+    assert report.deltas == 2
+    assert checkpoint.read_text() == before
+
+
+def test_compact_requires_essential_information(tmp_path):
+    """Deltas can't be folded without an Essential Information section."""
+    path = tmp_path / "chk-a.md"
+    path.write_text("---\ncheckpoint: chk-a\n---\n\n## Problem\nP.\n\n## Delta: 2026-01-01\n\n### What Changed\nX\n")
+
+    with pytest.raises(ValueError, match="Essential Information"):
+        compact.compact_checkpoint(path)
+
+
+BODY = """
+## Essential Information
+
+### Decisions
+
+- Storage: cookies
+  - Rationale: scale
+- Cache: redis
+  - Rationale: scale
+- storage:   COOKIES
+
+### Play-By-Play
+
+- Phase 1 → Done
+
+### Artifact Trail
+
+| File | Status | Key Change |
+|------|--------|------------|
+| `a.py` | created | First |
+
+Note: generated files are not listed.
+
+### Next Actions
+
+- Next
+"""
+
+
+def delta(date, text):
+    """A delta section appended to BODY."""
+    return f"\n---\n\n## Delta: {date}\n\n{text}"
+
+
+def test_compact_keeps_existing_lines():
+    """Existing entries, nested bullets included, are never rewritten or removed."""
+    body = BODY + delta("2026-01-02", "### What Changed\n\nDid things.\n")
+
+    new_body, folded = compact.compact_body(body)
+
+    assert folded.count == 1
+    assert new_body == BODY.replace(
+        "- Phase 1 → Done\n", "- Phase 1 → Done\n- 2026-01-02 → Did things.\n"
+    )
+
+
+def test_compact_appends_nested_decisions():
+    """Nested bullets travel with their decision; repeated decisions are skipped."""
+    body = BODY + delta(
+        "2026-01-02",
+        "### Decisions\n\n- Cache: redis\n  - Rationale: scale\n- Queue: celery\n  - Rationale: scale\n",
+    )
+
+    new_body, _ = compact.compact_body(body)
+
+    assert "- storage:   COOKIES\n- Queue: celery\n  - Rationale: scale\n\n### Play-By-Play" in new_body
+    assert new_body.count("- Cache: redis") == 1
+
+
+def test_compact_artifact_rows_keep_notes_in_place():
+    """New rows go right after the table; notes below it stay in place."""
+    body = BODY + delta(
+        "2026-01-02",
+        "### Artifacts\n\n| File | Action | Description |\n|---|---|---|\n"
+        "| `a.py` | modified | Second |\n| `b.py` | created | New |\n",
+    )
+
+    new_body, _ = compact.compact_body(body)
+
+    assert (
+        "| `a.py` | created | Second |\n| `b.py` | created | New |\n\nNote: generated files are not listed.\n"
+        in new_body
+    )
+
+
+def test_compact_leaves_unfoldable_content_in_its_delta():
+    """Unknown subsections, tables and code blocks stay in the delta, unchanged."""
+    code = "### What Changed\n\nNew store:\n\n```python\nstore = Redis()\n```\n"
+    breadcrumbs = "### Breadcrumbs\n\n| Where | What |\n|---|---|\n| a.py | b |\n"
+    body = BODY + delta("2026-01-02", f"{code}\n### Decisions\n\n- Queue: celery\n\n{breadcrumbs}")
+
+    new_body, folded = compact.compact_body(body)
+
+    assert folded.kept_titles == [
+        "What Changed (Delta: 2026-01-02)",
+        "Breadcrumbs (Delta: 2026-01-02)",
+    ]
+    assert new_body.endswith(f"---\n\n## Delta: 2026-01-02\n\n{code}\n{breadcrumbs}")
+    assert "- Queue: celery" in new_body.split("## Delta")[0]
+    again, folded = compact.compact_body(new_body)
+    assert (again, folded.count) == (new_body, 0)
+
+
+def test_compact_only_folds_delta_sections():
+    """Headings that merely start with 'Delta' are regular sections."""
+    body = BODY + "\n---\n\n## Delta Summary\n\n- Keep me\n" + delta("2026-01-02", "### What Changed\n\nX\n")
+
+    new_body, folded = compact.compact_body(body)
+
+    assert folded.count == 1
+    assert new_body.endswith("- Next\n\n---\n\n## Delta Summary\n\n- Keep me\n")
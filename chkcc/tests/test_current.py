@@ -0,0 +1,111 @@
+"""Tests for current checkpoint management."""
+
+import os
+
+import pytest
+
+from chkcc import current, pointer
+from chkcc.tests.helpers import write_checkpoint
+
+
+@pytest.fixture
+def checkpoints_dir(tmp_path):
+    """Create active/ with two checkpoints, neither current."""
+    (tmp_path / "active").mkdir()
+    write_checkpoint(tmp_path / "active" / "chk-a.md")
+    write_checkpoint(tmp_path / "active" / "chk-b.md")
+    return tmp_path
+
+
+def test_set_current_writes_pointer(checkpoints_dir):
+    """Setting current records the checkpoint in the pointer file."""
+    target = checkpoints_dir / "active" / "chk-a.md"
+
+    current.set_current(target, checkpoints_dir)
+
+    assert pointer.read_pointer(checkpoints_dir) == str(target)
+    assert current.get_current(checkpoints_dir).id == "chk-a"
+
+
+def test_switch_current_moves_pointer(checkpoints_dir):
+    """Switching current clears the old checkpoint and repoints."""
+    current.set_current(checkpoints_dir / "active" / "chk-a.md", checkpoints_dir)
+    current.set_current(checkpoints_dir / "active" / "chk-b.md", checkpoints_dir)
+
+    assert pointer.read_header_status(checkpoints_dir / "active" / "chk-a.md") == "active"
+    assert pointer.read_pointer(checkpoints_dir) == str(checkpoints_dir / "active" / "chk-b.md")
+
+
+def test_clear_current_records_no_current(checkpoints_dir):
+    """Clearing current leaves an empty pointer meaning "nothing is current"."""
+    current.set_current(checkpoints_dir / "active" / "chk-a.md", checkpoints_dir)
+
+    cleared = current.clear_current(checkpoints_dir)
+
+    assert cleared.id == "chk-a"
+    assert pointer.read_state(checkpoints_dir) == (True, None)
+    assert current.get_current(checkpoints_dir) is None
+
+
+def test_get_current_ignores_stale_pointer(checkpoints_dir):
+    """A hand-edited status wins over the pointer."""
+    current.set_current(checkpoints_dir / "active" / "chk-a.md", checkpoints_dir)
+    write_checkpoint(checkpoints_dir / "active" / "chk-a.md")
+    write_checkpoint(checkpoints_dir / "active" / "chk-b.md", status="current")
+
+    assert current.get_current(checkpoints_dir).id == "chk-b"
+    assert pointer.read_pointer(checkpoints_dir) == str(checkpoints_dir / "active" / "chk-b.md")
+
+
+def test_switching_current_does_not_scan(checkpoints_dir, monkeypatch):
+    """Once the pointer exists, switching touches only the two checkpoints."""
+    active = checkpoints_dir / "active"
+    current.set_current(active / "chk-a.md", checkpoints_dir)
+    monkeypatch.setattr(current, "scan_checkpoints", lambda *a, **k: pytest.fail("scanned"))
+
+    current.set_current(active / "chk-b.md", checkpoints_dir)
+    current.set_current(active / "chk-a.md", checkpoints_dir)
+    cleared = current.clear_current(checkpoints_dir)
+
+    assert cleared.id == "chk-a"
+    assert pointer.read_header_status(active / "chk-a.md") == "active"
+    assert pointer.read_header_status(active / "chk-b.md") == "active"
+    assert current.get_current(checkpoints_dir) is None
+
+
+def test_update_status_keeps_body_and_skips_noop(checkpoints_dir, monkeypatch):
+    """Only the status line changes, and an unchanged status writes nothing."""
+    path = checkpoints_dir / "active" / "chk-a.md"
+    body = "\n## Problem\n---\nstatus: current\n"
+    path.write_text("---\ncheckpoint: chk-a\nstatus: active\n---\n" + body)
+
+    current.update_frontmatter_status(path, "current")
+    assert path.read_text() == "---\ncheckpoint: chk-a\nstatus: current\n---\n" + body
+
+    monkeypatch.setattr(current.atomic, "write_atomic", lambda *a, **k: pytest.fail("wrote"))
+    current.update_frontmatter_status(path, "current")
+
+
+def test_repair_reconciles_pointer_and_frontmatter(checkpoints_dir):
+    """Repair keeps the pointed-to checkpoint and demotes other currents."""
+    active = checkpoints_dir / "active"
+    current.set_current(active / "chk-a.md", checkpoints_dir)
+    write_checkpoint(active / "chk-b.md", status="current")
+
+    assert current.repair_current(checkpoints_dir) == ["Set active: chk-b"]
+    assert pointer.read_header_status(active / "chk-b.md") == "active"
+    assert current.repair_current(checkpoints_dir) == []
+
+
+def test_hand_edit_behind_empty_pointer_is_found(checkpoints_dir):
+    """An empty pointer older than a file in active/ is not trusted."""
+    current.clear_current(checkpoints_dir)
+    assert current.get_current(checkpoints_dir) is None
+
+    edited = write_checkpoint(checkpoints_dir / "active" / "chk-b.md", status="current")
+    written = (checkpoints_dir / pointer.POINTER_FILENAME).stat().st_mtime_ns
+    os.utime(edited, ns=(written + 10**9, written + 10**9))
+
+    assert current.find_current_path(checkpoints_dir) == edited
+    assert pointer.read_pointer(checkpoints_dir) == str(edited)
+    assert current.repair_current(checkpoints_dir) == []
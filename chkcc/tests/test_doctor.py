@@ -163,3 +163,57 @@ def test_cmd_doctor_fix_then_healthy(tmp_path, capsys):
     assert exit_code == 0
     captured = capsys.readouterr()
     assert "All checks passed" in captured.out
+
+
+def test_cmd_doctor_reports_lineage_problems(tmp_path, capsys):
+    """A parent cycle fails the lineage check."""
+    base = tmp_path / "checkpoints"
+    doctor.cmd_doctor(base, tmp_path, fix=True)
+    for name, parent in [("chk-a", "chk-b"), ("chk-b", "chk-a")]:
+        (base / "active" / f"{name}.md").write_text(
+            f"---\ncheckpoint: {name}\ncreated: 2026-01-01T00:00:00Z\nparent: {parent}\n---\n"
+        )
+    capsys.readouterr()
+
+    exit_code = doctor.cmd_doctor(base, tmp_path)
+
+    assert exit_code == 1
+    captured = capsys.readouterr()
+    assert "✗ Parent cycle: chk-a -> chk-b -> chk-a" in captured.out
+    assert "frontmatter fields" in captured.out
+    assert "doctor --fix" not in captured.out
+
+
+def test_cmd_doctor_unknown_parent_is_a_warning(tmp_path, capsys):
+    """A dangling parent is reported but does not fail the check."""
+    base = tmp_path / "checkpoints"
+    doctor.cmd_doctor(base, tmp_path, fix=True)
+    (base / "active" / "chk-a.md").write_text(
+        "---\ncheckpoint: chk-a\ncreated: 2026-01-01T00:00:00Z\nparent: chk-gone\n---\n"
+    )
+    capsys.readouterr()
+
+    exit_code = doctor.cmd_doctor(base, tmp_path)
+
+    assert exit_code == 0
+    captured = capsys.readouterr()
+    assert "⚠ Unknown parent 'chk-gone' of chk-a" in captured.out
+    assert "All checks passed" in captured.out
+
+
+def test_cmd_doctor_fix_fails_on_lineage_problems(tmp_path, capsys):
+    """--fix can't repair a parent cycle, so it fails without claiming a fix."""
+    base = tmp_path / "checkpoints"
+    doctor.cmd_doctor(base, tmp_path, fix=True)
+    for name, parent in [("chk-a", "chk-b"), ("chk-b", "chk-a")]:
+        (base / "active" / f"{name}.md").write_text(
+            f"---\ncheckpoint: {name}\ncreated: 2026-01-01T00:00:00Z\nparent: {parent}\n---\n"
+        )
+    capsys.readouterr()
+
+    exit_code = doctor.cmd_doctor(base, tmp_path, fix=True)
+
+    assert exit_code == 1
+    captured = capsys.readouterr()
+    assert "Lineage errors need manual edits" in captured.out
+    assert "Fixed." not in captured.out
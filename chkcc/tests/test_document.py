@@ -0,0 +1,65 @@
+"""Tests for the single-pass checkpoint document model."""
+
+from chkcc.archive import extract_learnings, has_completion_section
+from chkcc.document import parse_document
+from chkcc.status import extract_next_action, extract_problem_summary
+
+BODY = """## Problem
+Fix the flaky build.
+
+## Essential Information
+
+### Decisions
+- **Cache**: keyed by mtime
+- **Parser**: single pass
+
+### Next Actions
+- [x] Write parser
+- [ ] Wire up status
+
+## Completion
+**Learnings**: Parse once, query many times.
+"""
+
+
+def test_parse_document_spans_and_counts():
+    """Sections and subsections record line spans and list-item counts."""
+    document = parse_document(BODY)
+
+    assert document.outline() == {
+        "Problem": [],
+        "Essential Information": ["Decisions", "Next Actions"],
+        "Completion": [],
+    }
+    decisions = document.find_subsection("essential", "decisions")
+    assert decisions.list_items == 2
+    assert document.lines[decisions.start] == "### Decisions"
+    assert document.text(decisions).startswith("- **Cache**")
+    assert document.text(document.find_section("problem")) == "Fix the flaky build."
+
+
+def test_subsection_before_first_section_is_content():
+    """A `### ` heading outside any section does not open a subsection."""
+    document = parse_document("### Stray\n- item\n## Problem\nX\n")
+
+    assert document.outline() == {"Problem": []}
+
+
+def test_extractors_share_one_parse():
+    """Status and archive extractors all read from the same document."""
+    document = parse_document(BODY)
+
+    assert extract_problem_summary(document) == "Fix the flaky build."
+    assert extract_next_action(document) == "Wire up status"
+    assert has_completion_section(document)
+    assert extract_learnings(document) == "Parse once, query many times."
+
+
+def test_extractors_on_missing_sections():
+    """Missing sections yield empty results rather than errors."""
+    document = parse_document("## Problem\n\n### Detail\n")
+
+    assert extract_problem_summary(document) == ""
+    assert extract_next_action(document) is None
+    assert not has_completion_section(document)
+    assert extract_learnings(document) is None
@@ -0,0 +1,163 @@
+"""Tests for the persistent checkpoint metadata index."""
+
+import json
+import os
+import time
+
+import pytest
+
+from chkcc import index
+from chkcc.index import INDEX_FILENAME, MetadataIndex
+from chkcc.status import cmd_status
+from chkcc.tests.helpers import write_checkpoint
+from chkcc.tree import scan_checkpoints
+
+def sections(name, trail=None):
+    """Body sections the index summarises, optionally with an Artifact Trail."""
+    essential = {"Next Actions": f"- [x] Done already\n- Next step for {name}"}
+    if trail:
+        essential = {"Artifact Trail": "| File | Status | Key Change |\n|---|---|---|\n" + trail, **essential}
+    return {"Problem": f"Problem of {name}.", "Essential Information": essential}
+
+
+@pytest.fixture
+def checkpoints_dir(tmp_path):
+    """Create a checkpoints directory with one active and one archived checkpoint."""
+    (tmp_path / "active").mkdir()
+    (tmp_path / "archive").mkdir()
+    write_checkpoint(tmp_path / "active" / "chk-a.md", status="current", sections=sections("chk-a"), age=10)
+    write_checkpoint(tmp_path / "archive" / "chk-b.md", sections=sections("chk-b"), age=10)
+    return tmp_path
+
+
+def test_scan_writes_index(checkpoints_dir):
+    """First scan persists metadata for every checkpoint."""
+    scan_checkpoints(checkpoints_dir)
+
+    data = json.loads((checkpoints_dir / INDEX_FILENAME).read_text())
+    assert set(data["entries"]) == {"active/chk-a.md", "archive/chk-b.md"}
+    meta = data["entries"]["active/chk-a.md"]["meta"]
+    assert meta["id"] == "chk-a"
+    assert meta["status"] == "current"
+    assert meta["problem"] == "Problem of chk-a."
+    assert meta["next_action"] == "Next step for chk-a"
+
+
+def test_scan_reuses_unchanged_entries(checkpoints_dir, monkeypatch):
+    """Unchanged files are served from the index without being parsed."""
+    scan_checkpoints(checkpoints_dir)
+
+    calls = []
+    original = index.read_metadata
+    monkeypatch.setattr(index, "read_metadata", lambda p: calls.append(p) or original(p))
+
+    checkpoints = scan_checkpoints(checkpoints_dir)
+
+    assert calls == []
+    assert {cp.id for cp in checkpoints} == {"chk-a", "chk-b"}
+    assert next(cp for cp in checkpoints if cp.id == "chk-a").created.year == 2026
+
+
+def test_scan_reparses_changed_file(checkpoints_dir):
+    """A file whose size or mtime changed is re-read."""
+    scan_checkpoints(checkpoints_dir)
+
+    write_checkpoint(checkpoints_dir / "active" / "chk-a.md", sections=sections("chk-a"), age=5)
+    checkpoints = scan_checkpoints(checkpoints_dir)
+
+    assert next(cp for cp in checkpoints if cp.id == "chk-a").status == "active"
+
+
+def test_scan_prunes_deleted_files(checkpoints_dir):
+    """Entries for removed files are dropped from the index."""
+    scan_checkpoints(checkpoints_dir)
+    (checkpoints_dir / "archive" / "chk-b.md").unlink()
+
+    scan_checkpoints(checkpoints_dir)
+
+    data = json.loads((checkpoints_dir / INDEX_FILENAME).read_text())
+    assert set(data["entries"]) == {"active/chk-a.md"}
+
+
+def test_filtered_scan_keeps_other_entries(checkpoints_dir):
+    """Scanning only active/ does not prune archive/ entries."""
+    scan_checkpoints(checkpoints_dir)
+    write_checkpoint(checkpoints_dir / "active" / "chk-c.md", sections=sections("chk-c"), age=10)
+
+    scan_checkpoints(checkpoints_dir, status_filter="active")
+
+    data = json.loads((checkpoints_dir / INDEX_FILENAME).read_text())
+    assert "archive/chk-b.md" in data["entries"]
+    assert "active/chk-c.md" in data["entries"]
+
+
+def test_recent_files_not_persisted(tmp_path):
+    """Files modified within the racy window are re-parsed next time."""
+    write_checkpoint(tmp_path / "active" / "chk-new.md", sections=sections("chk-new"))
+
+    scan_checkpoints(tmp_path)
+
+    data = json.loads((tmp_path / INDEX_FILENAME).read_text())
+    assert data["entries"] == {}
+
+
+def test_corrupt_index_is_rebuilt(checkpoints_dir):
+    """An unreadable index is ignored and rewritten."""
+    (checkpoints_dir / INDEX_FILENAME).write_text("{not json")
+
+    checkpoints = scan_checkpoints(checkpoints_dir)
+
+    assert len(checkpoints) == 2
+    data = json.loads((checkpoints_dir / INDEX_FILENAME).read_text())
+    assert data["version"] == index.INDEX_VERSION
+
+
+def test_non_checkpoint_files_cached_as_none(tmp_path):
+    """Files without checkpoint frontmatter are cached and skipped."""
+    (tmp_path / "active").mkdir()
+    write_checkpoint(tmp_path / "active" / "chk-a.md", sections=sections("chk-a"), age=10)
+    notes = tmp_path / "active" / "chk-notes.md"
+    notes.write_text("# Just notes\n")
+    os.utime(notes, (time.time() - 10, time.time() - 10))
+
+    assert [cp.id for cp in scan_checkpoints(tmp_path)] == ["chk-a"]
+
+    loaded = MetadataIndex.load(tmp_path)
+    assert loaded.entries["active/chk-notes.md"]["meta"] is None
+
+
+def test_status_uses_indexed_summaries(checkpoints_dir, capsys):
+    """Status output shows problem and next action from the index."""
+    cmd_status(checkpoints_dir)
+
+    captured = capsys.readouterr()
+    assert "-> Problem of chk-a." in captured.out
+    assert ">> Next step for chk-a" in captured.out
+
+
+def test_metadata_lists_artifact_trail(tmp_path):
+    """Artifact Trail rows are stored as normalized paths."""
+    trail = (
+        "| `./src/a.py` | created | A |\n| `src/b.py`, `src/c.py` | modified | B and C |\n"
+        "| src/a.py | modified | Again |"
+    )
+    path = write_checkpoint(tmp_path / "chk-a.md", sections=sections("chk-a", trail))
+
+    assert index.read_metadata(path)["artifacts"] == ["src/a.py", "src/b.py", "src/c.py"]
+
+
+def test_artifact_owners_follow_rescans(checkpoints_dir):
+    """The reverse index is updated as checkpoints change or disappear."""
+    a = checkpoints_dir / "active" / "chk-a.md"
+    write_checkpoint(a, sections=sections("chk-a", "| `src/a.py` | created | x |"))
+    scan_checkpoints(checkpoints_dir)
+    owners = MetadataIndex.load(checkpoints_dir).artifact_owners()
+    assert owners == {"src/a.py": {"active/chk-a.md"}}
+
+    write_checkpoint(a, sections=sections("chk-a", "| `src/z.py` | created | x |"), age=5)
+    scan_checkpoints(checkpoints_dir)
+    assert MetadataIndex.load(checkpoints_dir).artifact_owners() == {"src/z.py": {"active/chk-a.md"}}
+
+    a.unlink()
+    scan_checkpoints(checkpoints_dir)
+    assert MetadataIndex.load(checkpoints_dir).artifact_owners() == {}
@@ -0,0 +1,114 @@
+"""Tests for the INDEX.md model."""
+
+from chkcc import scaffold, validate
+from chkcc.archive import update_index
+from chkcc.index_md import IndexFile
+from chkcc.init import INDEX_TEMPLATE
+
+INDEX = """# Active Checkpoints
+
+| Checkpoint | Description | Last Updated |
+|------------|-------------|--------------|
+| chk-auth | User authentication   | 2024-01-15 |
+| chk-api | REST API restructuring | 2024-01-14 |
+
+---
+
+## chk-auth
+
+**Problem**: JWT auth.
+
+**Scope**: `src/auth/`
+
+**Status**: In progress.
+
+---
+
+## chk-api
+
+**Problem**: GraphQL migration.
+
+**Scope**: `src/api/`
+
+**Status**: Schema defined.
+"""
+
+
+def test_round_trip_is_verbatim():
+    """Parsing and serializing an untouched index reproduces it exactly."""
+    assert IndexFile(INDEX).serialize() == INDEX
+    empty = INDEX_TEMPLATE.format(title="Active", status="active")
+    assert IndexFile(empty).serialize() == empty
+
+
+def test_remove_takes_row_section_and_separator():
+    """Removing an entry drops its row, its section and the rule before it."""
+    index = IndexFile(INDEX)
+
+    assert index.remove("chk-auth")
+    assert not index.remove("chk-missing")
+
+    content = index.serialize()
+    assert "chk-auth" not in content
+    assert "| chk-api | REST API restructuring | 2024-01-14 |\n\n---\n\n## chk-api\n" in content
+    assert validate.validate_index(content).valid
+
+
+def test_remove_last_entry_adds_empty_state():
+    """The empty state message appears once no rows remain."""
+    index = IndexFile(INDEX)
+    index.remove("chk-auth")
+    index.remove("chk-api")
+
+    content = index.serialize()
+    assert content.endswith("|--------------|\n\n*No active checkpoints.*\n")
+    assert validate.validate_index(content).valid
+
+
+def test_validate_reports_duplicate_rows():
+    """Duplicate table rows are flagged."""
+    content = INDEX.replace(
+        "| chk-api | REST", "| chk-api | Again | 2024-01-14 |\n| chk-api | REST"
+    )
+
+    result = validate.validate_index(content)
+
+    assert "Duplicate table entry 'chk-api'" in result.structural_warnings
+
+
+def test_scaffold_leaves_index_alone_and_archive_removes_entry(tmp_path):
+    """Scaffolding doesn't touch INDEX.md; archiving removes the entry."""
+    active = tmp_path / "active"
+    active.mkdir()
+    index_path = active / "INDEX.md"
+    empty = INDEX_TEMPLATE.format(title="Active", status="active")
+    index_path.write_text(empty)
+
+    path = scaffold.scaffold_checkpoint("feature", output_dir=active)
+    scaffold.scaffold_delta(path)
+    assert index_path.read_text() == empty
+
+    index_path.write_text(
+        empty.replace("\n---\n\n*No active checkpoints.*", "| chk-feature | Feature | 2024-02-01 |\n")
+        + "\n---\n\n## chk-feature\n\n**Problem**: P\n"
+    )
+    update_index(index_path, "chk-feature")
+    assert index_path.read_text() == empty.replace(
+        "\n---\n\n*No active checkpoints.*", "\n*No active checkpoints.*"
+    )
+
+
+def test_unstarred_empty_state_is_recognized():
+    """A plain "No active checkpoints." line counts as the empty state message."""
+    empty = INDEX_TEMPLATE.format(title="Active", status="active").replace(
+        "\n---\n\n*No active checkpoints.*", "\nNo active checkpoints."
+    )
+    assert IndexFile(empty).has_empty_state()
+    assert validate.validate_index(empty).structural_warnings == []
+
+    # A stale message left under rows isn't repeated when the last row goes
+    stale = INDEX.replace("\n---\n\n## chk-auth", "\nNo active checkpoints.\n\n---\n\n## chk-auth", 1)
+    index = IndexFile(stale)
+    index.remove("chk-auth")
+    index.remove("chk-api")
+    assert index.serialize().count("No active checkpoints") == 1
@@ -107,3 +107,15 @@ def test_install_hooks_skips_duplicate(tmp_path):
 
     assert results[0][0] is False  # SessionStart already installed
     assert "already installed" in results[0][1]
+
+
+def test_create_gitignore(tmp_path):
+    """Init ignores chkcc cache files inside the checkpoints directory."""
+    base = tmp_path / "checkpoints"
+    base.mkdir()
+
+    created = init.create_gitignore(base)
+
+    assert created == [str(base / ".gitignore")]
+    assert ".chkcc-*" in (base / ".gitignore").read_text()
+    assert init.create_gitignore(base) == []
@@ -0,0 +1,141 @@
+"""Tests for the checkpoint lineage graph."""
+
+from argparse import Namespace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from chkcc.cli import cmd_lineage
+from chkcc.lineage import Lineage
+from chkcc.tree import Checkpoint
+
+START = datetime(2026, 1, 1)
+
+
+def make(checkpoint_id, parent=None, day=0, archived=False):
+    """Build an in-memory checkpoint."""
+    return Checkpoint(
+        id=checkpoint_id,
+        created=START + timedelta(days=day),
+        parent=parent,
+        path=Path(f"{checkpoint_id}.md"),
+        is_archived=archived,
+    )
+
+
+@pytest.fixture
+def lineage():
+    """root -> (a -> (a1, a2), b); orphan's parent is unknown."""
+    return Lineage([
+        make("a2", "a", 4),
+        make("root", None, 0),
+        make("b", "root", 2),
+        make("a", "root", 1),
+        make("a1", "a", 3),
+        make("orphan", "missing", 5),
+    ])
+
+
+def test_children_and_roots(lineage):
+    """Children are sorted oldest first; unknown parents make roots."""
+    assert [cp.id for cp in lineage.children[None]] == ["root", "orphan"]
+    assert [cp.id for cp in lineage.children_of("root")] == ["a", "b"]
+    assert lineage.children_of("a1") == []
+
+
+def test_interval_queries(lineage):
+    """Ancestor checks, descendants and subtree sizes come from the intervals."""
+    assert lineage.is_ancestor("root", "a2")
+    assert lineage.is_ancestor("a", "a1")
+    assert not lineage.is_ancestor("a", "b")
+    assert not lineage.is_ancestor("a", "a")
+    assert not lineage.is_ancestor("root", "orphan")
+    assert [cp.id for cp in lineage.descendants("root")] == ["a", "a1", "a2", "b"]
+    assert lineage.subtree_size("a") == 3
+    assert lineage.depth["a2"] == 2
+
+
+def test_ancestors_and_path(lineage):
+    """Ancestors run parent first; the path runs root first."""
+    assert [cp.id for cp in lineage.ancestors("a2")] == ["a", "root"]
+    assert [cp.id for cp in lineage.path("a2")] == ["root", "a", "a2"]
+    assert [cp.id for cp in lineage.path("orphan")] == ["orphan"]
+    with pytest.raises(ValueError, match="No checkpoint"):
+        lineage.path("nope")
+
+
+def test_cycles_are_broken_at_their_oldest_checkpoint():
+    """A parent cycle is reported and its oldest checkpoint becomes a root."""
+    lineage = Lineage([make("y", "z", 2), make("x", "y", 1), make("z", "x", 3), make("w", "z", 4)])
+
+    assert [[cp.id for cp in cycle] for cycle in lineage.problems.cycles] == [["x", "y", "z"]]
+    assert [cp.id for cp in lineage.children[None]] == ["x"]
+    assert [cp.id for cp in lineage.descendants("x")] == ["z", "y", "w"]
+    assert lineage.ancestors("x") == []
+    assert lineage.problems.errors() == ["Parent cycle: x -> y -> z -> x (showing x as a root)"]
+
+
+def test_duplicates_and_dangling_parents():
+    """The first checkpoint with an id is kept; unknown parents are reported."""
+    first = make("a")
+    lineage = Lineage([first, make("a", archived=True), make("b", "gone", 1)])
+
+    assert lineage.get("a") is first
+    assert [cp.id for cp in lineage.order] == ["a", "b"]
+    assert list(lineage.problems.duplicates) == ["a"]
+    assert [cp.id for cp in lineage.problems.dangling] == ["b"]
+    assert lineage.problems.warnings() == ["Unknown parent 'gone' of b (b.md), shown as a root"]
+    assert not Lineage([make("r"), make("s", "r", 1)]).problems
+
+
+def test_long_cycle_detection_is_linear():
+    """A cycle through every checkpoint is found without quadratic rescans."""
+    size = 50_000
+    checkpoints = [make(f"c{n}", f"c{(n + 1) % size}", n) for n in range(size)]
+
+    lineage = Lineage(checkpoints)
+
+    assert len(lineage.problems.cycles) == 1
+    assert len(lineage.problems.cycles[0]) == size
+    assert lineage.subtree_size("c0") == size
+
+
+def test_deep_chain_without_recursion():
+    """Chains deeper than the recursion limit are indexed iteratively."""
+    chain = [make("c0")] + [make(f"c{n}", f"c{n - 1}", n) for n in range(1, 5000)]
+    lineage = Lineage(chain)
+
+    assert lineage.is_ancestor("c0", "c4999")
+    assert lineage.subtree_size("c0") == 5000
+    assert len(lineage.ancestors("c4999")) == 4999
+
+
+def test_cmd_lineage(tmp_path, capsys):
+    """The CLI prints the requested query, indented by depth."""
+    active = tmp_path / "active"
+    active.mkdir()
+    for name, parent, day in [("chk-root", None, 1), ("chk-mid", "chk-root", 2), ("chk-leaf", "chk-mid", 3)]:
+        parent_line = f"parent: {parent}\n" if parent else ""
+        (active / f"{name}.md").write_text(
+            f"---\ncheckpoint: {name}\ncreated: 2026-01-0{day}T10:00:00Z\n{parent_line}---\n\n## Problem\nP.\n"
+        )
+    args = Namespace(dir=str(tmp_path), checkpoint="chk-leaf", mode="path", jobs=1, format="text")
+
+    assert cmd_lineage(args) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "chk-root (2026-01-01) [active]",
+        "  chk-mid (2026-01-02) [active]",
+        "    chk-leaf (2026-01-03) [active]",
+    ]
+
+    args.checkpoint, args.mode = "chk-root.md", "descendants"
+    assert cmd_lineage(args) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "chk-mid (2026-01-02) [active]",
+        "  chk-leaf (2026-01-03) [active]",
+    ]
+
+    args.checkpoint = "chk-missing"
+    assert cmd_lineage(args) == 1
+    assert "No checkpoint with id 'chk-missing'" in capsys.readouterr().err
@@ -0,0 +1,121 @@
+"""Tests for cross-process locking of read-modify-write operations."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import chkcc
+from chkcc import lock, pointer
+from chkcc.tests.helpers import write_checkpoint
+
+WRITERS = 24
+ROUNDS = 4
+
+INDEX = """# Active Checkpoints
+
+| Checkpoint | Description | Last Updated |
+|------------|-------------|--------------|
+| chk-shared | Shared | 2026-01-03 |
+"""
+
+WRITER = """
+import sys
+from pathlib import Path
+from chkcc import archive, current, scaffold
+
+base_dir = Path(sys.argv[1])
+number = int(sys.argv[2])
+active = base_dir / "active"
+for round in range(int(sys.argv[3])):
+    current.set_current(active / f"chk-{number}.md", base_dir)
+    scaffold.scaffold_delta(active / "chk-shared.md")
+    archive.append_to_learnings(base_dir, f"chk-{number}", f"Lesson {number}.{round}")
+"""
+
+
+def run_python(script, *args):
+    """Start a Python process with chkcc importable."""
+    env = {**os.environ, "PYTHONPATH": str(Path(chkcc.__file__).parent.parent)}
+    return subprocess.Popen(
+        [sys.executable, "-c", script, *map(str, args)],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def test_lock_is_reentrant(tmp_path):
+    """Nested acquisitions in one process don't deadlock."""
+    with lock.locked(tmp_path, timeout=0):
+        with lock.locked(tmp_path, timeout=0):
+            pass
+        with lock.locked(tmp_path, timeout=0):
+            pass
+
+    assert lock._held == {}
+
+
+def test_lock_times_out_while_held_elsewhere(tmp_path):
+    """Waiting for a lock another process holds gives up after the timeout."""
+    holder = run_python(
+        "import sys, time\n"
+        "from chkcc import lock\n"
+        "with lock.locked(sys.argv[1]):\n"
+        "    print('locked', flush=True)\n"
+        "    time.sleep(60)\n",
+        tmp_path,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        with pytest.raises(lock.LockTimeout):
+            with lock.locked(tmp_path, timeout=0.2):
+                pass
+    finally:
+        holder.kill()
+        holder.communicate(timeout=10)
+
+    # The lock is released when the holder dies
+    with lock.locked(tmp_path, timeout=5):
+        pass
+
+
+def test_timeout_from_environment(monkeypatch):
+    """CHKCC_LOCK_TIMEOUT overrides the default timeout."""
+    monkeypatch.setenv(lock.TIMEOUT_ENV, "2.5")
+    assert lock.get_timeout() == 2.5
+    monkeypatch.setenv(lock.TIMEOUT_ENV, "soon")
+    assert lock.get_timeout() == lock.DEFAULT_TIMEOUT
+
+
+def test_concurrent_writers_keep_invariants(tmp_path):
+    """Dozens of processes switching current and appending never lose updates."""
+    active = tmp_path / "active"
+    active.mkdir()
+    for number in range(WRITERS):
+        write_checkpoint(active / f"chk-{number}.md", status=None)
+    write_checkpoint(active / "chk-shared.md", status=None)
+    (active / "INDEX.md").write_text(INDEX)
+
+    writers = [run_python(WRITER, tmp_path, number, ROUNDS) for number in range(WRITERS)]
+    for writer in writers:
+        _, stderr = writer.communicate(timeout=120)
+        assert writer.returncode == 0, stderr
+
+    statuses = {
+        path.stem: pointer.read_header_status(path) for path in active.glob("chk-*.md")
+    }
+    current_ids = [name for name, status in statuses.items() if status == "current"]
+    assert len(current_ids) == 1
+    assert Path(pointer.read_pointer(tmp_path)).stem == current_ids[0]
+
+    shared = (active / "chk-shared.md").read_text()
+    assert shared.count("## Delta:") == WRITERS * ROUNDS
+    assert shared.startswith("---\ncheckpoint: chk-shared\n")
+
+    learnings = (tmp_path / "LEARNINGS.md").read_text()
+    assert learnings.count("# Learnings") == 1
+    assert learnings.count("- Lesson ") == WRITERS * ROUNDS
@@ -0,0 +1,113 @@
+"""Tests for --format json/ndjson output."""
+
+import json
+import sys
+
+import pytest
+
+from chkcc import cli
+from chkcc.tests.helpers import write_checkpoint
+
+
+def sections(name):
+    """Body sections that pass structural validation."""
+    essential = {"Decisions": "- **A**: B", "Current State": "OK", "Next Actions": f"- [ ] Next for {name}"}
+    return {"Problem": f"Problem of {name}.", "Essential Information": essential}
+
+
+@pytest.fixture
+def checkpoints_dir(tmp_path):
+    """Create a small lineage: root -> child (current), plus an archived leaf."""
+    (tmp_path / "active").mkdir()
+    (tmp_path / "archive").mkdir()
+    write_checkpoint(tmp_path / "active" / "chk-root.md", created="2026-01-01T10:00:00Z", sections=sections("chk-root"))
+    write_checkpoint(
+        tmp_path / "active" / "chk-child.md",
+        created="2026-01-02T10:00:00Z",
+        status="current",
+        parent="chk-root",
+        sections=sections("chk-child"),
+    )
+    write_checkpoint(
+        tmp_path / "archive" / "chk-done.md",
+        created="2026-01-03T10:00:00Z",
+        parent="chk-child",
+        sections=sections("chk-done"),
+    )
+    return tmp_path
+
+
+def run_cli(monkeypatch, capsys, *argv):
+    """Run the CLI and return (exit code, stdout)."""
+    monkeypatch.setattr(sys, "argv", ["chkcc", *argv])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    return exc.value.code, capsys.readouterr().out
+
+
+def test_tree_json_in_render_order(monkeypatch, capsys, checkpoints_dir):
+    """Tree JSON lists checkpoints depth-first with their depth."""
+    code, out = run_cli(monkeypatch, capsys, "tree", str(checkpoints_dir), "--format", "json")
+
+    records = json.loads(out)
+    assert code == 0
+    assert [(r["id"], r["depth"], r["display_status"]) for r in records] == [
+        ("chk-root", 0, "active"),
+        ("chk-child", 1, "current"),
+        ("chk-done", 2, "archived"),
+    ]
+    assert records[0]["created"] == "2026-01-01T10:00:00+00:00"
+
+
+def test_tree_json_rejects_collapse(monkeypatch, capsys, checkpoints_dir):
+    """--collapse folds text lines only, so it is refused with json/ndjson."""
+    monkeypatch.setattr(sys, "argv", ["chkcc", "tree", str(checkpoints_dir), "--collapse", "--format", "ndjson"])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+
+    assert exc.value.code == 2
+    assert "--collapse only applies to --format text" in capsys.readouterr().err
+
+
+def test_status_ndjson_one_record_per_line(monkeypatch, capsys, checkpoints_dir):
+    """Status NDJSON emits one checkpoint per line with extracted summaries."""
+    code, out = run_cli(monkeypatch, capsys, "status", str(checkpoints_dir), "--format", "ndjson")
+
+    records = [json.loads(line) for line in out.splitlines()]
+    assert code == 0
+    assert {r["id"]: r["next_action"] for r in records} == {
+        "chk-root": "Next for chk-root",
+        "chk-child": "Next for chk-child",
+    }
+    assert all(r["problem"] == f"Problem of {r['id']}." for r in records)
+
+
+def test_status_json_sorted_current_first(monkeypatch, capsys, checkpoints_dir):
+    """Status JSON keeps the text ordering: current first, then newest."""
+    _, out = run_cli(monkeypatch, capsys, "status", str(checkpoints_dir), "-a", "--format", "json")
+
+    assert [r["id"] for r in json.loads(out)] == ["chk-child", "chk-done", "chk-root"]
+
+
+def test_validate_ndjson_and_exit_code(monkeypatch, capsys, checkpoints_dir):
+    """Validate NDJSON carries the result lists and fails if any file fails."""
+    (checkpoints_dir / "active" / "chk-bad.md").write_text("---\ncheckpoint: chk-bad\n---\n\n## Problem\nX\n")
+
+    code, out = run_cli(monkeypatch, capsys, "validate", str(checkpoints_dir), "--format", "ndjson")
+
+    records = {json.loads(line)["path"].rsplit("/", 1)[1]: json.loads(line) for line in out.splitlines()}
+    assert code == 1
+    assert records["chk-root.md"]["valid"] is True
+    assert records["chk-bad.md"]["valid"] is False
+    assert records["chk-bad.md"]["errors"]
+    assert set(records["chk-root.md"]) >= {"errors", "structural_warnings", "advisory_warnings"}
+
+
+def test_current_json(monkeypatch, capsys, checkpoints_dir, tmp_path_factory):
+    """Current JSON is the checkpoint record, or null when there is none."""
+    _, out = run_cli(monkeypatch, capsys, "current", "--dir", str(checkpoints_dir), "--format", "json")
+    assert json.loads(out)["id"] == "chk-child"
+
+    empty = tmp_path_factory.mktemp("empty")
+    _, out = run_cli(monkeypatch, capsys, "current", "--dir", str(empty), "--format", "json")
+    assert json.loads(out) is None
@@ -1,9 +1,12 @@
 """Tests for chkcc prime command."""
 
+import os
+
 import pytest
 from argparse import Namespace
 from pathlib import Path
 
+from chkcc import prime
 from chkcc.cli import cmd_prime
 
 
@@ -64,3 +67,129 @@ def test_prime_missing_dir_silent_exit(tmp_path, capsys):
     assert exit_code == 0
     captured = capsys.readouterr()
     assert captured.out == ""
+
+
+def test_prime_uses_pointer_without_scanning(checkpoint_dir, capsys, monkeypatch):
+    """Prime reads the pointed-to checkpoint without scanning active/."""
+    from chkcc import pointer, tree
+
+    pointer.write_pointer(checkpoint_dir, checkpoint_dir / "active" / "chk-test.md")
+    monkeypatch.setattr(tree, "scan_checkpoints", lambda *a, **k: pytest.fail("scanned"))
+
+    exit_code = prime.prime(str(checkpoint_dir))
+
+    assert exit_code == 0
+    assert "Test problem." in capsys.readouterr().out
+
+
+def test_prime_stale_pointer_falls_back_and_repairs(checkpoint_dir, capsys):
+    """A pointer to a non-current checkpoint is ignored and rewritten."""
+    from chkcc import pointer
+
+    other = checkpoint_dir / "active" / "chk-other.md"
+    other.write_text("---\ncheckpoint: chk-other\ncreated: 2026-01-03T10:00:00Z\nstatus: active\n---\n")
+    pointer.write_pointer(checkpoint_dir, other)
+
+    prime.prime(str(checkpoint_dir))
+
+    assert "checkpoint: chk-test" in capsys.readouterr().out
+    assert pointer.read_pointer(checkpoint_dir) == str(checkpoint_dir / "active" / "chk-test.md")
+
+
+def test_prime_parse_args():
+    """Fast path handles --dir and defers anything else to argparse."""
+    assert prime.parse_args([]) == ("./checkpoints", None)
+    assert prime.parse_args(["--dir", "x"]) == ("x", None)
+    assert prime.parse_args(["--dir=y", "--budget", "500"]) == ("y", 500)
+    assert prime.parse_args(["--budget=0"]) is None
+    assert prime.parse_args(["--help"]) is None
+
+
+def test_budgeted_prime_is_cached_by_mtime(checkpoint_dir, capsys, monkeypatch):
+    """A repeat budgeted prime reuses the rendering until the checkpoint changes."""
+    from chkcc import budget
+
+    checkpoint = checkpoint_dir / "active" / "chk-test.md"
+    checkpoint.write_text(checkpoint.read_text() + "\n## Notes\n" + "Filler line.\n" * 200)
+
+    prime.prime(str(checkpoint_dir), budget=60)
+    first = capsys.readouterr().out
+    assert "Test problem." in first
+    assert "Filler line." not in first
+    assert "omitted" in first
+
+    monkeypatch.setattr(budget, "render_budgeted", lambda *a: pytest.fail("re-rendered"))
+    prime.prime(str(checkpoint_dir), budget=60)
+    assert capsys.readouterr().out == first
+
+    monkeypatch.undo()
+    checkpoint.write_text(checkpoint.read_text().replace("Test problem.", "Changed problem."))
+    prime.prime(str(checkpoint_dir), budget=60)
+    assert "Changed problem." in capsys.readouterr().out
+
+
+def no_lookup(monkeypatch):
+    """Fail the test if prime resolves the current checkpoint itself."""
+    monkeypatch.setattr(prime, "find_current_path", lambda *a: pytest.fail("looked up"))
+
+
+def test_snapshot_written_by_commands_serves_prime(checkpoint_dir, capsys, monkeypatch):
+    """Commands that change the current state leave a snapshot prime emits as is."""
+    from chkcc import current, scaffold
+
+    checkpoint = checkpoint_dir / "active" / "chk-test.md"
+    current.set_current(checkpoint, checkpoint_dir)
+    scaffold.scaffold_delta(checkpoint)
+    no_lookup(monkeypatch)
+
+    prime.prime(str(checkpoint_dir))
+    assert capsys.readouterr().out == checkpoint.read_text()
+
+    current.clear_current(checkpoint_dir)
+    prime.prime(str(checkpoint_dir))
+    assert capsys.readouterr().out == ""
+
+
+def test_stale_snapshot_falls_back_and_is_rewritten(checkpoint_dir, capsys, monkeypatch):
+    """A checkpoint edited after the snapshot was taken is read directly."""
+    from chkcc import current
+
+    checkpoint = checkpoint_dir / "active" / "chk-test.md"
+    current.set_current(checkpoint, checkpoint_dir)
+    checkpoint.write_text(checkpoint.read_text() + "\nEdited by hand.\n")
+
+    prime.prime(str(checkpoint_dir))
+    assert "Edited by hand." in capsys.readouterr().out
+
+    no_lookup(monkeypatch)
+    prime.prime(str(checkpoint_dir))
+    assert "Edited by hand." in capsys.readouterr().out
+
+
+def test_no_current_snapshot_rejected_after_hand_edit(checkpoint_dir, capsys):
+    """A checkpoint set to current by hand behind a "no current" snapshot is primed."""
+    from chkcc import current
+
+    checkpoint = checkpoint_dir / "active" / "chk-test.md"
+    current.clear_current(checkpoint_dir)
+    checkpoint.write_text(checkpoint.read_text().replace("status: active", "status: current"))
+    written = (checkpoint_dir / prime.POINTER_FILENAME).stat().st_mtime_ns
+    os.utime(checkpoint, ns=(written + 10**9, written + 10**9))
+
+    prime.prime(str(checkpoint_dir))
+
+    assert capsys.readouterr().out == checkpoint.read_text()
+
+
+def test_archiving_current_clears_snapshot(checkpoint_dir, capsys):
+    """An archived checkpoint is no longer primed."""
+    from chkcc import archive, current
+
+    checkpoint = checkpoint_dir / "active" / "chk-test.md"
+    checkpoint.write_text(checkpoint.read_text() + "\n## Completion\n**Learnings**: None noted\n")
+    current.set_current(checkpoint, checkpoint_dir)
+
+    archive.archive_checkpoint(checkpoint)
+    prime.prime(str(checkpoint_dir))
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,167 @@
+"""Tests for full-text search over checkpoints."""
+
+from argparse import Namespace
+
+import pytest
+
+from chkcc import scaffold, search
+from chkcc.cli import cmd_search
+from chkcc.document import parse_document
+from chkcc.tests.helpers import render_sections, write_checkpoint
+
+OLD = 1_700_000_000
+
+
+def sections(problem="Add login.", decisions="- None"):
+    """Body with every indexed section plus some free text."""
+    trail = (
+        "| File | Status | Key Change |\n|------|--------|------------|\n"
+        "| `src/auth/session.py` | modified | Session store |"
+    )
+    essential = {"Decisions": decisions, "Artifact Trail": trail, "Next Actions": "- Keep going"}
+    return {"Problem": problem, "Essential Information": essential}
+
+
+def sync(base_dir):
+    """Run one incremental sync and return (updated, removed)."""
+    db = search.open_index(base_dir)
+    try:
+        return search.sync_index(db, base_dir)
+    finally:
+        db.close()
+
+
+def test_section_fields():
+    """Sections land in their own columns; everything else in body."""
+    body = render_sections(sections(problem="Slow login.", decisions="- Use JWT"))
+
+    fields = search.section_fields(parse_document(body))
+
+    assert fields["problem"] == "Slow login."
+    assert fields["decisions"] == "- Use JWT"
+    assert "src/auth/session.py" in fields["artifacts"]
+    assert "Keep going" in fields["body"]
+    assert "JWT" not in fields["body"]
+
+
+def test_guidance_comments_are_not_indexed(tmp_path):
+    """A fresh scaffold doesn't match words found only in template comments."""
+    (tmp_path / "active").mkdir()
+    path = scaffold.scaffold_checkpoint("fresh", output_dir=tmp_path / "active")
+    scaffold.scaffold_delta(path)
+
+    assert search.search(tmp_path, "rationale") == []
+    assert search.search(tmp_path, "accomplished") == []
+
+
+def test_search_ranks_decisions_above_mentions(tmp_path):
+    """A term recorded as a decision outranks a passing mention in the problem."""
+    mention = sections(problem="Someone said redis once.")
+    decided = sections(decisions="- Cache: redis (not memcached)")
+    write_checkpoint(tmp_path / "active" / "chk-mention.md", sections=mention, mtime=OLD)
+    write_checkpoint(tmp_path / "archive" / "chk-decided.md", sections=decided, mtime=OLD)
+
+    results = search.search(tmp_path, "redis", field="decisions")
+    assert [r.checkpoint for r in results] == ["chk-decided"]
+    assert results[0].kind == "archive"
+    assert "[redis]" in results[0].snippet
+
+    results = search.search(tmp_path, "redis")
+    assert {r.checkpoint for r in results} == {"chk-mention", "chk-decided"}
+
+
+def test_search_includes_learnings_entries(tmp_path):
+    """Each LEARNINGS.md entry is a result of its own."""
+    (tmp_path / "active").mkdir()
+    (tmp_path / "LEARNINGS.md").write_text(
+        "# Learnings\n\n## 2026-01-02 — chk-a\n- Rotate refresh tokens\n\n"
+        "## 2026-01-05 — chk-b\n- Pin the SDK version\n"
+    )
+
+    results = search.search(tmp_path, "rotate")
+
+    assert [(r.checkpoint, r.kind) for r in results] == [("chk-a", "learnings")]
+
+
+def test_sync_reindexes_only_changed_files(tmp_path):
+    """Unchanged files are skipped; edits and deletions are picked up."""
+    write_checkpoint(tmp_path / "active" / "chk-a.md", sections=sections(), mtime=OLD)
+    stale = write_checkpoint(tmp_path / "active" / "chk-b.md", sections=sections(), mtime=OLD)
+    assert sync(tmp_path) == (2, 0)
+    assert sync(tmp_path) == (0, 0)
+
+    passkeys = sections(problem="Add passkeys.")
+    write_checkpoint(tmp_path / "active" / "chk-a.md", sections=passkeys, mtime=OLD + 10)
+    stale.unlink()
+
+    assert sync(tmp_path) == (1, 1)
+    assert [r.checkpoint for r in search.search(tmp_path, "passkeys")] == ["chk-a"]
+    assert search.search(tmp_path, "login") == []
+
+
+def test_archived_checkpoint_moves_with_its_file(tmp_path):
+    """Moving a checkpoint to archive/ updates its kind, without duplicates."""
+    path = write_checkpoint(tmp_path / "active" / "chk-a.md", sections=sections(), mtime=OLD)
+    search.search(tmp_path, "login")
+    (tmp_path / "archive").mkdir()
+    path.rename(tmp_path / "archive" / path.name)
+
+    results = search.search(tmp_path, "login")
+
+    assert [(r.checkpoint, r.kind) for r in results] == [("chk-a", "archive")]
+
+
+def test_corrupt_index_is_rebuilt(tmp_path):
+    """The database is a cache: garbage is replaced, not reported."""
+    write_checkpoint(tmp_path / "active" / "chk-a.md", sections=sections(), mtime=OLD)
+    (tmp_path / search.SEARCH_FILENAME).write_bytes(b"not a database" * 100)
+
+    assert [r.checkpoint for r in search.search(tmp_path, "login")] == ["chk-a"]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("jwt tokens", '"jwt" "tokens"'),
+        ("src/auth.py", '"src/auth.py"'),
+        ('"refresh token"', '"refresh token"'),
+        ("auth*", '"auth"*'),
+        ("decisions:jwt", 'decisions : "jwt"'),
+        ("http://x", '"http://x"'),
+    ],
+)
+def test_build_query(query, expected):
+    """User input is quoted so FTS5 syntax can't break the query."""
+    assert search.build_query(query) == expected
+
+
+def test_build_query_rejects_empty_and_unknown_field():
+    """Empty queries and unknown --field values are errors."""
+    with pytest.raises(ValueError, match="empty"):
+        search.build_query('""')
+    with pytest.raises(ValueError, match="Unknown search field"):
+        search.build_query("x", field="title")
+
+
+def test_cmd_search(tmp_path, capsys):
+    """The CLI prints the checkpoint, kind, path and a snippet."""
+    argon2 = sections(decisions="- Use argon2 for hashing")
+    write_checkpoint(tmp_path / "active" / "chk-a.md", sections=argon2, mtime=OLD)
+    args = Namespace(
+        dir=str(tmp_path), query=["argon2"], limit=10, field=None, status="all", format="text"
+    )
+
+    assert cmd_search(args) == 0
+    output = capsys.readouterr().out
+    assert "chk-a  [active]  active/chk-a.md" in output
+    assert "[argon2]" in output
+
+
+def test_cmd_search_missing_dir(tmp_path, capsys):
+    """A missing checkpoints directory is an error."""
+    args = Namespace(
+        dir=str(tmp_path / "none"), query=["x"], limit=10, field=None, status="all", format="text"
+    )
+
+    assert cmd_search(args) == 1
+    assert "not found" in capsys.readouterr().err
@@ -0,0 +1,165 @@
+"""Tests for checkpoint scanning and tree rendering."""
+
+import pytest
+
+from chkcc import tree
+from chkcc.tests.helpers import write_checkpoint
+
+
+@pytest.fixture
+def many_checkpoints(tmp_path):
+    """Create 40 active and 40 archived checkpoints."""
+    (tmp_path / "active").mkdir()
+    (tmp_path / "archive").mkdir()
+    for n in range(40):
+        write_checkpoint(tmp_path / "active" / f"chk-a{n}.md")
+        write_checkpoint(tmp_path / "archive" / f"chk-b{n}.md", parent=f"chk-a{n}")
+    return tmp_path
+
+
+def test_parallel_scan_matches_serial(many_checkpoints):
+    """A threaded scan returns the same checkpoints in the same order."""
+    serial = tree.scan_checkpoints(many_checkpoints)
+    parallel = tree.scan_checkpoints(many_checkpoints, jobs=8)
+
+    assert [(cp.id, cp.path, cp.is_archived) for cp in parallel] == [
+        (cp.id, cp.path, cp.is_archived) for cp in serial
+    ]
+    assert len(parallel) == 80
+
+
+def test_parallel_scan_warns_on_duplicate_current(tmp_path, capsys):
+    """The duplicate-current warning survives concurrent scanning."""
+    (tmp_path / "active").mkdir()
+    write_checkpoint(tmp_path / "active" / "chk-x.md", status="current")
+    write_checkpoint(tmp_path / "active" / "chk-y.md", status="current")
+
+    tree.scan_checkpoints(tmp_path, jobs=4)
+
+    assert "Found 2 checkpoints with status 'current'" in capsys.readouterr().err
+
+
+def test_scan_rejects_invalid_jobs(tmp_path):
+    """Worker count must be positive."""
+    with pytest.raises(ValueError):
+        tree.scan_checkpoints(tmp_path, jobs=0)
+
+
+def test_show_tree_with_jobs(many_checkpoints):
+    """Tree output does not depend on the worker count."""
+    assert tree.show_tree(many_checkpoints, jobs=4) == tree.show_tree(many_checkpoints)
+
+
+def make_chain(depth):
+    """Build an in-memory linear lineage chk-0 <- chk-1 <- ... of the given depth."""
+    from datetime import datetime, timedelta
+    from pathlib import Path
+
+    start = datetime(2026, 1, 1)
+    return [
+        tree.Checkpoint(
+            id=f"chk-{n}",
+            created=start + timedelta(minutes=n),
+            parent=f"chk-{n - 1}" if n else None,
+            path=Path(f"chk-{n}.md"),
+        )
+        for n in range(depth)
+    ]
+
+
+def test_render_deep_chain_without_recursion():
+    """Chains far deeper than the recursion limit render fine."""
+    import io
+    import sys
+
+    depth = sys.getrecursionlimit() * 3
+    stream = io.StringIO()
+
+    tree.write_tree(tree.build_tree(make_chain(depth)), stream)
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == depth
+    assert lines[-1].startswith("    " * (depth - 2) + f"└── ○ chk-{depth - 1} (")
+
+
+def test_render_tree_layout():
+    """Siblings, connectors and childless roots keep their layout."""
+    checkpoints = make_chain(3)
+    checkpoints.append(tree.Checkpoint(id="chk-x", created=None, parent="chk-0", path=None, is_archived=True))
+    checkpoints.append(tree.Checkpoint(id="chk-lone", created=None, parent=None, path=None))
+
+    lines = tree.render_tree(tree.build_tree(checkpoints), {})
+
+    assert lines == [
+        "⦿ chk-lone (unknown) [active]",
+        "    (root - no branches)",
+        "",
+        "⦿ chk-0 (2026-01-01) [active]",
+        "├── ◉ chk-x (unknown) [archived]",
+        "└── ○ chk-1 (2026-01-01) [active]",
+        "    └── ○ chk-2 (2026-01-01) [active]",
+    ]
+
+
+def branched_chain():
+    """chk-0 .. chk-7 in a chain, with chk-b branching off chk-2."""
+    checkpoints = make_chain(8)
+    checkpoints.append(tree.Checkpoint(id="chk-b", created=None, parent="chk-2", path=None))
+    return checkpoints
+
+
+def test_render_scoped_depth():
+    """--root and --depth render one subtree and count what is cut off."""
+    from chkcc.lineage import Lineage
+
+    lineage = Lineage(branched_chain())
+    options = tree.RenderOptions(max_depth=2, subtree_size=lineage.subtree_size)
+
+    lines = list(tree.iter_tree_lines(lineage.children, [lineage.get("chk-2")], options))
+
+    assert lines == [
+        "⦿ chk-2 (2026-01-01) [active]",
+        "├── ○ chk-b (unknown) [active]",
+        "└── ○ chk-3 (2026-01-01) [active]",
+        "    └── ○ chk-4 (2026-01-01) [active] (+3 below)",
+    ]
+    assert [cp.id for cp, _ in tree.walk_tree(lineage.children, [lineage.get("chk-2")], 1)] == [
+        "chk-2", "chk-b", "chk-3",
+    ]
+
+
+def test_render_collapses_linear_chains():
+    """Runs of single-child checkpoints fold into one line."""
+    lines = list(tree.iter_tree_lines(tree.build_tree(branched_chain()), options=tree.RenderOptions(collapse=3)))
+
+    assert lines == [
+        "⦿ chk-0 (2026-01-01) [active]",
+        "└── ○ chk-1 (2026-01-01) [active]",
+        "    └── ○ chk-2 (2026-01-01) [active]",
+        "        ├── ○ chk-b (unknown) [active]",
+        "        └── ○ chk-3 (2026-01-01) [active]",
+        "            └── ┄ chk-4 → chk-6 (3 checkpoints)",
+        "                └── ○ chk-7 (2026-01-01) [active]",
+    ]
+
+
+def test_show_tree_unknown_root(tmp_path):
+    """An unknown --root is an error."""
+    (tmp_path / "active").mkdir()
+    (tmp_path / "active" / "chk-a.md").write_text("---\ncheckpoint: chk-a\n---\n")
+
+    with pytest.raises(ValueError, match="chk-missing"):
+        tree.show_tree(tmp_path, root="chk-missing")
+
+
+def test_show_tree_warns_on_cycles(tmp_path, capsys):
+    """Checkpoints on a parent cycle are still shown, with a warning."""
+    (tmp_path / "active").mkdir()
+    for name, parent in [("chk-a", "chk-b"), ("chk-b", "chk-a")]:
+        (tmp_path / "active" / f"{name}.md").write_text(f"---\ncheckpoint: {name}\nparent: {parent}\n---\n")
+
+    tree.print_tree(tmp_path)
+
+    captured = capsys.readouterr()
+    assert "chk-a" in captured.out and "chk-b" in captured.out
+    assert "Warning: Parent cycle" in captured.err
@@ -0,0 +1,193 @@
+"""Tests for checkpoint frontmatter parsing and validation."""
+
+import pytest
+import yaml
+
+from chkcc import validate
+from chkcc.index import read_metadata
+
+HEADER = "---\ncheckpoint: chk-big\ncreated: 2026-01-03T10:00:00Z\nanchor: phase---2\n---\n"
+
+
+def test_extract_frontmatter_dashes_in_value():
+    """A `---` inside a YAML value does not end the frontmatter."""
+    frontmatter, body = validate.extract_frontmatter(HEADER + "\n## Problem\nX\n")
+
+    assert frontmatter["anchor"] == "phase---2"
+    assert body == "## Problem\nX"
+
+
+def test_extract_frontmatter_unclosed():
+    """Unclosed frontmatter is treated as missing."""
+    content = "---\ncheckpoint: chk-x\n\n## Problem\n"
+
+    assert validate.extract_frontmatter(content) == (None, content)
+
+
+def test_read_frontmatter_stops_at_fence(tmp_path):
+    """The header reader never touches the body."""
+    path = tmp_path / "chk-big.md"
+    # Undecodable bytes far past the header would fail a full read
+    path.write_bytes(HEADER.encode() + b"x" * 200_000 + b"\xff\xfe")
+
+    frontmatter = validate.read_frontmatter(path)
+
+    assert frontmatter["checkpoint"] == "chk-big"
+    assert frontmatter["anchor"] == "phase---2"
+
+
+def test_read_frontmatter_missing_or_unclosed(tmp_path):
+    """Files without a closed frontmatter block yield None."""
+    missing = tmp_path / "a.md"
+    missing.write_text("# Title\n")
+    unclosed = tmp_path / "b.md"
+    unclosed.write_text("---\ncheckpoint: chk-b\n")
+
+    assert validate.read_frontmatter(missing) is None
+    assert validate.read_frontmatter(unclosed) is None
+
+
+def test_read_metadata_reads_delta_artifacts(tmp_path):
+    """Summaries come from the head; artifacts include the delta tables."""
+    path = tmp_path / "chk-big.md"
+    body = (
+        "\n## Problem\nBig problem.\n\n## Essential Information\n\n"
+        "### Next Actions\n- First action\n\n## Delta: 2026-01-04T00:00:00Z\n\n"
+        "### What Changed\n- Later work\n\n### Artifacts\n"
+        "| File | Action | Description |\n|------|--------|-------------|\n"
+        "| `src/late.py` | created | Added in the delta |\n"
+    )
+    path.write_text(HEADER + body)
+
+    meta = read_metadata(path)
+
+    assert meta["id"] == "chk-big"
+    assert meta["problem"] == "Big problem."
+    assert meta["next_action"] == "First action"
+    assert meta["artifacts"] == ["src/late.py"]
+
+
+@pytest.mark.parametrize("text", [
+    "checkpoint: chk-a\ncreated: 2026-01-03T10:00:00Z\nstatus: current\n",
+    "checkpoint: chk-a\ncreated: 2026-01-03T10:00:00.5+02:00\nlast_delta: 2026-01-04 08:30:00\n",
+    "checkpoint: chk-a\nanchor: v1.7.0 release\nparent:\n# comment\n\nstatus: active\n",
+    "checkpoint: chk-a\nanchor: a:b#c\nparent: chk-root\n",
+])
+def test_flat_frontmatter_matches_yaml(text):
+    """The fast parser agrees with PyYAML on flat checkpoint headers."""
+    assert validate.parse_flat_frontmatter(text) == yaml.safe_load(text)
+
+
+@pytest.mark.parametrize("text", [
+    "checkpoint: 'chk-a'\n",
+    "checkpoint: chk-a\ncreated: 2026-01-03\n",
+    "checkpoint: chk-a\ncreated: 2026-01-03t10:00:00z\n",
+    "checkpoint: chk-a\ntags:\n  - a\n",
+    "checkpoint: chk-a\nstatus: yes\n",
+    "checkpoint: 123\n",
+    "on: chk-a\n",
+    "checkpoint: chk-a # trailing comment\n",
+    "checkpoint: {a: 1}\n",
+])
+def test_flat_frontmatter_defers_rich_yaml(text):
+    """Anything beyond flat plain scalars is left to PyYAML."""
+    assert validate.parse_flat_frontmatter(text) is None
+    assert validate.parse_frontmatter(text) == yaml.safe_load(text)
+
+
+VALID_BODY = (
+    "\n## Problem\nX\n\n## Essential Information\n\n"
+    "### Decisions\n- **A**: B\n\n### Current State\nOK\n\n### Next Actions\n- Next\n"
+)
+
+
+@pytest.fixture
+def checkpoints_tree(tmp_path):
+    """Create a checkpoints tree with one valid, one invalid and one unrelated file."""
+    (tmp_path / "active").mkdir()
+    (tmp_path / "archive").mkdir()
+    (tmp_path / "active" / "chk-good.md").write_text(HEADER + VALID_BODY)
+    (tmp_path / "archive" / "chk-bad.md").write_text(HEADER + "\n## Problem\nX\n")
+    (tmp_path / "LEARNINGS.md").write_text("# Learnings\n")
+    return tmp_path
+
+
+def test_validate_paths_directory(checkpoints_tree):
+    """Directories are searched recursively; unrelated markdown is skipped."""
+    reports = validate.validate_paths([str(checkpoints_tree)])
+
+    assert [(r.path.name, r.result.valid) for r in reports] == [
+        ("chk-good.md", True),
+        ("chk-bad.md", False),
+        # Both files use the id chk-big
+        (checkpoints_tree.name, False),
+    ]
+    assert reports[-1].file_type == "lineage"
+
+
+def test_validate_paths_glob_and_missing(checkpoints_tree):
+    """Globs expand, duplicates collapse, and missing files become error reports."""
+    reports = validate.validate_paths([
+        str(checkpoints_tree / "*" / "chk-*.md"),
+        str(checkpoints_tree / "active" / "chk-good.md"),
+        str(checkpoints_tree / "chk-missing.md"),
+    ])
+
+    assert [r.path.name for r in reports] == ["chk-good.md", "chk-bad.md", "chk-missing.md"]
+    assert reports[2].result is None
+    assert "File not found" in reports[2].error
+
+
+def test_validate_paths_with_processes(checkpoints_tree):
+    """A process pool yields the same reports as a serial run."""
+    assert validate.validate_paths([str(checkpoints_tree)], jobs=2) == validate.validate_paths(
+        [str(checkpoints_tree)]
+    )
+
+
+def test_print_summary(checkpoints_tree, capsys):
+    """The summary counts passes, failures and errors, lineage checks included."""
+    reports = validate.validate_paths([str(checkpoints_tree), str(checkpoints_tree / "nope.md")])
+
+    validate.print_summary(reports)
+
+    out = capsys.readouterr().out
+    assert "FAIL  " in out and "PASS  " in out and "ERROR " in out
+    assert "Validated 3 files and 1 lineage check: 1 passed, 2 failed, 1 errors" in out
+    assert out.index("[lineage]") < out.index("Validated")
+
+
+def test_archive_index_is_valid(tmp_path):
+    """archive/INDEX.md has its own title and may record an Outcome."""
+    (tmp_path / "archive").mkdir()
+    (tmp_path / "archive" / "INDEX.md").write_text(
+        "# Archived Checkpoints\n\n| Checkpoint | Description | Last Updated |\n"
+        "|------------|-------------|--------------|\n| chk-a | A | 2026-01-03 |\n\n---\n\n"
+        "## chk-a\n\n**Problem**: P\n\n**Scope**: S\n\n**Outcome**: Done\n"
+    )
+
+    reports = validate.validate_paths([str(tmp_path)])
+
+    assert [(r.file_type, r.result.valid) for r in reports] == [("INDEX", True), ("lineage", True)]
+
+
+def test_lineage_report(tmp_path, capsys):
+    """A checkpoints root gets a lineage report: cycles fail, dangling parents warn."""
+    active = tmp_path / "active"
+    active.mkdir()
+    for name, parent in [("chk-a", "chk-b"), ("chk-b", "chk-a"), ("chk-c", "chk-gone")]:
+        (active / f"{name}.md").write_text(
+            f"---\ncheckpoint: {name}\ncreated: 2026-01-03T10:00:00Z\nparent: {parent}\n---\n" + VALID_BODY
+        )
+
+    report = validate.lineage_report(tmp_path)
+    validate.print_summary([report])
+
+    assert not report.result.valid
+    assert report.result.errors == ["Parent cycle: chk-a -> chk-b -> chk-a (showing chk-a as a root)"]
+    assert report.result.structural_warnings == [
+        "Unknown parent 'chk-gone' of chk-c (active/chk-c.md), shown as a root"
+    ]
+    out = capsys.readouterr().out
+    assert f"FAIL  {tmp_path} [lineage]" in out
+    assert "    ~ Unknown parent 'chk-gone'" in out
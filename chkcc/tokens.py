@@ -0,0 +1,16 @@
+"""
+Token estimates for coihuin-compress.
+
+Checkpoints exist to fit a session into a context window, so several commands
+report sizes in tokens. Counting exactly would need a tokenizer dependency;
+a characters-per-token ratio is close enough for English prose and code, and
+costs nothing on the SessionStart hot path (this module imports nothing).
+"""
+
+# Typical ratio for English text and source code with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in text (rounded up)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
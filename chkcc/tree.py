@@ -10,8 +10,10 @@ use the chkcc command line tool.
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterator, TextIO
 
-from chkcc.validate import extract_frontmatter, parse_iso_datetime
+from chkcc.index import MetadataIndex
+from chkcc.validate import parse_iso_datetime
 
 
 @dataclass
@@ -24,6 +26,8 @@ class Checkpoint:
     path: Path
     status: str = "active"  # Frontmatter status: 'current' or 'active'
     is_archived: bool = False  # True if checkpoint is in archive/ directory
+    problem: str = ""  # First line of ## Problem (from metadata index)
+    next_action: str | None = None  # First open item of ### Next Actions
 
     @property
     def display_status(self) -> str:
@@ -38,17 +42,81 @@ class Checkpoint:
         return self.status
 
 
-def scan_checkpoints(base_dir: Path, status_filter: str = "all") -> list[Checkpoint]:
-    """Scan checkpoint directories and return list of Checkpoint objects.
+def checkpoint_from_metadata(meta: dict, file_path: Path, is_archived: bool) -> Checkpoint:
+    """Build a Checkpoint from an index metadata entry.
+
+    Args:
+        meta: Metadata dict from the index (see index.read_metadata)
+        file_path: Path to the checkpoint file
+        is_archived: True if the file is in the archive/ directory
+
+    Returns:
+        Checkpoint object
+    """
+    # Status from frontmatter, defaults to 'active' for backward compat
+    frontmatter_status = meta["status"]
+
+    # Validate status value per checkpoint-format.md spec
+    if frontmatter_status not in ("current", "active"):
+        import sys
+        print(f"Warning: Invalid status '{frontmatter_status}' in {file_path}, defaulting to 'active'",
+              file=sys.stderr)
+        frontmatter_status = "active"
+
+    return Checkpoint(
+        id=meta["id"],
+        created=parse_iso_datetime(meta["created"]),
+        parent=meta["parent"],
+        path=file_path,
+        status=frontmatter_status,
+        is_archived=is_archived,
+        problem=meta["problem"],
+        next_action=meta["next_action"],
+    )
+
+
+def load_checkpoint(base_dir: Path, file_path: Path) -> Checkpoint | None:
+    """Load a single checkpoint through the metadata index.
+
+    Args:
+        base_dir: Path to checkpoints directory
+        file_path: Path to a checkpoint file under base_dir/active or base_dir/archive
+
+    Returns:
+        Checkpoint object, or None if the file is missing or not a checkpoint
+    """
+    if not file_path.is_file():
+        return None
+
+    index = MetadataIndex.load(base_dir)
+    meta = index.get(file_path)
+    index.save()
+
+    if meta is None:
+        return None
+    return checkpoint_from_metadata(meta, file_path, file_path.parent.name == "archive")
+
+
+def iter_checkpoints(base_dir: Path, status_filter: str = "all", jobs: int = 1) -> Iterator[Checkpoint]:
+    """Yield checkpoints one at a time as their metadata is read.
+
+    Same ordering, filtering and warnings as scan_checkpoints, without holding
+    the whole result in memory; the index is saved once iteration finishes.
 
     Args:
         base_dir: Path to checkpoints directory (should contain active/ and archive/)
         status_filter: Filter by status - 'active', 'archive', or 'all'
+        jobs: Number of worker threads reading and parsing files (1 = serial).
+              Helps on high-latency filesystems; ordering is unaffected.
 
-    Returns:
-        List of Checkpoint objects found in the directory
+    Yields:
+        Checkpoint objects found in the directory
+
+    Raises:
+        ValueError: If jobs is less than 1
     """
-    checkpoints = []
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
 
     # Determine which directories to scan based on filter
     # Format: (subdir_name, is_archived)
@@ -59,44 +127,46 @@ def scan_checkpoints(base_dir: Path, status_filter: str = "all") -> list[Checkpo
     else:  # 'all'
         dirs_to_scan = [("active", False), ("archive", True)]
 
+    # Metadata is served from the on-disk index; only new or changed files are parsed
+    index = MetadataIndex.load(base_dir)
+
+    # Collect files first so the lookups can run concurrently
+    files: list[tuple[Path, bool]] = []
     for subdir, is_archived in dirs_to_scan:
         dir_path = base_dir / subdir
         if not dir_path.exists():
             continue
 
-        for file_path in dir_path.glob("chk-*.md"):
-            content = file_path.read_text()
-            # extract_frontmatter returns (dict | None, body_str)
-            frontmatter, _ = extract_frontmatter(content)
+        subdir_files = list(dir_path.glob("chk-*.md"))
+        files.extend((file_path, is_archived) for file_path in subdir_files)
+        index.prune(subdir, {index.key(file_path) for file_path in subdir_files})
+
+    current_checkpoints = []
+    pool = None
+    try:
+        if jobs > 1 and len(files) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            pool = ThreadPoolExecutor(max_workers=jobs)
+            # map() yields results in submission order, keeping output deterministic
+            metas = pool.map(index.get, [file_path for file_path, _ in files])
+        else:
+            metas = (index.get(file_path) for file_path, _ in files)
 
-            if frontmatter is None or "checkpoint" not in frontmatter:
+        for (file_path, is_archived), meta in zip(files, metas):
+            if meta is None:
                 continue
 
-            # Extract status from frontmatter, default to 'active' for backward compat
-            frontmatter_status = frontmatter.get("status", "active")
-
-            # Validate status value per checkpoint-format.md spec
-            if frontmatter_status not in ("current", "active"):
-                import sys
-                print(f"Warning: Invalid status '{frontmatter_status}' in {file_path}, defaulting to 'active'",
-                      file=sys.stderr)
-                frontmatter_status = "active"
-
-            checkpoint = Checkpoint(
-                id=frontmatter["checkpoint"],
-                created=parse_iso_datetime(frontmatter.get("created")),
-                parent=frontmatter.get("parent"),
-                path=file_path,
-                status=frontmatter_status,
-                is_archived=is_archived,
-            )
-            checkpoints.append(checkpoint)
+            checkpoint = checkpoint_from_metadata(meta, file_path, is_archived)
+            if not is_archived and checkpoint.status == "current":
+                current_checkpoints.append(checkpoint)
+            yield checkpoint
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        index.save()
 
     # Validate: Only one active checkpoint should have status 'current'
-    current_checkpoints = [
-        cp for cp in checkpoints
-        if not cp.is_archived and cp.status == "current"
-    ]
     if len(current_checkpoints) > 1:
         import sys
         print(
@@ -106,8 +176,25 @@ def scan_checkpoints(base_dir: Path, status_filter: str = "all") -> list[Checkpo
         )
         for cp in current_checkpoints:
             print(f"  - {cp.id} ({cp.path})", file=sys.stderr)
+        print("Run 'chkcc current --repair' to keep only one.", file=sys.stderr)
 
-    return checkpoints
+
+def scan_checkpoints(base_dir: Path, status_filter: str = "all", jobs: int = 1) -> list[Checkpoint]:
+    """Scan checkpoint directories and return list of Checkpoint objects.
+
+    Args:
+        base_dir: Path to checkpoints directory (should contain active/ and archive/)
+        status_filter: Filter by status - 'active', 'archive', or 'all'
+        jobs: Number of worker threads reading and parsing files (1 = serial).
+              Helps on high-latency filesystems; ordering is unaffected.
+
+    Returns:
+        List of Checkpoint objects found in the directory
+
+    Raises:
+        ValueError: If jobs is less than 1
+    """
+    return list(iter_checkpoints(base_dir, status_filter, jobs=jobs))
 
 
 def build_tree(checkpoints: list[Checkpoint]) -> dict[str | None, list[Checkpoint]]:
@@ -120,30 +207,17 @@ def build_tree(checkpoints: list[Checkpoint]) -> dict[str | None, list[Checkpoin
         Dictionary mapping parent_id to list of child Checkpoints.
         Key of None represents root nodes (no parent or parent not found).
     """
-    # Create lookup for validation
-    checkpoint_ids = {cp.id for cp in checkpoints}
-
-    tree: dict[str | None, list[Checkpoint]] = {}
-
-    for cp in checkpoints:
-        # If parent doesn't exist in our checkpoints, treat as root
-        parent = cp.parent if cp.parent in checkpoint_ids else None
+    # Imported here: lineage imports this module for Checkpoint
+    from chkcc.lineage import Lineage
 
-        if parent not in tree:
-            tree[parent] = []
-        tree[parent].append(cp)
-
-    # Sort children by created date (oldest first)
-    for children in tree.values():
-        children.sort(key=lambda c: c.created or datetime.min)
-
-    return tree
+    return Lineage(checkpoints).children
 
 
 def get_children(checkpoint_id: str, checkpoints: list[Checkpoint]) -> list[Checkpoint]:
     """Return all checkpoints that have this checkpoint_id as their parent.
 
-    Used by archive validation to check for active children before archiving.
+    Scans the whole list; to query many checkpoints, build a
+    chkcc.lineage.Lineage once and use children_of instead.
 
     Args:
         checkpoint_id: The checkpoint ID to find children for
@@ -158,6 +232,33 @@ def get_children(checkpoint_id: str, checkpoints: list[Checkpoint]) -> list[Chec
     return children
 
 
+def walk_tree(
+    tree: dict[str | None, list[Checkpoint]],
+    roots: list[Checkpoint] | None = None,
+    max_depth: int | None = None,
+) -> Iterator[tuple[Checkpoint, int]]:
+    """Yield (checkpoint, depth) pairs in rendering order (depth-first, pre-order).
+
+    Uses an explicit stack, so arbitrarily deep chains do not hit the
+    recursion limit. Roots have depth 0.
+
+    Args:
+        tree: Tree structure from build_tree()
+        roots: Checkpoints to start from (default: the tree's roots)
+        max_depth: Deepest level to yield (default: no limit)
+
+    Yields:
+        (Checkpoint, depth) pairs
+    """
+    roots = tree.get(None, []) if roots is None else roots
+    stack = [(root, 0) for root in reversed(roots)]
+    while stack:
+        node, depth = stack.pop()
+        yield node, depth
+        if max_depth is None or depth < max_depth:
+            stack.extend((child, depth + 1) for child in reversed(tree.get(node.id, [])))
+
+
 def format_date(dt: datetime | None) -> str:
     """Format datetime as YYYY-MM-DD or 'unknown'.
 
@@ -172,6 +273,175 @@ def format_date(dt: datetime | None) -> str:
     return dt.strftime("%Y-%m-%d")
 
 
+ROOT_SYMBOL = "\u29bf"
+ARCHIVED_SYMBOL = "\u25c9"
+ACTIVE_SYMBOL = "\u25cb"
+LAST_CONNECTOR = "\u2514\u2500\u2500 "
+MIDDLE_CONNECTOR = "\u251c\u2500\u2500 "
+LAST_INDENT = "    "
+MIDDLE_INDENT = "\u2502   "
+CHAIN_SYMBOL = "\u2504"
+
+
+def format_node(node: Checkpoint, prefix: str, is_last: bool) -> str:
+    """Format the tree line for a non-root node."""
+    connector = LAST_CONNECTOR if is_last else MIDDLE_CONNECTOR
+    display_status = node.display_status
+    symbol = ARCHIVED_SYMBOL if display_status == "archived" else ACTIVE_SYMBOL
+    date_str = format_date(node.created)
+    return f"{prefix}{connector}{symbol} {node.id} ({date_str}) [{display_status}]"
+
+
+@dataclass
+class RenderOptions:
+    """Limits for rendering part of a tree (the defaults render everything)."""
+
+    # Deepest level shown, counting the root as 0; deeper nodes are summarized
+    max_depth: int | None = None
+    # Linear chains of at least this many single-child nodes fold into one line
+    collapse: int | None = None
+    # Nodes in a checkpoint's subtree, itself included (for "+N below" counts)
+    subtree_size: Callable[[str], int] | None = None
+
+
+def format_hidden(tree: dict[str | None, list[Checkpoint]], node: Checkpoint, options: RenderOptions) -> str:
+    """Return the " (+N below)" suffix of a node whose children are past max_depth."""
+    if options.subtree_size is not None:
+        hidden = options.subtree_size(node.id) - 1
+    else:
+        hidden = len(tree.get(node.id, []))
+    return f" (+{hidden} below)"
+
+
+def child_items(
+    tree: dict[str | None, list[Checkpoint]],
+    node: Checkpoint,
+    prefix: str,
+    depth: int,
+    options: RenderOptions,
+) -> list[tuple[Checkpoint | list[Checkpoint], str, bool, int]]:
+    """Return the render stack items for a node's children, in render order.
+
+    A linear chain below the node is returned as one list item (the folded
+    nodes) followed by the node that ends the chain.
+    """
+    children = tree.get(node.id, [])
+    if options.collapse and len(children) == 1:
+        run = []
+        end, end_depth = children[0], depth + 1
+        while len(tree.get(end.id, [])) == 1 and (
+            options.max_depth is None or end_depth < options.max_depth
+        ):
+            run.append(end)
+            end, end_depth = tree[end.id][0], end_depth + 1
+        if len(run) >= options.collapse:
+            return [(run, prefix, True, depth + 1), (end, prefix + LAST_INDENT, True, end_depth)]
+
+    items = [(child, prefix, False, depth + 1) for child in children]
+    if items:
+        items[-1] = (children[-1], prefix, True, depth + 1)
+    return items
+
+
+def iter_subtree(
+    tree: dict[str | None, list[Checkpoint]],
+    node: Checkpoint,
+    prefix: str = "",
+    is_last: bool = True,
+    depth: int = 1,
+    options: RenderOptions | None = None,
+) -> Iterator[str]:
+    """Yield the lines of a subtree, depth-first, using an explicit stack.
+
+    Lines are produced one at a time, so memory stays proportional to the
+    depth of the tree rather than its size, and deep chains never hit the
+    recursion limit.
+
+    Args:
+        tree: Tree structure from build_tree()
+        node: Checkpoint node to start from
+        prefix: Line prefix for indentation of node
+        is_last: Whether node is the last of its siblings
+        depth: Depth of node below its root
+        options: Depth limit and chain folding (default: render everything)
+
+    Yields:
+        Formatted lines representing the subtree
+    """
+    options = options or RenderOptions()
+    stack: list[tuple[Checkpoint | list[Checkpoint], str, bool, int]] = [(node, prefix, is_last, depth)]
+    while stack:
+        item, prefix, is_last, depth = stack.pop()
+        if isinstance(item, list):
+            connector = LAST_CONNECTOR if is_last else MIDDLE_CONNECTOR
+            yield f"{prefix}{connector}{CHAIN_SYMBOL} {item[0].id} \u2192 {item[-1].id} ({len(item)} checkpoints)"
+            continue
+
+        line = format_node(item, prefix, is_last)
+        if tree.get(item.id) and options.max_depth is not None and depth >= options.max_depth:
+            yield line + format_hidden(tree, item, options)
+            continue
+        yield line
+
+        child_prefix = prefix + (LAST_INDENT if is_last else MIDDLE_INDENT)
+        # Push in reverse so the oldest child is rendered first
+        stack.extend(reversed(child_items(tree, item, child_prefix, depth, options)))
+
+
+def iter_tree_lines(
+    tree: dict[str | None, list[Checkpoint]],
+    roots: list[Checkpoint] | None = None,
+    options: RenderOptions | None = None,
+) -> Iterator[str]:
+    """Yield the ASCII art lines of the whole tree, root by root.
+
+    Args:
+        tree: Tree structure from build_tree()
+        roots: Checkpoints to render as roots (default: the tree's roots)
+        options: Depth limit and chain folding (default: render everything)
+
+    Yields:
+        Formatted lines representing the tree
+    """
+    options = options or RenderOptions()
+    roots = tree.get(None, []) if roots is None else roots
+    for i, root in enumerate(roots):
+        date_str = format_date(root.created)
+        line = f"{ROOT_SYMBOL} {root.id} ({date_str}) [{root.display_status}]"
+
+        if not tree.get(root.id):
+            yield line
+            yield "    (root - no branches)"
+        elif options.max_depth == 0:
+            yield line + format_hidden(tree, root, options)
+        else:
+            yield line
+            for item, prefix, is_last, depth in child_items(tree, root, "", 0, options):
+                yield from iter_subtree(tree, item, prefix, is_last, depth, options)
+
+        # Add blank line between root trees (except after last)
+        if i < len(roots) - 1:
+            yield ""
+
+
+def write_tree(
+    tree: dict[str | None, list[Checkpoint]],
+    stream: TextIO,
+    roots: list[Checkpoint] | None = None,
+    options: RenderOptions | None = None,
+) -> None:
+    """Write the rendered tree to a stream, one line at a time.
+
+    Args:
+        tree: Tree structure from build_tree()
+        stream: Text stream to write to
+        roots: Checkpoints to render as roots (default: the tree's roots)
+        options: Depth limit and chain folding (default: render everything)
+    """
+    for line in iter_tree_lines(tree, roots, options):
+        stream.write(line + "\n")
+
+
 def render_tree(
     tree: dict[str | None, list[Checkpoint]],
     checkpoints_by_id: dict[str, Checkpoint],
@@ -191,33 +461,9 @@ def render_tree(
     Returns:
         List of formatted lines representing the tree
     """
-    lines = []
-
     if node_id is None:
-        # Render all root nodes
-        roots = tree.get(None, [])
-        for i, root in enumerate(roots):
-            is_last_root = i == len(roots) - 1
-
-            # Root symbol and info
-            root_symbol = "\u29bf"  # Root marker
-            date_str = format_date(root.created)
-            lines.append(f"{root_symbol} {root.id} ({date_str}) [{root.display_status}]")
-
-            # Render children
-            children = tree.get(root.id, [])
-            if children:
-                for j, child in enumerate(children):
-                    is_last_child = j == len(children) - 1
-                    lines.extend(render_subtree(tree, child, "", is_last_child))
-            else:
-                lines.append("    (root - no branches)")
-
-            # Add blank line between root trees (except after last)
-            if not is_last_root:
-                lines.append("")
-
-    return lines
+        return list(iter_tree_lines(tree))
+    return list(iter_subtree(tree, checkpoints_by_id[node_id], prefix, is_last))
 
 
 def render_subtree(
@@ -237,37 +483,88 @@ def render_subtree(
     Returns:
         List of formatted lines representing the subtree
     """
-    lines = []
+    return list(iter_subtree(tree, node, prefix, is_last))
 
-    # Choose connector
-    connector = "\u2514\u2500\u2500 " if is_last else "\u251c\u2500\u2500 "
 
-    # Choose symbol based on display status
-    display_status = node.display_status
-    symbol = "\u25c9" if display_status == "archived" else "\u25cb"
+def require_directory(base_dir: Path) -> None:
+    """Check that base_dir exists and is a directory.
 
-    # Format line
-    date_str = format_date(node.created)
-    lines.append(f"{prefix}{connector}{symbol} {node.id} ({date_str}) [{display_status}]")
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+        NotADirectoryError: If path is not a directory
+    """
+    if not base_dir.exists():
+        raise FileNotFoundError(f"Directory not found: {base_dir}")
 
-    # Prepare prefix for children
-    child_prefix = prefix + ("    " if is_last else "\u2502   ")
+    if not base_dir.is_dir():
+        raise NotADirectoryError(f"Not a directory: {base_dir}")
+
+
+def select_tree(
+    base_dir: Path,
+    status_filter: str = "all",
+    jobs: int = 1,
+    root: str | None = None,
+    max_depth: int | None = None,
+    collapse: int | None = None,
+) -> tuple[dict[str | None, list[Checkpoint]], list[Checkpoint], RenderOptions] | None:
+    """Scan a directory and select what a (possibly scoped) tree shows.
+
+    Args:
+        base_dir: Path to checkpoints directory (should contain active/ and archive/)
+        status_filter: Filter by status - 'active', 'archive', or 'all'
+        jobs: Number of worker threads for scanning (see scan_checkpoints)
+        root: Render only the subtree under this checkpoint id
+        max_depth: Deepest level shown below each root
+        collapse: Fold linear chains of at least this many checkpoints
+
+    Returns:
+        (tree, roots to render, render options), or None if the directory
+        has no matching checkpoints
+
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+        NotADirectoryError: If path is not a directory
+        ValueError: If root is not among the scanned checkpoints
+    """
+    from chkcc.lineage import Lineage, print_lineage_problems
+
+    require_directory(base_dir)
+    checkpoints = scan_checkpoints(base_dir, status_filter, jobs=jobs)
+    if not checkpoints:
+        return None
+
+    lineage = Lineage(checkpoints)
+    print_lineage_problems(lineage.problems, status_filter)
+    roots = [lineage.get(root)] if root is not None else lineage.children.get(None, [])
+    options = RenderOptions(max_depth=max_depth, collapse=collapse, subtree_size=lineage.subtree_size)
+    return lineage.children, roots, options
 
-    # Render children
-    children = tree.get(node.id, [])
-    for i, child in enumerate(children):
-        is_last_child = i == len(children) - 1
-        lines.extend(render_subtree(tree, child, child_prefix, is_last_child))
 
-    return lines
+def no_checkpoints_message(status_filter: str) -> str:
+    """Return the line shown when a scan finds nothing."""
+    if status_filter == "all":
+        return "No checkpoints found."
+    return f"No {status_filter} checkpoints found."
 
 
-def show_tree(base_dir: Path, status_filter: str = "all") -> list[str]:
+def show_tree(
+    base_dir: Path,
+    status_filter: str = "all",
+    jobs: int = 1,
+    root: str | None = None,
+    max_depth: int | None = None,
+    collapse: int | None = None,
+) -> list[str]:
     """Show checkpoint tree for a directory.
 
     Args:
         base_dir: Path to checkpoints directory (should contain active/ and archive/)
         status_filter: Filter by status - 'active', 'archive', or 'all'
+        jobs: Number of worker threads for scanning (see scan_checkpoints)
+        root: Render only the subtree under this checkpoint id
+        max_depth: Deepest level shown below each root
+        collapse: Fold linear chains of at least this many checkpoints
 
     Returns:
         List of lines representing the tree
@@ -275,26 +572,50 @@ def show_tree(base_dir: Path, status_filter: str = "all") -> list[str]:
     Raises:
         FileNotFoundError: If directory doesn't exist
         NotADirectoryError: If path is not a directory
+        ValueError: If root is not among the scanned checkpoints
     """
-    if not base_dir.exists():
-        raise FileNotFoundError(f"Directory not found: {base_dir}")
+    selected = select_tree(base_dir, status_filter, jobs, root, max_depth, collapse)
+    if selected is None:
+        return [no_checkpoints_message(status_filter)]
 
-    if not base_dir.is_dir():
-        raise NotADirectoryError(f"Not a directory: {base_dir}")
+    tree, roots, options = selected
+    return list(iter_tree_lines(tree, roots, options))
 
-    # Scan checkpoints
-    checkpoints = scan_checkpoints(base_dir, status_filter)
 
-    if not checkpoints:
-        if status_filter == "all":
-            return ["No checkpoints found."]
-        return [f"No {status_filter} checkpoints found."]
+def print_tree(
+    base_dir: Path,
+    status_filter: str = "all",
+    jobs: int = 1,
+    stream: TextIO | None = None,
+    root: str | None = None,
+    max_depth: int | None = None,
+    collapse: int | None = None,
+) -> None:
+    """Write the checkpoint tree for a directory straight to a stream.
 
-    # Build lookup
-    checkpoints_by_id = {cp.id: cp for cp in checkpoints}
+    Same output as show_tree, without building the list of lines.
+
+    Args:
+        base_dir: Path to checkpoints directory (should contain active/ and archive/)
+        status_filter: Filter by status - 'active', 'archive', or 'all'
+        jobs: Number of worker threads for scanning (see scan_checkpoints)
+        stream: Output stream (default: sys.stdout)
+        root: Render only the subtree under this checkpoint id
+        max_depth: Deepest level shown below each root
+        collapse: Fold linear chains of at least this many checkpoints
+
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+        NotADirectoryError: If path is not a directory
+        ValueError: If root is not among the scanned checkpoints
+    """
+    import sys
 
-    # Build and render tree
-    tree = build_tree(checkpoints)
-    lines = render_tree(tree, checkpoints_by_id)
+    stream = stream or sys.stdout
+    selected = select_tree(base_dir, status_filter, jobs, root, max_depth, collapse)
+    if selected is None:
+        stream.write(no_checkpoints_message(status_filter) + "\n")
+        return
 
-    return lines
+    tree, roots, options = selected
+    write_tree(tree, stream, roots, options)
@@ -5,6 +5,8 @@ from importlib import resources
 from importlib.resources import abc as resources_abc
 from pathlib import Path
 
+from chkcc.atomic import write_atomic
+
 
 def compute_checksum(content: bytes) -> str:
     """Compute SHA256 checksum of content."""
@@ -138,7 +140,7 @@ def cmd_update(skill_dir: Path, force: bool = False, dry_run: bool = False) -> i
         for rel_path, content in files_to_update:
             target_path = skill_dir / rel_path
             target_path.parent.mkdir(parents=True, exist_ok=True)
-            target_path.write_bytes(content)
+            write_atomic(target_path, content)
 
     # Print summary
     action_verb = "Would update" if dry_run else "Updated"
@@ -8,9 +8,10 @@ including structural validation and advisory heuristics.
 import re
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import NamedTuple
+from typing import Iterator, NamedTuple, TextIO
 
-import yaml
+from chkcc.document import Document, is_list_item, parse_document
+from chkcc.index_md import TABLE_HEADER, IndexFile
 
 
 class ValidationResult(NamedTuple):
@@ -43,92 +44,206 @@ CHECKPOINT_RECOMMENDED_SUBSECTIONS = [
 CHECKPOINT_FRONTMATTER_REQUIRED = ["checkpoint", "created"]
 CHECKPOINT_FRONTMATTER_OPTIONAL = ["anchor", "last_delta", "parent"]
 
+# INDEX.md title: active/ and archive/ each have one
+INDEX_TITLE = re.compile(r"^# (Active|Archived) Checkpoints\s*$", re.MULTILINE)
+
+
+# Opening and closing frontmatter fence: a line consisting of "---" only
+FRONTMATTER_FENCE = re.compile(r"^---[ \t]*\r?$", re.MULTILINE)
+
+
+# Restricted grammar for flat `key: value` frontmatter (see parse_flat_frontmatter)
+FLAT_FRONTMATTER_LINE = re.compile(r"^([A-Za-z_][A-Za-z0-9_-]*):(?:[ \t]+(.*?))?[ \t]*$")
+FLAT_FRONTMATTER_TIMESTAMP = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?"
+    r"(?:(Z)|([-+])(\d{2}):(\d{2}))?$"
+)
+# First characters that are YAML indicators or may start a number
+FLAT_FRONTMATTER_UNSAFE_START = set("-?:,[]{}#&*!|>'\"%@`~<=.+0123456789")
+# Plain scalars (values or keys) YAML 1.1 resolves to booleans or null
+FLAT_FRONTMATTER_RESERVED = {"yes", "no", "y", "n", "true", "false", "on", "off", "null"}
+
+
+def _flat_timestamp(match: re.Match) -> datetime:
+    """Build a datetime from a FLAT_FRONTMATTER_TIMESTAMP match, as PyYAML would."""
+    year, month, day, hour, minute, second, fraction, utc, sign, tz_hour, tz_minute = match.groups()
+
+    tzinfo = None
+    if utc:
+        tzinfo = timezone.utc
+    elif sign:
+        delta = timedelta(hours=int(tz_hour), minutes=int(tz_minute))
+        tzinfo = timezone(-delta if sign == "-" else delta)
+
+    return datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second),
+        int((fraction or "0").ljust(6, "0")), tzinfo=tzinfo,
+    )
+
+
+def parse_flat_frontmatter(text: str) -> dict | None:
+    """Parse flat `key: value` frontmatter without PyYAML.
+
+    Handles the checkpoint schema (checkpoint, created, anchor, last_delta,
+    parent, status): one key per line with a plain string, empty or ISO 8601
+    timestamp value, plus blank and comment lines. Results match
+    `yaml.safe_load` for everything accepted.
+
+    Returns:
+        Parsed frontmatter, or None if the text uses anything richer (quotes,
+        nesting, lists, numbers, booleans, ...) and needs the YAML parser.
+    """
+    result: dict = {}
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        match = FLAT_FRONTMATTER_LINE.match(line)
+        if match is None:
+            return None
+
+        key, value = match.groups()
+        if key.lower() in FLAT_FRONTMATTER_RESERVED:
+            return None
+        if not value:
+            result[key] = None
+            continue
+
+        timestamp = FLAT_FRONTMATTER_TIMESTAMP.match(value)
+        if timestamp is not None:
+            try:
+                result[key] = _flat_timestamp(timestamp)
+            except ValueError:
+                return None
+            continue
+
+        if (
+            value[0] in FLAT_FRONTMATTER_UNSAFE_START
+            or value.lower() in FLAT_FRONTMATTER_RESERVED
+            or ": " in value
+            or " #" in value
+            or "\t" in value
+            or value.endswith(":")
+        ):
+            return None
+
+        result[key] = value
+
+    return result or None
+
+
+def parse_frontmatter(text: str) -> dict | None:
+    """Parse frontmatter text (without fences).
+
+    Flat checkpoint headers go through parse_flat_frontmatter; PyYAML is only
+    used when the header needs the full YAML grammar.
+
+    Returns:
+        Parsed frontmatter, or None if empty or not valid YAML
+    """
+    frontmatter = parse_flat_frontmatter(text)
+    if frontmatter is not None:
+        return frontmatter
+
+    # Deferred: PyYAML is the most expensive import and only needed for
+    # headers the flat parser does not handle
+    import yaml
+
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError:
+        return None
+
 
 def extract_frontmatter(content: str) -> tuple[dict | None, str]:
-    """Extract YAML frontmatter from markdown content."""
-    if not content.startswith("---"):
+    """Extract YAML frontmatter from markdown content.
+
+    The frontmatter ends at the first line consisting of `---` only, so `---`
+    inside a YAML value does not end it early.
+    """
+    opening = FRONTMATTER_FENCE.match(content)
+    if opening is None:
         return None, content
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    closing = FRONTMATTER_FENCE.search(content, opening.end())
+    if closing is None:
         return None, content
 
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        body = parts[2].strip()
-        return frontmatter, body
-    except yaml.YAMLError:
+    frontmatter = parse_frontmatter(content[opening.end():closing.start()])
+    if frontmatter is None:
         return None, content
 
+    return frontmatter, content[closing.end():].strip()
 
-def extract_sections(content: str) -> dict[str, list[str]]:
-    """Extract markdown sections (## headers) and subsections (### headers)."""
-    sections: dict[str, list[str]] = {}
-    current_section = None
 
-    for line in content.split("\n"):
-        if line.startswith("## "):
-            current_section = line[3:].strip()
-            sections[current_section] = []
-        elif line.startswith("### ") and current_section:
-            subsection = line[4:].strip()
-            sections[current_section].append(subsection)
+def read_frontmatter_text(f: TextIO) -> str | None:
+    """Read raw frontmatter text from an open file, stopping at the closing fence.
+
+    Consumes lines up to and including the closing `---` line and leaves the
+    file positioned at the start of the body.
+
+    Args:
+        f: Text file object positioned at the start of the file
+
+    Returns:
+        Frontmatter text without fences, or None if the file does not start
+        with a fence or the frontmatter is never closed.
+    """
+    if not FRONTMATTER_FENCE.match(f.readline()):
+        return None
+
+    lines = []
+    for line in f:
+        if FRONTMATTER_FENCE.match(line):
+            return "".join(lines)
+        lines.append(line)
+
+    return None
+
 
-    return sections
+def read_frontmatter(path: Path) -> dict | None:
+    """Read and parse only the frontmatter of a file.
+
+    Streams the file line by line and stops at the closing `---` line, so the
+    body of large checkpoints is never read. Use this for metadata-only
+    lookups; validation needs the full content.
+
+    Args:
+        path: Path to a markdown file
+
+    Returns:
+        Parsed frontmatter, or None if missing, unclosed or invalid YAML
+    """
+    with path.open(encoding="utf-8") as f:
+        text = read_frontmatter_text(f)
+
+    if text is None:
+        return None
+    return parse_frontmatter(text)
+
+
+def extract_sections(content: str) -> dict[str, list[str]]:
+    """Extract markdown sections (## headers) and subsections (### headers)."""
+    return parse_document(content).outline()
 
 
 def extract_section_content(body: str, section_name: str) -> str:
     """Extract the content of a ## section until the next ## or end of file."""
-    lines = body.split("\n")
-    in_section = False
-    content_lines = []
-
-    for line in lines:
-        if line.startswith("## "):
-            if in_section:
-                break  # Found next section, stop
-            if section_name.lower() in line.lower():
-                in_section = True
-                continue
-        elif in_section:
-            content_lines.append(line)
-
-    return "\n".join(content_lines).strip()
+    document = parse_document(body)
+    return document.text(document.find_section(section_name))
 
 
 def extract_subsection_content(body: str, section_name: str, subsection_name: str) -> str:
     """Extract the content of a ### subsection within a ## section."""
-    section_content = extract_section_content(body, section_name)
-    if not section_content:
-        return ""
-
-    lines = section_content.split("\n")
-    in_subsection = False
-    content_lines = []
-
-    for line in lines:
-        if line.startswith("### "):
-            if in_subsection:
-                break  # Found next subsection, stop
-            if subsection_name.lower() in line.lower():
-                in_subsection = True
-                continue
-        elif in_subsection:
-            content_lines.append(line)
-
-    return "\n".join(content_lines).strip()
+    document = parse_document(body)
+    return document.text(document.find_subsection(section_name, subsection_name))
 
 
 def count_list_items(text: str) -> int:
     """Count list items (lines starting with - or numbered lists)."""
-    count = 0
-    for line in text.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("- ") or stripped.startswith("* "):
-            count += 1
-        elif re.match(r"^\d+\.\s", stripped):
-            count += 1
-    return count
+    return sum(1 for line in text.split("\n") if is_list_item(line))
 
 
 def parse_iso_datetime(date_str: str) -> datetime | None:
@@ -147,41 +262,41 @@ def parse_iso_datetime(date_str: str) -> datetime | None:
     return None
 
 
-def check_advisory_heuristics(frontmatter: dict | None, body: str) -> list[str]:
+def check_advisory_heuristics(frontmatter: dict | None, document: Document) -> list[str]:
     """Check advisory heuristics and return warnings."""
     warnings = []
     now = datetime.now(timezone.utc)
 
     # 1. Problem length < 20 words
-    problem_text = extract_section_content(body, "Problem")
+    problem_text = document.text(document.find_section("Problem"))
     word_count = len(problem_text.split())
     if word_count < 20:
         warnings.append(f"Problem section is brief ({word_count} words, recommend >= 20)")
 
     # 2. Decisions count < 2
-    decisions_text = extract_subsection_content(body, "Essential Information", "Decisions")
-    decisions_count = count_list_items(decisions_text)
+    decisions = document.find_subsection("Essential Information", "Decisions")
+    decisions_count = decisions.list_items if decisions else 0
     if decisions_count < 2:
         warnings.append(f"Few decisions recorded ({decisions_count}, recommend >= 2)")
 
     # 3. Play-By-Play < 2 entries
-    playbyplay_text = extract_subsection_content(body, "Essential Information", "Play-By-Play")
-    playbyplay_count = count_list_items(playbyplay_text)
+    playbyplay = document.find_subsection("Essential Information", "Play-By-Play")
+    playbyplay_count = playbyplay.list_items if playbyplay else 0
     if playbyplay_count < 2:
         warnings.append(f"Play-By-Play has few entries ({playbyplay_count}, recommend >= 2)")
 
     # 4. Artifact Trail empty
-    artifact_text = extract_subsection_content(body, "Essential Information", "Artifact Trail")
+    artifact_text = document.text(document.find_subsection("Essential Information", "Artifact Trail"))
     if not artifact_text.strip():
         warnings.append("Artifact Trail is empty")
 
     # 5. Next Actions empty
-    next_actions_text = extract_subsection_content(body, "Essential Information", "Next Actions")
+    next_actions_text = document.text(document.find_subsection("Essential Information", "Next Actions"))
     if not next_actions_text.strip():
         warnings.append("Next Actions is empty")
 
     # 6. Current State < 30 words
-    current_state_text = extract_subsection_content(body, "Essential Information", "Current State")
+    current_state_text = document.text(document.find_subsection("Essential Information", "Current State"))
     state_word_count = len(current_state_text.split())
     if state_word_count < 30:
         warnings.append(f"Current State is brief ({state_word_count} words, recommend >= 30)")
@@ -223,8 +338,9 @@ def validate_checkpoint(content: str) -> ValidationResult:
             if field not in frontmatter:
                 structural_warnings.append(f"Missing optional frontmatter field: {field}")
 
-    # Extract sections
-    sections = extract_sections(body if frontmatter else content)
+    # Parse the body once; every check below reads the same section tree
+    document = parse_document(body if frontmatter else content)
+    sections = document.outline()
 
     # Check required sections
     for section in CHECKPOINT_REQUIRED_SECTIONS:
@@ -246,7 +362,7 @@ def validate_checkpoint(content: str) -> ValidationResult:
     # Run advisory heuristics (only if structural validation passes)
     advisory_warnings = []
     if len(errors) == 0:
-        advisory_warnings = check_advisory_heuristics(frontmatter, body if frontmatter else content)
+        advisory_warnings = check_advisory_heuristics(frontmatter, document)
 
     return ValidationResult(
         valid=len(errors) == 0,
@@ -278,7 +394,7 @@ def is_index(file_path: Path, content: str) -> bool:
         return True
 
     # Check for INDEX-specific structure
-    if "# Active Checkpoints" in content:
+    if INDEX_TITLE.search(content):
         # Also verify it has the table headers
         if "| Checkpoint | Description | Last Updated |" in content:
             return True
@@ -286,80 +402,6 @@ def is_index(file_path: Path, content: str) -> bool:
     return False
 
 
-def extract_table_rows(content: str) -> list[dict[str, str]]:
-    """Extract rows from the quick reference table."""
-    rows = []
-    lines = content.split("\n")
-    in_table = False
-    header_found = False
-
-    for line in lines:
-        stripped = line.strip()
-        # Detect table start
-        if "| Checkpoint | Description | Last Updated |" in stripped:
-            in_table = True
-            header_found = True
-            continue
-        # Skip separator row
-        if in_table and stripped.startswith("|") and "---" in stripped:
-            continue
-        # Parse data rows
-        if in_table and stripped.startswith("|") and stripped.endswith("|"):
-            parts = [p.strip() for p in stripped.split("|")]
-            # parts[0] and parts[-1] are empty due to leading/trailing |
-            if len(parts) >= 4:
-                checkpoint = parts[1]
-                description = parts[2]
-                last_updated = parts[3]
-                if checkpoint and checkpoint != "Checkpoint":  # Skip header if matched again
-                    rows.append({
-                        "checkpoint": checkpoint,
-                        "description": description,
-                        "last_updated": last_updated,
-                    })
-        # End of table (non-table line after table started)
-        elif in_table and header_found and stripped and not stripped.startswith("|"):
-            break
-
-    return rows
-
-
-def extract_summary_sections(content: str) -> dict[str, dict[str, str]]:
-    """Extract summary sections (## checkpoint-name) with their fields."""
-    summaries = {}
-    lines = content.split("\n")
-    current_section = None
-    current_fields = {}
-
-    for line in lines:
-        # Detect section header (## chk-xxx style)
-        if line.startswith("## "):
-            # Save previous section if exists
-            if current_section:
-                summaries[current_section] = current_fields
-            section_name = line[3:].strip()
-            # Only track sections that look like checkpoint names (usually start with chk-)
-            if section_name.startswith("chk-") or section_name.lower().startswith("checkpoint"):
-                current_section = section_name
-                current_fields = {}
-            else:
-                current_section = None
-        # Parse fields within a summary section
-        elif current_section:
-            if line.startswith("**Problem**:"):
-                current_fields["Problem"] = line.replace("**Problem**:", "").strip()
-            elif line.startswith("**Scope**:"):
-                current_fields["Scope"] = line.replace("**Scope**:", "").strip()
-            elif line.startswith("**Status**:"):
-                current_fields["Status"] = line.replace("**Status**:", "").strip()
-
-    # Don't forget the last section
-    if current_section:
-        summaries[current_section] = current_fields
-
-    return summaries
-
-
 def validate_iso_date(date_str: str) -> bool:
     """Validate ISO-8601 date format (YYYY-MM-DD)."""
     if not date_str:
@@ -377,29 +419,34 @@ def validate_index(content: str) -> ValidationResult:
     structural_warnings = []
     advisory_warnings = []
 
-    # Check for title
-    if "# Active Checkpoints" not in content:
-        errors.append("Missing title: # Active Checkpoints")
+    # Check for title (archive/INDEX.md lists archived checkpoints)
+    title = INDEX_TITLE.search(content)
+    if title is None:
+        errors.append("Missing title: # Active Checkpoints (or # Archived Checkpoints)")
+
+    # Parse table rows and summary sections once
+    index = IndexFile(content)
 
     # Check for quick reference table headers
-    expected_headers = "| Checkpoint | Description | Last Updated |"
-    if expected_headers not in content:
-        errors.append(f"Missing or incorrect table headers. Expected: {expected_headers}")
+    if not index.has_table:
+        errors.append(f"Missing or incorrect table headers. Expected: {TABLE_HEADER}")
 
-    # Extract table rows and summary sections
-    table_rows = extract_table_rows(content)
-    summary_sections = extract_summary_sections(content)
+    table_rows = index.table_rows()
+    summary_sections = index.summary_sections()
 
     # Check if table is empty (not an error, just a note)
     if not table_rows:
         # Check for empty state message
-        if "*No active checkpoints" not in content:
+        if not index.has_empty_state():
             structural_warnings.append("Table is empty but missing empty state message")
 
+    for name in index.duplicate_rows:
+        structural_warnings.append(f"Duplicate table entry '{name}'")
+
     # Validate each table entry
     for row in table_rows:
-        checkpoint_name = row["checkpoint"]
-        last_updated = row["last_updated"]
+        checkpoint_name = row.checkpoint
+        last_updated = row.last_updated
 
         # Check for matching summary section
         if checkpoint_name not in summary_sections:
@@ -409,14 +456,18 @@ def validate_index(content: str) -> ValidationResult:
         if not validate_iso_date(last_updated):
             errors.append(f"Invalid date format for '{checkpoint_name}': '{last_updated}' (expected YYYY-MM-DD)")
 
-    # Validate each summary section has required fields
+    # Validate each summary section has required fields; archived entries
+    # may record an Outcome instead of a Status
+    archived = title is not None and title.group(1) == "Archived"
     for section_name, fields in summary_sections.items():
         for required_field in ["Problem", "Scope", "Status"]:
+            if archived and required_field == "Status" and fields.get("Outcome"):
+                continue
             if required_field not in fields or not fields[required_field]:
                 errors.append(f"Section '{section_name}' missing required field: **{required_field}**:")
 
     # Check for orphaned summary sections (sections without table entries)
-    table_checkpoints = {row["checkpoint"] for row in table_rows}
+    table_checkpoints = {row.checkpoint for row in table_rows}
     for section_name in summary_sections:
         if section_name not in table_checkpoints:
             structural_warnings.append(f"Summary section '{section_name}' has no matching table entry")
@@ -445,7 +496,9 @@ def validate_file(path: Path) -> ValidationResult:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    content = path.read_text()
+    from chkcc import cache
+
+    content = cache.read_text(path)
 
     # Detect file type and validate accordingly
     if is_index(path, content):
@@ -504,3 +557,205 @@ def print_result(result: ValidationResult, file_type: str, path: str) -> None:
     print("\n" + "-" * 60)
     print("Note: This tool checks format, not content quality.")
     print("A valid checkpoint may still be insufficient for work resumption.")
+
+
+class FileReport(NamedTuple):
+    """Outcome of validating one file in a bulk run."""
+
+    path: Path
+    file_type: str
+    result: ValidationResult | None
+    error: str | None = None
+
+
+GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def collect_files(targets: list[str]) -> list[tuple[Path, bool]]:
+    """Expand files, directories and glob patterns into files to validate.
+
+    Directories are searched recursively for `*.md` files. Glob patterns are
+    expanded with `**` support. A target that matches nothing is kept as-is so
+    validation reports it as missing. Duplicates are dropped, first one wins.
+
+    Args:
+        targets: Paths, directories or glob patterns from the command line
+
+    Returns:
+        (path, explicit) pairs; explicit is False for files found by
+        expanding a directory, which are skipped if they are not a
+        checkpoint or INDEX file
+    """
+    import glob
+
+    files: list[tuple[Path, bool]] = []
+    seen: set[Path] = set()
+
+    def add(path: Path, explicit: bool) -> None:
+        path = path.resolve()
+        if path not in seen:
+            seen.add(path)
+            files.append((path, explicit))
+
+    for target in targets:
+        path = Path(target).expanduser()
+        if path.is_dir():
+            for found in sorted(path.rglob("*.md")):
+                add(found, False)
+        elif not path.exists() and GLOB_CHARS.search(target):
+            matches = sorted(glob.glob(str(path), recursive=True))
+            for match in matches:
+                if Path(match).is_dir():
+                    for found in sorted(Path(match).rglob("*.md")):
+                        add(found, False)
+                else:
+                    add(Path(match), True)
+            if not matches:
+                add(path, True)
+        else:
+            add(path, True)
+
+    return files
+
+
+def validate_report(path: Path, explicit: bool = True) -> FileReport | None:
+    """Validate one file, capturing errors instead of raising.
+
+    Args:
+        path: Path to the file to validate
+        explicit: False for files found by directory expansion
+
+    Returns:
+        FileReport with either a result or an error message, or None if a
+        file found by directory expansion is not a checkpoint or INDEX file
+    """
+    file_type = "INDEX" if path.name == "INDEX.md" else "checkpoint"
+    try:
+        return FileReport(path, file_type, validate_file(path))
+    except (OSError, ValueError) as e:
+        # validate_file raises plain ValueError only for unrecognized files
+        if not explicit and type(e) is ValueError:
+            return None
+        return FileReport(path, file_type, None, str(e))
+
+
+def is_checkpoints_dir(path: Path) -> bool:
+    """Check if a directory is a checkpoints root (has active/ or archive/)."""
+    return (path / "active").is_dir() or (path / "archive").is_dir()
+
+
+def lineage_report(base_dir: Path) -> FileReport:
+    """Check the parent links across active/ and archive/ of a checkpoints root.
+
+    Duplicate ids and parent cycles are errors; parents that match no
+    checkpoint are structural warnings.
+    """
+    # Imported here: tree and lineage import this module
+    from chkcc.lineage import Lineage
+    from chkcc.tree import scan_checkpoints
+
+    problems = Lineage(scan_checkpoints(base_dir)).problems
+    errors = problems.errors()
+    return FileReport(base_dir, "lineage", ValidationResult(not errors, errors, problems.warnings(), []))
+
+
+def iter_reports(targets: list[str], jobs: int = 1) -> Iterator[FileReport]:
+    """Validate every file named by targets, yielding reports as they complete.
+
+    Args:
+        targets: Paths, directories or glob patterns (see collect_files)
+        jobs: Worker processes; 1 validates serially
+
+    Yields:
+        FileReports in collection order; files found by directory expansion
+        that are neither checkpoints nor INDEX files are left out. Each
+        checkpoints root among the targets is followed by a 'lineage' report
+        (see lineage_report).
+
+    Raises:
+        ValueError: If jobs is less than 1
+    """
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+
+    files = collect_files(targets)
+    paths = [path for path, _ in files]
+    explicit = [flag for _, flag in files]
+
+    if jobs > 1 and len(files) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for report in executor.map(validate_report, paths, explicit, chunksize=chunksize):
+                if report is not None:
+                    yield report
+    else:
+        for report in map(validate_report, paths, explicit):
+            if report is not None:
+                yield report
+
+    roots: dict[Path, None] = {}
+    for target in targets:
+        path = Path(target).expanduser()
+        if path.is_dir() and is_checkpoints_dir(path):
+            roots.setdefault(path.resolve())
+    for root in roots:
+        yield lineage_report(root)
+
+
+def validate_paths(targets: list[str], jobs: int = 1) -> list[FileReport]:
+    """Validate every file named by targets in one process.
+
+    Args:
+        targets: Paths, directories or glob patterns (see collect_files)
+        jobs: Worker processes; 1 validates serially
+
+    Returns:
+        FileReports in collection order (see iter_reports)
+
+    Raises:
+        ValueError: If jobs is less than 1
+    """
+    return list(iter_reports(targets, jobs=jobs))
+
+
+def print_summary(reports: list[FileReport]) -> None:
+    """Print one line per report and an aggregate summary.
+
+    Failing files list their errors; warnings are only counted. Lineage
+    reports also list their warnings, and count toward the totals.
+
+    Args:
+        reports: Reports from validate_paths
+    """
+    passed = failed = errors = checks = 0
+    for report in reports:
+        if report.result is None:
+            errors += 1
+            print(f"ERROR {report.path}: {report.error.splitlines()[0]}")
+            continue
+
+        result = report.result
+        lineage = report.file_type == "lineage"
+        checks += lineage
+        warnings = len(result.structural_warnings) + len(result.advisory_warnings)
+        note = " [lineage]" if lineage else f" ({warnings} warnings)" if warnings else ""
+        if result.valid:
+            passed += 1
+            print(f"PASS  {report.path}{note}")
+        else:
+            failed += 1
+            print(f"FAIL  {report.path}{note}")
+        if lineage or not result.valid:
+            for error in result.errors:
+                print(f"    - {error}")
+        if lineage:
+            for warning in result.structural_warnings:
+                print(f"    ~ {warning}")
+
+    checked = f"{len(reports) - checks} files"
+    if checks:
+        checked += f" and {checks} lineage check{'s' if checks > 1 else ''}"
+    print("\n" + "-" * 60)
+    print(f"Validated {checked}: {passed} passed, {failed} failed, {errors} errors")